@@ -0,0 +1,90 @@
+"""Measure the bytes on the wire and the latency of compressed MRP responses.
+
+The production orders payload of ``bench_serialization`` is served by an app with
+``CompressionMiddleware`` and requested in-process through httpx, with no
+compression, gzip at several levels and brotli (when ``brotli`` is installed).
+Run it from the ``viixoo_backend_apps`` directory::
+
+    python mrp/benchmarks/bench_compression.py --orders 10 100 1000
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import Response
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_serialization import make_payload  # noqa: E402
+from viixoo_core import middleware  # noqa: E402
+from viixoo_core.middleware import CompressionMiddleware  # noqa: E402
+
+
+def make_app(body: bytes, **options) -> FastAPI:
+    """Return an app serving ``body`` as JSON, compressed with the options given."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/production-orders/")
+    async def production_orders():
+        return Response(body, media_type="application/json")
+
+    return app
+
+
+async def measure(app: FastAPI, encoding: str, requests: int):
+    """Return the best latency in ms and the bytes on the wire of a request."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = await client.get(
+                "/production-orders/", headers={"Accept-Encoding": encoding}
+            )
+            await response.aread()
+            timings.append(time.perf_counter() - start)
+        # The body is decoded by httpx, count the bytes received instead
+        return min(timings) * 1000, response.num_bytes_downloaded
+
+
+async def bench(args):
+    """Run every configuration for every payload size."""
+    configurations = [("identity", "identity", {})]
+    configurations += [
+        (f"gzip level {level}", "gzip", {"gzip_level": level}) for level in (1, 6, 9)
+    ]
+    if middleware.brotli is not None:
+        configurations += [
+            (f"brotli quality {quality}", "br", {"brotli_quality": quality})
+            for quality in (1, 4, 11)
+        ]
+    for orders in args.orders:
+        body = make_payload(orders)
+        print(f"{orders} production orders, {len(body) / 1024:,.0f} KiB")
+        for name, encoding, options in configurations:
+            app = make_app(body, **options)
+            milliseconds, size = await measure(app, encoding, args.requests)
+            print(
+                f"  {name:<18} {milliseconds:>8.1f} ms {size / 1024:>10,.1f} KiB "
+                f"({size / len(body):>6.1%})"
+            )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Compare the standard and the fast JSON paths of the production order listing.
+
+A payload of production orders, as returned by Odoo, is parsed, validated into
+``ProductionOrders`` and rendered as a response, with:
+
+* standard: ``json.loads`` of the decoded text, ``jsonable_encoder`` and ``JSONResponse``
+* fast: ``loads`` of the bytes (orjson when installed) and ``FastJSONResponse``
+
+The payloads are built in memory, so the benchmark needs no Odoo server. Run it
+from the ``viixoo_backend_apps`` directory::
+
+    python mrp/benchmarks/bench_serialization.py --orders 100 500 1000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from mrp.models.models import ProductionOrders  # noqa: E402
+from viixoo_core.routes.responses import FastJSONResponse, loads  # noqa: E402
+
+
+def make_component(i: int) -> dict:
+    """Return a component of a work order."""
+    return {
+        "move_raw_id": i,
+        "product": f"[C-{i:05d}] Componente {i}",
+        "quantity": 2.0,
+        "product_uom_qty": 4.0,
+        "picked": i % 2 == 0,
+    }
+
+
+def make_workorder(i: int) -> dict:
+    """Return a work order with its times, components and blocks."""
+    return {
+        "readonly": False,
+        "access_type": "operator",
+        "workorder_id": i,
+        "name": f"Operación {i}",
+        "product": f"[P-{i:05d}] Producto {i}",
+        "workcenter": "Centro de trabajo 1",
+        "production_state": "progress",
+        "working_state": "normal",
+        "is_user_working": False,
+        "quality_state": None,
+        "test_type": None,
+        "qty_production": 10.0,
+        "qty_produced": 0.0,
+        "qty_producing": 10.0,
+        "qty_remaining": 10.0,
+        "duration_expected": 60.0,
+        "duration": 12.5,
+        "state": "progress",
+        "state_value": "En progreso",
+        "date_start": "2025-03-12 01:47:56",
+        "date_finished": None,
+        "url_document_instructions": "",
+        "urls_plans": "",
+        "time_ids": [
+            {
+                "time_id": i * 10 + t,
+                "employee_id": 1,
+                "employee": "Operario",
+                "duration": 6.25,
+                "date_start": "2025-03-12 01:47:56",
+                "date_end": "2025-03-12 01:54:11",
+                "loss": "Productivo",
+            }
+            for t in range(2)
+        ],
+        "move_raw_ids": [make_component(i * 10 + c) for c in range(3)],
+        "wororderblock_ids": [],
+    }
+
+
+def make_payload(orders: int) -> bytes:
+    """Return the Odoo response body of ``orders`` production orders."""
+    return json.dumps(
+        {
+            "status": "success",
+            "count": orders,
+            "production_order_ids": [
+                {
+                    "production_id": i,
+                    "name": f"WH/MO/{i:05d}",
+                    "product": f"[P-{i:05d}] Producto {i}",
+                    "product_qty": 10.0,
+                    "date_start": "2025-03-12 01:47:56",
+                    "date_finished": None,
+                    "state": "progress",
+                    "bom": "Lista de materiales",
+                    "workorder_ids": [make_workorder(i * 10 + w) for w in range(3)],
+                    "move_raw_ids": [make_component(i * 10 + c) for c in range(5)],
+                }
+                for i in range(orders)
+            ],
+        }
+    ).encode()
+
+
+def standard(body: bytes) -> bytes:
+    """Parse, validate and render with the standard library path."""
+    response = json.loads(body.decode())
+    model = ProductionOrders(
+        data=response.get("production_order_ids"), count=response.get("count")
+    )
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+def fast(body: bytes) -> bytes:
+    """Parse, validate and render with the fast path."""
+    response = loads(body)
+    model = ProductionOrders(
+        data=response.get("production_order_ids"), count=response.get("count")
+    )
+    return FastJSONResponse(model).body
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for orders in args.orders:
+        body = make_payload(orders)
+        assert json.loads(standard(body)) == json.loads(fast(body))
+        print(f"{orders} production orders, {len(body) / 1024:,.0f} KiB")
+        for name, func in (("standard", standard), ("fast", fast)):
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                func(body)
+                timings.append(time.perf_counter() - start)
+            seconds = min(timings)
+            print(
+                f"  {name:<10} {seconds * 1000:>10.1f} ms {orders / seconds:>12,.0f} orders/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
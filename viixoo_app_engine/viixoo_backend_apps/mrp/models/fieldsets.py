@@ -0,0 +1,58 @@
+"""Response models restricted to the fields requested by the client."""
+
+from functools import lru_cache
+from typing import List, Tuple, Type
+from pydantic import BaseModel, create_model
+
+
+def parse_fields(model: Type[BaseModel], fields: str | None, id_field: str) -> Tuple:
+    """Return the fields of a ``fields=`` parameter, in the order of the model.
+
+    :param model: The model of the items listed
+    :param fields: The field names separated by commas, e.g. ``"name,state"``
+    :param id_field: The field identifying the items, always included
+    :return: The field names, or an empty tuple for every field
+    """
+    if not fields:
+        return ()
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise ValueError(f"Campos desconocidos: {', '.join(sorted(unknown))}")
+    requested.add(id_field)
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+@lru_cache(maxsize=128)
+def fieldset_model(model: Type[BaseModel], fields: Tuple[str]) -> Type[BaseModel]:
+    """Return a model with only some fields of another one.
+
+    The fields keep their defaults, constraints and validators. The models are
+    cached, so a subset of fields is built once.
+
+    :param model: The complete model
+    :param fields: The names of the fields kept
+    :return: The model
+    """
+    return create_model(
+        f"{model.__name__}_{'_'.join(fields)}",
+        __base__=BaseModel,
+        **{
+            name: (model.model_fields[name].annotation, model.model_fields[name])
+            for name in fields
+        },
+    )
+
+
+@lru_cache(maxsize=128)
+def fieldset_list_model(model: Type[BaseModel], fields: Tuple[str]) -> Type[BaseModel]:
+    """Return a list model, with ``data`` and ``count``, of the items with some fields.
+
+    :param model: The complete model of the items
+    :param fields: The names of the fields kept
+    :return: The model
+    """
+    item = fieldset_model(model, fields)
+    return create_model(
+        f"{item.__name__}_list", data=(List[item], ...), count=(int, ...)
+    )
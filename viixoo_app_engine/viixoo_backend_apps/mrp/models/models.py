@@ -1,7 +1,7 @@
 """Model that defines the data models for the MRP application."""
 
 from pydantic import BaseModel, BeforeValidator, Field
-from typing import Annotated
+from typing import Annotated, Literal
 
 
 """If a boolean is received set to None."""
@@ -126,6 +126,16 @@ class WorkOrders(BaseModel):
     count: int
 
 
+class WorkOrdersDelta(BaseModel):
+    """Model for the work orders changed since a sync token."""
+
+    sync_token: str
+    full: bool
+    data: list[WorkOrder]
+    removed: list[int]
+    count: int
+
+
 class ReasonLoss(BaseModel):
     """Model for a reason loss."""
 
@@ -166,6 +176,36 @@ class BlockWorkOrder(BaseModel):
     description: str | None
 
 
+class WorkOrderTransition(BaseModel):
+    """Template for a state transition of a batch."""
+
+    action: Literal["start", "pause", "finish", "block", "unblock"]
+    workorder_id: int
+    loss_id: int | None = None
+    description: str | None = None
+
+
+class BatchWorkOrder(BaseModel):
+    """Template for a batch of state transitions."""
+
+    transitions: list[WorkOrderTransition] = Field(min_length=1, max_length=100)
+
+
+class TransitionResult(BaseModel):
+    """Model for the result of a state transition of a batch."""
+
+    action: str
+    workorder_id: int
+    status_code: int
+    message: str | None = None
+
+
+class BatchResults(BaseModel):
+    """Model for the results of a batch, in the order of the transitions."""
+
+    data: list[TransitionResult]
+
+
 class AddComponent(BaseModel):
     """Template for add component."""
 
@@ -19,8 +19,16 @@ def register_routes(controller: BaseController):
         "/production-orders/", service.get_production_orders, methods=["GET"]
     )
     controller.add_route("/work-orders/", service.get_workorders, methods=["GET"])
+    controller.add_route(
+        "/work-orders/delta", service.get_workorders_delta, methods=["GET"]
+    )
+    controller.add_route(
+        "/work-orders/events", service.get_workorder_events, methods=["GET"]
+    )
     controller.add_route("/products/", service.get_products, methods=["GET"])
     controller.add_route("/reasons-loss/", service.get_reasons_loss, methods=["GET"])
+    controller.add_route("/cache/", service.purge_cache, methods=["DELETE"])
+    controller.add_route("/metrics/", service.get_metrics, methods=["GET"])
     controller.add_route("/workorder/start", service.start_workorder, methods=["PATCH"])
     controller.add_route("/workorder/block", service.block_workorder, methods=["PATCH"])
     controller.add_route(
@@ -30,6 +38,7 @@ def register_routes(controller: BaseController):
         "/workorder/finish", service.finish_workorder, methods=["PATCH"]
     )
     controller.add_route("/workorder/pause", service.pause_workorder, methods=["PATCH"])
+    controller.add_route("/workorder/batch", service.batch_workorder, methods=["PATCH"])
     controller.add_route(
         "/component/add", service.add_components_workorder, methods=["PATCH"]
     )
@@ -0,0 +1,112 @@
+"""Circuit breaker of the calls to an Odoo endpoint."""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop calling an endpoint while most of its recent calls fail.
+
+    The outcome of the last ``window`` calls is kept. Once at least ``min_calls`` of
+    them are known and their failure rate reaches ``failure_rate``, the circuit opens:
+    the calls are refused at once for ``open_for`` seconds instead of waiting for
+    their timeout. Then it is half-open: ``half_open_calls`` probe calls are let
+    through, their success closes the circuit and their failure opens it again.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        open_for: float = 30,
+        half_open_calls: int = 1,
+    ):
+        """Initialize a CircuitBreaker instance.
+
+        :param window: The number of recent calls whose outcome is kept
+        :param min_calls: The minimum number of calls in the window to open the circuit
+        :param failure_rate: The rate of failed calls opening the circuit, from 0 to 1
+        :param open_for: Seconds the calls are refused once the circuit opens
+        :param half_open_calls: The number of probe calls let through when half-open
+        """
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_for = open_for
+        self.half_open_calls = half_open_calls
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit: closed, open or half_open."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_for:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """Return whether a call can be made, counting it as a probe when half-open.
+
+        Every call allowed must be followed by ``record`` or ``release``.
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.half_open_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record(self, success: bool):
+        """Record the outcome of an allowed call.
+
+        :param success: Whether the call succeeded
+        """
+        if self._state == HALF_OPEN:
+            self._probes = max(self._probes - 1, 0)
+            if success:
+                self._state = CLOSED
+                self._outcomes.clear()
+            else:
+                self._open()
+            return
+        self._outcomes.append(success)
+        if self._state == CLOSED and len(self._outcomes) >= self.min_calls:
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.failure_rate:
+                self._open()
+
+    def release(self):
+        """Forget an allowed call without outcome, e.g. cancelled by the client."""
+        if self._state == HALF_OPEN:
+            self._probes = max(self._probes - 1, 0)
+
+    def _open(self):
+        """Open the circuit."""
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the state, the failure rate of the window and the calls refused."""
+        calls = len(self._outcomes)
+        return {
+            "state": self.state,
+            "failure_rate": (
+                round(self._outcomes.count(False) / calls, 3) if calls else 0.0
+            ),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,168 @@
+"""In-process caches of the data read from Odoo."""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set, Tuple
+from viixoo_core.routes.responses import dumps
+from .singleflight import SingleFlight
+
+_logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """TTL cache with stale-while-revalidate.
+
+    A value younger than ``ttl`` is returned as is. Up to ``ttl + stale_ttl`` the
+    stale value is still returned at once while a background task reloads it; past
+    that, the caller waits for the reload. Concurrent loads of the same key, cold,
+    expired or in the background, share one call to the loader. At most ``maxsize``
+    keys are kept, the least recently used one is evicted first.
+    """
+
+    def __init__(self, ttl: float = 300, stale_ttl: float = 3600, maxsize: int = 128):
+        """Initialize a TTLCache instance.
+
+        :param ttl: Seconds a value is fresh
+        :param stale_ttl: Seconds a value is still served after ``ttl`` while it is refreshed
+        :param maxsize: The maximum number of keys cached
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._flight = SingleFlight()
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the value of a key, loading it when missing or expired.
+
+        :param key: The key of the value
+        :param loader: A coroutine function returning the value; its errors are raised
+            to the caller, unless a stale value can be served
+        :return: The value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                self._refresh(key, loader)
+                return value
+        return await self._load(key, loader)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        """Reload a key in the background, once at a time."""
+        if key in self._refreshing:
+            return
+        task = asyncio.ensure_future(self._background_load(key, loader))
+        self._refreshing[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _background_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ):
+        """Reload a key, keeping the stale value on error."""
+        try:
+            await self._load(key, loader)
+        except Exception as e:
+            _logger.warning("No se pudo refrescar la caché %s: %s", key, e)
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Load a key and store its value, once for all the concurrent callers."""
+
+        async def load():
+            value = await loader()
+            self.set(key, value)
+            return value
+
+        return await self._flight.do(key, load)
+
+    def set(self, key: Hashable, value: Any):
+        """Store the value of a key, evicting the least recently used keys.
+
+        :param key: The key of the value
+        :param value: The value
+        """
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def purge(self, key: Hashable = None) -> int:
+        """Remove a key, or every key.
+
+        :param key: The key to remove, all of them if not given
+        :return: The number of keys removed
+        """
+        if key is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        return 1 if self._entries.pop(key, None) is not None else 0
+
+    def __len__(self) -> int:
+        """Return the number of keys cached."""
+        return len(self._entries)
+
+
+class ResponseCache:
+    """Rendered JSON bodies and their ETag, keyed by query.
+
+    Each body is stored with the version of the data it was rendered from, e.g. a
+    digest of the Odoo response. While the version of a query does not change, its
+    body and ETag are reused without parsing, validating nor serializing again.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize a ResponseCache instance.
+
+        :param maxsize: The maximum number of queries cached
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Any, str, bytes]]" = OrderedDict()
+
+    def render(
+        self, key: Hashable, version: Any, build: Callable[[], Any]
+    ) -> Tuple[str, bytes]:
+        """Return the ETag and the JSON body of a query, rendering it if its version changed.
+
+        :param key: The key of the query
+        :param version: A value changing with the data of the query
+        :param build: A function returning the model or document rendered
+        :return: The quoted ETag and the body
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (entry[0] is version or entry[0] == version):
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+        body = dumps(build())
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self._entries[key] = (version, etag, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return etag, body
+
+    def purge(self) -> int:
+        """Remove every body.
+
+        :return: The number of bodies removed
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def __len__(self) -> int:
+        """Return the number of bodies cached."""
+        return len(self._entries)
@@ -0,0 +1,104 @@
+"""Snapshots of the payloads sent to the clients, for the delta sync."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Tuple
+
+
+class Delta(NamedTuple):
+    """The changes of a payload since the one of a sync token."""
+
+    sync_token: str
+    full: bool
+    changed: List[Dict[str, Any]]
+    removed: List[Any]
+
+
+class SnapshotCache:
+    """Hashes of the records of the last payloads, keyed by query and sync token.
+
+    The sync token is a digest of the hashes of the records, so clients holding the
+    same payload share one snapshot. At most ``maxsize`` snapshots are kept, the least
+    recently used one is evicted first; a client whose token was evicted gets the
+    full payload again.
+    """
+
+    def __init__(self, id_field: str, maxsize: int = 1024):
+        """Initialize a SnapshotCache instance.
+
+        :param id_field: The field identifying the records
+        :param maxsize: The maximum number of snapshots kept
+        """
+        self.id_field = id_field
+        self.maxsize = maxsize
+        self._snapshots: "OrderedDict[Tuple[Hashable, str], Dict[Any, str]]" = (
+            OrderedDict()
+        )
+
+    def hashes(self, records: List[Dict[str, Any]]) -> Dict[Any, str]:
+        """Return the hash of every record, keyed by its id.
+
+        :param records: The records of the payload
+        :return: The hashes
+        """
+        return {
+            record[self.id_field]: hashlib.blake2b(
+                json.dumps(record, sort_keys=True, default=str).encode(),
+                digest_size=16,
+            ).hexdigest()
+            for record in records
+        }
+
+    @staticmethod
+    def sync_token(hashes: Dict[Any, str]) -> str:
+        """Return the sync token of a payload, a digest of the hashes of its records."""
+        digest = hashlib.blake2b(digest_size=16)
+        for record_id, record_hash in hashes.items():
+            digest.update(f"{record_id}:{record_hash};".encode())
+        return digest.hexdigest()
+
+    def diff(
+        self, key: Hashable, sync_token: str, records: List[Dict[str, Any]]
+    ) -> Delta:
+        """Return the records changed and removed since the payload of a sync token.
+
+        :param key: The key of the query, e.g. the employee and the filters
+        :param sync_token: The token of the payload the client has, or None
+        :param records: The records of the current payload
+        :return: The delta and the token of the current payload. ``full`` is True when
+            the token is unknown and every record is returned
+        """
+        current = self.hashes(records)
+        token = self.sync_token(current)
+        previous = self._snapshots.get((key, sync_token)) if sync_token else None
+        self._store(key, token, current)
+        if previous is None:
+            return Delta(token, True, records, [])
+        changed = [
+            record
+            for record in records
+            if previous.get(record[self.id_field]) != current[record[self.id_field]]
+        ]
+        removed = [record_id for record_id in previous if record_id not in current]
+        return Delta(token, False, changed, removed)
+
+    def _store(self, key: Hashable, token: str, hashes: Dict[Any, str]):
+        """Store the snapshot of a payload, evicting the least recently used ones."""
+        self._snapshots[(key, token)] = hashes
+        self._snapshots.move_to_end((key, token))
+        while len(self._snapshots) > self.maxsize:
+            self._snapshots.popitem(last=False)
+
+    def purge(self) -> int:
+        """Remove every snapshot.
+
+        :return: The number of snapshots removed
+        """
+        count = len(self._snapshots)
+        self._snapshots.clear()
+        return count
+
+    def __len__(self) -> int:
+        """Return the number of snapshots kept."""
+        return len(self._snapshots)
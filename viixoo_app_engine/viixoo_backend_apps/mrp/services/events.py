@@ -0,0 +1,76 @@
+"""Fan-out of the work order events to the clients subscribed with Server-Sent Events."""
+
+import asyncio
+import itertools
+from typing import Any, AsyncIterator, Dict, Set
+from viixoo_core.routes.responses import dumps
+
+
+class EventHub:
+    """Publish events to every subscriber of the process.
+
+    Each event is serialized once and put in the queue of every subscriber without
+    waiting, so a slow client never delays the others: when its queue is full, its
+    oldest event is dropped. The hub only knows the clients of its process; the
+    events of the other workers reach it through a channel (``viixoo_core.models.channel``).
+    """
+
+    def __init__(self, queue_size: int = 100):
+        """Initialize an EventHub instance.
+
+        :param queue_size: The maximum number of events waiting for a subscriber
+        """
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self) -> asyncio.Queue:
+        """Return the queue of a new subscriber."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber."""
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: Dict[str, Any]):
+        """Send an event to every subscriber.
+
+        :param event: The name of the event
+        :param data: The data of the event, sent as JSON
+        """
+        message = (
+            f"id: {next(self._ids)}\nevent: {event}\ndata: ".encode()
+            + dumps(data)
+            + b"\n\n"
+        )
+        self.published += 1
+        for queue in tuple(self._subscribers):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+
+    async def stream(self, heartbeat: float = 15) -> AsyncIterator[bytes]:
+        """Yield the events published while the client is connected, as Server-Sent Events.
+
+        :param heartbeat: Seconds without events before a comment is sent to keep the
+            connection open
+        """
+        queue = self.subscribe()
+        try:
+            yield b"retry: 5000\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+        finally:
+            self.unsubscribe(queue)
+
+    def __len__(self) -> int:
+        """Return the number of subscribers."""
+        return len(self._subscribers)
@@ -0,0 +1,208 @@
+"""Providers of the keys signing the access tokens.
+
+Every worker and replica must sign and verify with the same keys, so the keys are
+read from the environment or from a file shared by all of them. Each key has an id,
+written in the ``kid`` header of the tokens it signs. To rotate the keys, add the new
+key, make it the current one and mark the old one as retired: the old key keeps
+verifying the tokens it signed for a grace window, then it is ignored.
+"""
+
+import os
+import json
+import time
+import secrets
+import logging
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+
+class SigningKey(NamedTuple):
+    """A key signing the tokens."""
+
+    kid: str
+    secret: str
+    retired_at: Optional[float] = None
+
+
+class KeySet(NamedTuple):
+    """An immutable snapshot of the keys, replaced as a whole when they rotate."""
+
+    keys: Mapping[str, SigningKey]
+    current_kid: str
+
+    @classmethod
+    def create(cls, keys: Dict[str, SigningKey], current_kid: str) -> "KeySet":
+        """Create a snapshot of the keys.
+
+        :param keys: The keys, by id
+        :param current_kid: The id of the key signing the new tokens
+        :return: The snapshot
+        """
+        if current_kid not in keys:
+            raise ValueError(f"Unknown current key id: {current_kid}")
+        return cls(MappingProxyType(dict(keys)), current_kid)
+
+
+class KeyProvider:
+    """Keys held in memory, the current one signing the new tokens.
+
+    The keys and the current key id are read from one ``KeySet``, swapped with a
+    single assignment, so a rotation is never seen half applied.
+    """
+
+    def __init__(self, keys: Dict[str, SigningKey], current_kid: str, grace: float):
+        """Initialize a KeyProvider instance.
+
+        :param keys: The keys, by id
+        :param current_kid: The id of the key signing the new tokens
+        :param grace: Seconds a retired key still verifies the tokens
+        """
+        self.keyset = KeySet.create(keys, current_kid)
+        self.grace = grace
+
+    def current(self) -> SigningKey:
+        """Return the key signing the new tokens."""
+        keyset = self.keyset
+        return keyset.keys[keyset.current_kid]
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        """Return the key verifying the tokens of a key id, None if unknown or expired.
+
+        :param kid: The ``kid`` header of the token; the current key if not given
+        """
+        keyset = self.keyset
+        key = keyset.keys.get(kid or keyset.current_kid)
+        if key is None:
+            return None
+        if key.retired_at is not None and time.time() > key.retired_at + self.grace:
+            return None
+        return key
+
+
+def parse_keys(document: Dict) -> Dict:
+    """Return the keys and the current key id of a keys document.
+
+    The document is like::
+
+        {
+            "current": "2025-06",
+            "keys": {
+                "2025-06": {"secret": "..."},
+                "2025-01": {"secret": "...", "retired_at": 1748736000}
+            }
+        }
+
+    :param document: The keys document
+    :return: The keyword arguments ``keys`` and ``current_kid`` of a KeyProvider
+    """
+    keys = {
+        kid: SigningKey(kid, key["secret"], key.get("retired_at"))
+        for kid, key in document["keys"].items()
+    }
+    return {"keys": keys, "current_kid": document.get("current") or next(iter(keys))}
+
+
+class FileKeyProvider(KeyProvider):
+    """Keys read from a JSON file, reloaded when the file changes."""
+
+    def __init__(self, path: str, grace: float, check_interval: float = 5):
+        """Initialize a FileKeyProvider instance.
+
+        :param path: The path of the keys document (see ``parse_keys``)
+        :param grace: Seconds a retired key still verifies the tokens
+        :param check_interval: Seconds between the checks of the file
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = os.stat(path).st_mtime
+        self._checked = time.monotonic()
+        super().__init__(grace=grace, **self._read())
+
+    def _read(self) -> Dict:
+        """Read the keys of the file."""
+        with open(self.path) as keys_file:
+            return parse_keys(json.load(keys_file))
+
+    def _reload(self):
+        """Reload the keys if the file changed since the last check."""
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return
+        with self._lock:
+            self._checked = now
+            try:
+                mtime = os.stat(self.path).st_mtime
+                if mtime == self._mtime:
+                    return
+                keyset = KeySet.create(**self._read())
+            except Exception as e:
+                _logger.error("No se pudieron recargar las llaves: %s", e)
+                return
+            self._mtime = mtime
+            self.keyset = keyset
+
+    def current(self) -> SigningKey:
+        """Return the key signing the new tokens."""
+        self._reload()
+        return super().current()
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        """Return the key verifying the tokens of a key id, None if unknown or expired."""
+        self._reload()
+        return super().get(kid)
+
+
+def key_provider_from_env() -> KeyProvider:
+    """Create the key provider configured in the environment.
+
+    * ``JWT_KEYS_FILE``: a JSON keys document, reloaded when it changes
+    * ``JWT_KEYS``: the keys as ``kid:secret`` pairs separated by commas, the first one
+      signing; the others only verify
+    * ``JWT_SECRET_KEY``: a single key, with the id ``default``
+
+    Without any of them a random key is generated, valid only in this process.
+    ``JWT_KEY_GRACE`` sets the seconds a retired key still verifies, by default the
+    lifetime of the tokens.
+    """
+    grace = float(os.getenv("JWT_KEY_GRACE", 600 * 60))
+    if os.getenv("JWT_KEYS_FILE"):
+        return FileKeyProvider(os.environ["JWT_KEYS_FILE"], grace)
+    if os.getenv("JWT_KEYS"):
+        pairs = _parse_keys(os.environ["JWT_KEYS"])
+        keys = {kid: SigningKey(kid, secret) for kid, secret in pairs}
+        return KeyProvider(keys, pairs[0][0], grace)
+    if os.getenv("JWT_SECRET_KEY"):
+        key = SigningKey("default", os.environ["JWT_SECRET_KEY"])
+        return KeyProvider({key.kid: key}, key.kid, grace)
+    _logger.warning(
+        "Sin llaves configuradas: los tokens solo son válidos en este proceso"
+    )
+    key = SigningKey(secrets.token_hex(8), secrets.token_urlsafe(32))
+    return KeyProvider({key.kid: key}, key.kid, grace)
+
+
+def _parse_keys(value: str) -> List[Tuple[str, str]]:
+    """Return the ``kid:secret`` pairs of ``JWT_KEYS``.
+
+    An entry is named by its position only, so its secret is not logged.
+
+    :param value: The pairs separated by commas
+    :return: The key ids and their secrets
+    """
+    pairs = []
+    for position, entry in enumerate(value.split(","), 1):
+        if not entry.strip():
+            continue
+        kid, _, secret = entry.strip().partition(":")
+        if not kid.strip() or not secret.strip():
+            raise ValueError(
+                f"Invalid JWT_KEYS entry {position}: expected a kid:secret pair"
+            )
+        pairs.append((kid.strip(), secret.strip()))
+    if not pairs:
+        raise ValueError("JWT_KEYS has no kid:secret pair")
+    return pairs
@@ -7,40 +7,146 @@ from ..models.models import (
     UpdatePassword,
     Message,
     ProductionOrders,
+    WorkOrder,
     WorkOrders,
+    WorkOrdersDelta,
+    ProductionOrder,
     ReasonsLoss,
     ChangeStateWorkOrder,
     BlockWorkOrder,
     Products,
     AddComponent,
     ConsumeComponent,
+    BatchWorkOrder,
+    BatchResults,
+    TransitionResult,
+    WorkOrderTransition,
 )
-from typing import Any
-import requests
+from ..models.fieldsets import fieldset_list_model, parse_fields
+from typing import Any, Dict, List, Tuple, Type
+from pydantic import BaseModel
 import logging
+import asyncio
+import hashlib
 import json
 import os
+import secrets
+from viixoo_core.config import BaseConfig
+from viixoo_core.models.channel import LocalChannel, PostgresChannel
 from viixoo_core.services.base_service import BaseService
-from fastapi import Depends, HTTPException
+from viixoo_core.routes.responses import FastJSONResponse, etag_response, loads
+from fastapi import Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Annotated
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.security import OAuth2PasswordBearer
 from . import security
+from .odoo_client import OdooClient
+from .cache import ResponseCache, TTLCache
+from .singleflight import SingleFlight
+from .delta import SnapshotCache
+from .events import EventHub
 import configparser
 from dotenv import load_dotenv
 
 _logger = logging.getLogger(__name__)
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="/login/access-token")
+optional_oauth2 = OAuth2PasswordBearer(tokenUrl="/login/access-token", auto_error=False)
 load_dotenv()
 
-SECRET_KEY = security.SECRET_KEY
 config = configparser.ConfigParser()
 config_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "mrp.conf")
 config.read(config_file_path)
 URL_ODOO = config.get("settings_odoo", "url_odoo")
 TOKEN_ODOO = os.getenv("TOKEN_ODOO", "")
 
+# Pooled keep-alive client shared by every call to Odoo
+odoo_client = OdooClient.from_config(config, TOKEN_ODOO)
+
+# Products and reasons loss, served from memory and refreshed in the background
+reference_cache = TTLCache(
+    ttl=config.getfloat("cache", "ttl", fallback=300),
+    stale_ttl=config.getfloat("cache", "stale_ttl", fallback=3600),
+    maxsize=config.getint("cache", "maxsize", fallback=128),
+)
+# Maximum number of transitions of a batch sent to Odoo at the same time
+BATCH_CONCURRENCY = config.getint("settings_odoo", "batch_concurrency", fallback=5)
+# Name and email of the employees, filled at login. A password reset purges the
+# profile in every worker through event_channel; without a PostgreSQL channel, the
+# other workers serve it until profile_ttl expires
+profile_cache = TTLCache(
+    ttl=config.getfloat("cache", "profile_ttl", fallback=300),
+    stale_ttl=config.getfloat("cache", "profile_stale_ttl", fallback=3600),
+    maxsize=config.getint("cache", "profile_maxsize", fallback=1024),
+)
+# Rendered bodies and ETags of the listings, reused while Odoo returns the same data
+response_cache = ResponseCache(
+    maxsize=config.getint("cache", "response_maxsize", fallback=256)
+)
+# Identical reads of orders in flight share one call to Odoo
+odoo_singleflight = SingleFlight()
+# Hashes of the last work orders sent to each employee, for the delta sync
+workorder_snapshots = SnapshotCache(
+    "workorder_id", maxsize=config.getint("delta", "maxsize", fallback=1024)
+)
+# Changes of the work orders pushed to the tablets, and the seconds between pings
+workorder_events = EventHub(
+    queue_size=config.getint("events", "queue_size", fallback=100)
+)
+SSE_HEARTBEAT = config.getfloat("events", "heartbeat", fallback=15)
+# Messages shared by the workers. Without a channel in [events] they only reach this
+# process, so each client only sees the changes made through its own worker: set it
+# when running several workers, so that every one LISTENs to it on PostgreSQL
+EVENTS_CHANNEL = config.get("events", "channel", fallback="")
+if EVENTS_CHANNEL:
+    event_channel = PostgresChannel(
+        EVENTS_CHANNEL,
+        "mrp",
+        BaseConfig.get_config(
+            base_path=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            module="mrp",
+        ),
+    )
+else:
+    event_channel = LocalChannel()
+event_channel.subscribe(
+    "workorder", lambda data: workorder_events.publish("workorder", data)
+)
+event_channel.subscribe("profile", lambda data: profile_cache.purge(data["sub"]))
+# Token required by the administration endpoints, disabled if empty
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def content_digest(content: bytes) -> bytes:
+    """Return a digest of the body of an Odoo response."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def get_current_employee(
+    token: Annotated[str, Depends(reusable_oauth2)],
+) -> Dict[str, Any]:
+    """Return the payload of the token of the request, with the employee in ``sub``.
+
+    FastAPI resolves a dependency once per request, so the token is verified once
+    however many parameters use it.
+    """
+    payload = security.get_payload(token)
+    if not payload:
+        raise HTTPException(status_code=403, detail="Usuario no autenticado")
+    return payload
+
+
+CurrentEmployee = Annotated[Dict[str, Any], Depends(get_current_employee)]
+
+
+def check_admin_token(auth_token: str | None):
+    """Raise a 403 error unless the token is the administration token."""
+    if not ADMIN_TOKEN or not secrets.compare_digest(
+        (auth_token or "").encode(), ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Acceso denegado")
+
 
 class MrpService(BaseService):
     """MRP service."""
@@ -49,36 +155,33 @@ class MrpService(BaseService):
         """Initialize the MrpService class."""
         super().__init__("mrp")
 
-    def authenticate_user(
+    async def authenticate_user(
         self, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
     ) -> Token:
         """Authenticate user."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
 
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/authenticate_user/",
-                headers=headers,
-                data=json.dumps(
-                    {"user_login": form_data.username, "password": form_data.password}
-                ),
-                verify=True,
-                timeout=100,
+            odoo_response = await odoo_client.post(
+                "/hemago/authenticate_user/",
+                {"user_login": form_data.username, "password": form_data.password},
             )
         except Exception as e:
+            detail = getattr(e, "detail", None) or "Usuario o contraseña incorrecto"
+            status_code = getattr(e, "status_code", None) or 401
             error_str = str(e)
             _logger.error("Ha ocurrido un error al enviar la solicitud a Odoo")
             _logger.error(error_str)
-            raise HTTPException(
-                status_code=401, detail="Usuario o contraseña incorrecto"
-            )
+            raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("employee"):
                 employee = response["employee"]
+                if employee.get("name"):
+                    await event_channel.start()
+                    profile_cache.set(
+                        str(employee["id"]),
+                        User(full_name=employee["name"], email=employee.get("email")),
+                    )
                 access_token_expires = timedelta(minutes=600)
                 return Token(
                     access_token=security.create_access_token(
@@ -91,27 +194,23 @@ class MrpService(BaseService):
                     detail="No fue encontrado ningún usuario con las credenciales proporcionadas",
                 )
 
-    def get_user(self, token: Annotated[str, Depends(reusable_oauth2)]) -> User:
-        """Get user data."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
+    async def get_user(self, payload: CurrentEmployee) -> User:
+        """Get user data, from the profile cache filled at login."""
+        # Receive the purges of the profiles made by the other workers
+        await event_channel.start()
+        return await profile_cache.get(
+            payload.get("sub"), lambda: self._load_user(payload)
+        )
+
+    async def _load_user(self, payload: Dict[str, Any]) -> User:
+        """Load the user data from Odoo."""
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
-            else:
-                odoo_response = requests.get(
-                    URL_ODOO + "/hemago/get_employee/",
-                    headers=headers,
-                    data=json.dumps({"employee_id": payload.get("sub")}),
-                    verify=True,
-                    timeout=100,
-                )
+            odoo_response = await odoo_client.get(
+                "/hemago/get_employee/", {"employee_id": payload.get("sub")}
+            )
         except Exception as e:
-            detail = e.detail if e.detail else "Usuario no encontrado"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Usuario no encontrado"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
@@ -120,61 +219,62 @@ class MrpService(BaseService):
             if response.get("employee"):
                 employee = response["employee"]
                 return User(full_name=employee["name"], email=employee["email"])
+            else:
+                raise HTTPException(status_code=400, detail="Usuario no encontrado")
 
-    def reset_password(
-        self, token: Annotated[str, Depends(reusable_oauth2)], body: UpdatePassword
+    async def reset_password(
+        self, payload: CurrentEmployee, body: UpdatePassword
     ) -> Any:
         """Reset password."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "new_password": body.new_password,
                 "current_password": body.current_password,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/reset_password/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.post("/hemago/reset_password/", data)
         except Exception as e:
-            detail = e.detail if e.detail else "Usuario no encontrado"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Usuario no encontrado"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                profile_cache.purge(payload.get("sub"))
+                event_channel.publish("profile", {"sub": payload.get("sub")})
                 return Message(message="Contraseña cambiada satisfactoriamente")
             else:
                 raise HTTPException(status_code=500, detail="Acceso denegado")
 
-    def get_production_orders(
+    async def _coalesced_get(self, path: str, data: Dict[str, Any]) -> Any:
+        """Send a GET request to Odoo, sharing the response of an identical one in flight.
+
+        :param path: The path of the endpoint
+        :param data: The data of the request, part of the key with the path
+        :return: The response
+        """
+        key = (path, json.dumps(data, sort_keys=True))
+        return await odoo_singleflight.do(key, lambda: odoo_client.get(path, data))
+
+    async def get_production_orders(
         self,
-        token: Annotated[str, Depends(reusable_oauth2)],
+        payload: CurrentEmployee,
         order_search: str = False,
         show_all_state: bool = False,
         skip: int = 0,
         limit: int = 100,
+        fields: str = None,
+        if_none_match: Annotated[str | None, Header()] = None,
     ) -> Any:
-        """Get production orders."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
+        """Get production orders.
+
+        ``fields`` restricts the production orders to some fields, separated by commas.
+        The response has an ETag; a 304 is returned if it matches ``If-None-Match``.
+        """
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
+            fieldset = self._parse_fields(ProductionOrder, fields, "production_id")
             data = {
                 "employee_id": payload.get("sub"),
                 "order_search": order_search,
@@ -183,50 +283,133 @@ class MrpService(BaseService):
                 "start": skip,
                 "limit": limit,
             }
-            odoo_response = requests.get(
-                URL_ODOO + "/hemago/get_production_order/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
+            if fieldset:
+                data["fields"] = list(fieldset)
+            odoo_response = await self._coalesced_get(
+                "/hemago/get_production_order/", data
             )
         except Exception as e:
             detail = (
-                e.detail
-                if e.detail
-                else "Ha ocurrido un error al enviar la solicitud a Odoo"
+                getattr(e, "detail", None)
+                or "Ha ocurrido un error al enviar la solicitud a Odoo"
             )
-            status_code = e.status_code if e.status_code else 400
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
-            response = json.loads(odoo_response.text)
-            if response.get("status") == "success":
-                return ProductionOrders(
+
+            def build():
+                response = loads(odoo_response.content)
+                if response.get("status") != "success":
+                    raise HTTPException(status_code=500)
+                model = (
+                    fieldset_list_model(ProductionOrder, fieldset)
+                    if fieldset
+                    else ProductionOrders
+                )
+                return model(
                     data=response.get("production_order_ids"),
                     count=response.get("count"),
                 )
-            else:
-                raise HTTPException(status_code=500)
 
-    def get_workorders(
+            etag, body = response_cache.render(
+                ("production_orders", json.dumps(data, sort_keys=True)),
+                content_digest(odoo_response.content),
+                build,
+            )
+            return etag_response(etag, body, if_none_match)
+
+    async def get_workorders(
         self,
-        token: Annotated[str, Depends(reusable_oauth2)],
+        payload: CurrentEmployee,
         order_search: str = False,
         show_all_state: bool = False,
         skip: int = 0,
         limit: int = 100,
+        fields: str = None,
+        if_none_match: Annotated[str | None, Header()] = None,
     ) -> Any:
-        """Get work orders."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
+        """Get work orders.
+
+        ``fields`` restricts the work orders to some fields, separated by commas.
+        The response has an ETag; a 304 is returned if it matches ``If-None-Match``.
+        """
+        fieldset = self._parse_fields(WorkOrder, fields, "workorder_id")
+        data, odoo_response = await self._request_workorders(
+            payload, order_search, show_all_state, skip, limit, fieldset
+        )
+
+        def build():
+            response = self._workorders_payload(odoo_response)
+            model = fieldset_list_model(WorkOrder, fieldset) if fieldset else WorkOrders
+            return model(
+                data=response.get("workorder_ids"), count=response.get("count")
+            )
+
+        etag, body = response_cache.render(
+            ("workorders", json.dumps(data, sort_keys=True)),
+            content_digest(odoo_response.content),
+            build,
+        )
+        return etag_response(etag, body, if_none_match)
+
+    def _parse_fields(
+        self, model: Type[BaseModel], fields: str | None, id_field: str
+    ) -> Tuple[str]:
+        """Return the fields requested with ``fields=``, raising a 422 error if unknown."""
+        try:
+            return parse_fields(model, fields, id_field)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    async def get_workorders_delta(
+        self,
+        payload: CurrentEmployee,
+        sync_token: str = None,
+        order_search: str = False,
+        show_all_state: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Any:
+        """Get the work orders changed since the payload of ``sync_token``.
+
+        Without a known sync token every work order is returned, with ``full`` set.
+        The ids of the work orders no longer listed are returned in ``removed``.
+        """
+        _, odoo_response = await self._request_workorders(
+            payload, order_search, show_all_state, skip, limit
+        )
+        response = self._workorders_payload(odoo_response)
+        key = (payload.get("sub"), order_search, show_all_state, skip, limit)
+        delta = workorder_snapshots.diff(
+            key, sync_token, response.get("workorder_ids") or []
+        )
+        return FastJSONResponse(
+            WorkOrdersDelta(
+                sync_token=delta.sync_token,
+                full=delta.full,
+                data=delta.changed,
+                removed=delta.removed,
+                count=response.get("count"),
+            )
+        )
+
+    async def _request_workorders(
+        self,
+        payload: Dict[str, Any],
+        order_search: str,
+        show_all_state: bool,
+        skip: int,
+        limit: int,
+        fields: Tuple[str] = (),
+    ) -> Tuple[Dict[str, Any], Any]:
+        """Request the work orders of the employee to Odoo.
+
+        :param fields: The fields of the work orders requested, all of them if empty
+        :return: The data sent to Odoo and its response, parsed by ``_workorders_payload``
+        """
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "order_search": order_search,
@@ -235,53 +418,60 @@ class MrpService(BaseService):
                 "start": skip,
                 "limit": limit,
             }
-            odoo_response = requests.get(
-                URL_ODOO + "/hemago/get_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            if fields:
+                data["fields"] = list(fields)
+            odoo_response = await self._coalesced_get("/hemago/get_workorder/", data)
         except Exception as e:
             detail = (
-                e.detail
-                if e.detail
-                else "Ha ocurrido un error al enviar la solicitud a Odoo"
+                getattr(e, "detail", None)
+                or "Ha ocurrido un error al enviar la solicitud a Odoo"
             )
-            status_code = e.status_code if e.status_code else 400
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
-            response = json.loads(odoo_response.text)
-            if response.get("status") == "success":
-                return WorkOrders(
-                    data=response.get("workorder_ids"), count=response.get("count")
-                )
-            else:
-                raise HTTPException(status_code=500)
+            return data, odoo_response
 
-    def get_reasons_loss(self, token: Annotated[str, Depends(reusable_oauth2)]) -> Any:
-        """Get reasons loss."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
+    def _workorders_payload(self, odoo_response: Any) -> Dict[str, Any]:
+        """Parse the work orders response of Odoo.
+
+        :return: The response of Odoo, with the work orders in ``workorder_ids``
+        """
+        response = loads(odoo_response.content)
+        if response.get("status") == "success":
+            return response
+        else:
+            raise HTTPException(status_code=500)
+
+    async def get_reasons_loss(
+        self,
+        payload: CurrentEmployee,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> Any:
+        """Get reasons loss, from the reference data cache, with an ETag."""
+        reasons_loss = await reference_cache.get(
+            "reasons_loss", self._load_reasons_loss
+        )
+        etag, body = response_cache.render(
+            "reasons_loss", reasons_loss, lambda: reasons_loss
+        )
+        return etag_response(etag, body, if_none_match)
+
+    async def _load_reasons_loss(self) -> ReasonsLoss:
+        """Load the reasons loss from Odoo."""
         try:
-            odoo_response = requests.get(
-                URL_ODOO + "/hemago/get_reasons_loss/",
-                headers=headers,
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.get("/hemago/get_reasons_loss/")
         except Exception as e:
+            detail = (
+                getattr(e, "detail", None)
+                or "Ha ocurrido un error al enviar la solicitud a Odoo"
+            )
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error("Ha ocurrido un error al enviar la solicitud a Odoo")
             _logger.error(error_str)
-            raise HTTPException(
-                status_code=400,
-                detail="Ha ocurrido un error al enviar la solicitud a Odoo",
-            )
+            raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
@@ -289,27 +479,30 @@ class MrpService(BaseService):
             else:
                 raise HTTPException(status_code=500)
 
-    def get_products(self, token: Annotated[str, Depends(reusable_oauth2)]) -> Any:
-        """Get products."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
+    async def get_products(
+        self,
+        payload: CurrentEmployee,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> Any:
+        """Get products, from the reference data cache, with an ETag."""
+        products = await reference_cache.get("products", self._load_products)
+        etag, body = response_cache.render("products", products, lambda: products)
+        return etag_response(etag, body, if_none_match)
+
+    async def _load_products(self) -> Products:
+        """Load the products from Odoo."""
         try:
-            odoo_response = requests.get(
-                URL_ODOO + "/hemago/get_products/",
-                headers=headers,
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.get("/hemago/get_products/")
         except Exception as e:
+            detail = (
+                getattr(e, "detail", None)
+                or "Ha ocurrido un error al enviar la solicitud a Odoo"
+            )
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error("Ha ocurrido un error al enviar la solicitud a Odoo")
             _logger.error(error_str)
-            raise HTTPException(
-                status_code=400,
-                detail="Ha ocurrido un error al enviar la solicitud a Odoo",
-            )
+            raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
@@ -317,269 +510,316 @@ class MrpService(BaseService):
             else:
                 raise HTTPException(status_code=500)
 
-    def start_workorder(
+    async def purge_cache(
+        self,
+        auth_token: Annotated[str | None, Header(alias="Auth-Token")] = None,
+        name: str = None,
+    ) -> Message:
+        """Purge the reference data cache, all of it or only ``products`` or ``reasons_loss``."""
+        check_admin_token(auth_token)
+        count = reference_cache.purge(name)
+        return Message(message=f"Caché purgada: {count} entradas eliminadas")
+
+    async def get_metrics(
+        self, auth_token: Annotated[str | None, Header(alias="Auth-Token")] = None
+    ) -> Dict[str, Any]:
+        """Get the metrics of the calls to Odoo and of the caches."""
+        check_admin_token(auth_token)
+        return {
+            "odoo": odoo_client.stats(),
+            "singleflight": odoo_singleflight.stats(),
+            "cache": {
+                "size": len(reference_cache),
+                "profiles": len(profile_cache),
+                "responses": len(response_cache),
+            },
+            "delta": {"snapshots": len(workorder_snapshots)},
+            "events": {
+                "subscribers": len(workorder_events),
+                "published": workorder_events.published,
+                "dropped": workorder_events.dropped,
+                "channel": event_channel.stats(),
+            },
+        }
+
+    def _publish(self, action: str, payload: Dict[str, Any], **data):
+        """Publish a change of a work order to the clients subscribed to its events.
+
+        It goes through the channel of the workers, so the clients connected to any
+        of them receive it.
+        """
+        event_channel.publish(
+            "workorder", {"action": action, "employee_id": payload.get("sub"), **data}
+        )
+
+    async def get_workorder_events(
         self,
-        token: Annotated[str, Depends(reusable_oauth2)],
+        token: Annotated[str | None, Depends(optional_oauth2)] = None,
+        access_token: str = None,
+    ) -> StreamingResponse:
+        """Stream the changes of the work orders as Server-Sent Events.
+
+        Browsers' ``EventSource`` can not send headers, so the token is also accepted
+        in the ``access_token`` query parameter.
+        """
+        if not security.get_payload(token or access_token or ""):
+            raise HTTPException(status_code=403, detail="Usuario no autenticado")
+        await event_channel.start()
+        return StreamingResponse(
+            workorder_events.stream(heartbeat=SSE_HEARTBEAT),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def start_workorder(
+        self,
+        payload: CurrentEmployee,
         body: ChangeStateWorkOrder,
     ) -> Any:
         """Start workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "workorder_id": body.workorder_id,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/start_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.post("/hemago/start_workorder/", data)
         except Exception as e:
-            detail = e.detail if e.detail else "Orden no encontrada"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Orden no encontrada"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish("start", payload, workorder_id=body.workorder_id)
                 return Message(message="Orden de trabajo iniciada satisfactoriamente")
             else:
                 raise HTTPException(status_code=400, detail="Orden no encontrada")
 
-    def block_workorder(
-        self, token: Annotated[str, Depends(reusable_oauth2)], body: BlockWorkOrder
+    async def block_workorder(
+        self, payload: CurrentEmployee, body: BlockWorkOrder
     ) -> Any:
         """Block workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "workorder_id": body.workorder_id,
                 "loss_id": body.loss_id,
                 "description": body.description,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/block_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.post("/hemago/block_workorder/", data)
         except Exception as e:
-            detail = e.detail if e.detail else "Orden no encontrada"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Orden no encontrada"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish("block", payload, workorder_id=body.workorder_id)
                 return Message(message="Orden de trabajo bloqueada satisfactoriamente")
             else:
                 raise HTTPException(status_code=400, detail="Orden no encontrada")
 
-    def finish_workorder(
+    async def finish_workorder(
         self,
-        token: Annotated[str, Depends(reusable_oauth2)],
+        payload: CurrentEmployee,
         body: ChangeStateWorkOrder,
     ) -> Any:
         """Finish workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "workorder_id": body.workorder_id,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/finish_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.post("/hemago/finish_workorder/", data)
         except Exception as e:
-            detail = e.detail if e.detail else "Orden no encontrada"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Orden no encontrada"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish("finish", payload, workorder_id=body.workorder_id)
                 return Message(message="Orden de trabajo finalizada satisfactoriamente")
             else:
                 return Message(message=response.get("detail"))
 
-    def pause_workorder(
+    async def pause_workorder(
         self,
-        token: Annotated[str, Depends(reusable_oauth2)],
+        payload: CurrentEmployee,
         body: ChangeStateWorkOrder,
     ) -> Any:
         """Pause workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "workorder_id": body.workorder_id,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/pause_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.post("/hemago/pause_workorder/", data)
         except Exception as e:
-            detail = e.detail if e.detail else "Orden no encontrada"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Orden no encontrada"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish("pause", payload, workorder_id=body.workorder_id)
                 return Message(message="Orden de trabajo pausada satisfactoriamente")
             else:
                 raise HTTPException(status_code=400, detail="Orden no encontrada")
 
-    def unblock_workorder(
+    async def unblock_workorder(
         self,
-        token: Annotated[str, Depends(reusable_oauth2)],
+        payload: CurrentEmployee,
         body: ChangeStateWorkOrder,
     ) -> Any:
         """Unblock workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "workorder_id": body.workorder_id,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/unblock_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
-            )
+            odoo_response = await odoo_client.post("/hemago/unblock_workorder/", data)
         except Exception as e:
-            detail = e.detail if e.detail else "Orden no encontrada"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Orden no encontrada"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish("unblock", payload, workorder_id=body.workorder_id)
                 return Message(
                     message="Orden de trabajo desbloqueada satisfactoriamente"
                 )
             else:
                 raise HTTPException(status_code=400, detail="Orden no encontrada")
 
-    def add_components_workorder(
-        self, token: Annotated[str, Depends(reusable_oauth2)], body: AddComponent
+    async def batch_workorder(
+        self, payload: CurrentEmployee, body: BatchWorkOrder
+    ) -> BatchResults:
+        """Apply several state transitions, sent to Odoo concurrently.
+
+        The transitions of one work order are applied one after the other, in the
+        order they are sent; those of different work orders run concurrently. A
+        transition failing does not stop the others; the result of each one is
+        returned in the order of the transitions.
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def apply(transition: WorkOrderTransition) -> TransitionResult:
+            async with semaphore:
+                try:
+                    message = await self._apply_transition(payload, transition)
+                except HTTPException as e:
+                    status_code, detail = e.status_code, e.detail
+                except Exception as e:
+                    _logger.error(str(e))
+                    status_code, detail = 422, "Transición inválida"
+                else:
+                    status_code, detail = 200, message.message
+            return TransitionResult(
+                action=transition.action,
+                workorder_id=transition.workorder_id,
+                status_code=status_code,
+                message=detail,
+            )
+
+        results: List[TransitionResult] = [None] * len(body.transitions)
+        groups: Dict[int, List[int]] = {}
+        for index, transition in enumerate(body.transitions):
+            groups.setdefault(transition.workorder_id, []).append(index)
+
+        async def apply_group(indexes: List[int]):
+            for index in indexes:
+                results[index] = await apply(body.transitions[index])
+
+        await asyncio.gather(*map(apply_group, groups.values()))
+        return BatchResults(data=results)
+
+    async def _apply_transition(
+        self, payload: Dict[str, Any], transition: WorkOrderTransition
+    ) -> Message:
+        """Apply a state transition of a batch with the route of its action."""
+        if transition.action == "block":
+            return await self.block_workorder(
+                payload,
+                BlockWorkOrder(
+                    workorder_id=transition.workorder_id,
+                    loss_id=transition.loss_id,
+                    description=transition.description,
+                ),
+            )
+        change = ChangeStateWorkOrder(workorder_id=transition.workorder_id)
+        handler = {
+            "start": self.start_workorder,
+            "pause": self.pause_workorder,
+            "finish": self.finish_workorder,
+            "unblock": self.unblock_workorder,
+        }[transition.action]
+        return await handler(payload, change)
+
+    async def add_components_workorder(
+        self, payload: CurrentEmployee, body: AddComponent
     ) -> Any:
         """Add components workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "workorder_id": body.workorder_id,
                 "product_id": body.product_id,
                 "product_qty": body.quantity,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/add_components_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
+            odoo_response = await odoo_client.post(
+                "/hemago/add_components_workorder/", data
             )
         except Exception as e:
-            detail = e.detail if e.detail else "Orden no encontrada"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Orden no encontrada"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish("add_component", payload, workorder_id=body.workorder_id)
                 return Message(message="Componente agregado satisfactoriamente")
             else:
                 raise HTTPException(status_code=400, detail="Orden no encontrada")
 
-    def consume_component_workorder(
-        self, token: Annotated[str, Depends(reusable_oauth2)], body: ConsumeComponent
+    async def consume_component_workorder(
+        self, payload: CurrentEmployee, body: ConsumeComponent
     ) -> Any:
         """Consume components workorder."""
-        headers = {
-            "Auth-Token": TOKEN_ODOO,
-            "Content-Type": "application/json",
-        }
         try:
-            payload = security.get_payload(token)
-            if not payload:
-                raise HTTPException(status_code=403, detail="Usuario no autenticado")
             data = {
                 "employee_id": payload.get("sub"),
                 "move_id": body.move_raw_id,
                 "picked": body.consumed,
             }
-            odoo_response = requests.post(
-                URL_ODOO + "/hemago/consume_component_workorder/",
-                headers=headers,
-                data=json.dumps(data),
-                verify=True,
-                timeout=100,
+            odoo_response = await odoo_client.post(
+                "/hemago/consume_component_workorder/", data
             )
         except Exception as e:
-            detail = e.detail if e.detail else "Componente no encontrado"
-            status_code = e.status_code if e.status_code else 400
+            detail = getattr(e, "detail", None) or "Componente no encontrado"
+            status_code = getattr(e, "status_code", None) or 400
             error_str = str(e)
             _logger.error(error_str)
             raise HTTPException(status_code=status_code, detail=detail)
         else:
             response = json.loads(odoo_response.text)
             if response.get("status") == "success":
+                self._publish(
+                    "consume_component", payload, move_raw_id=body.move_raw_id
+                )
                 return Message(message="Componente consumido satisfactoriamente")
             else:
                 raise HTTPException(status_code=400, detail="Componente no encontrado")
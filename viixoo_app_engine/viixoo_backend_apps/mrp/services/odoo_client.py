@@ -0,0 +1,288 @@
+"""Shared HTTP client for the requests sent to Odoo."""
+
+import asyncio
+import json
+import random
+import weakref
+import configparser
+from collections import Counter
+from typing import Any, Dict
+
+import httpx
+
+from .breaker import CircuitBreaker
+
+# Methods whose requests can be sent again without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Statuses of an Odoo overloaded or restarting, retried on idempotent requests
+RETRY_STATUSES = frozenset({502, 503, 504})
+# Errors raised before the request reached Odoo, retried on any request
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class OdooUnavailableError(Exception):
+    """Odoo call refused without sending it, answered with a 503 error."""
+
+    status_code = 503
+
+    def __init__(self, detail: str):
+        """Initialize an OdooUnavailableError instance.
+
+        :param detail: The message sent to the client
+        """
+        super().__init__(detail)
+        self.detail = detail
+
+
+class OdooClient:
+    """Pooled async HTTP client for the Odoo API.
+
+    The connections are kept alive and reused by every request of the process,
+    instead of opening a new TCP+TLS connection per call. One ``httpx.AsyncClient``
+    is created per event loop, since its connections are bound to the loop.
+
+    Each endpoint has its own circuit breaker and limit of calls in flight, so a slow
+    endpoint fails fast instead of holding every request of the process. The
+    idempotent requests failing on the network or with a 502, 503 or 504 status are
+    retried a few times, after a random backoff.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str = "",
+        timeout: float = 15,
+        timeouts: Dict[str, float] = None,
+        connect_timeout: float = 5,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30,
+        http2: bool = False,
+        retries: int = 2,
+        retry_backoff: float = 0.2,
+        max_concurrency: int = 0,
+        concurrency: Dict[str, int] = None,
+        breaker: Dict[str, Any] = None,
+    ):
+        """Initialize an OdooClient instance.
+
+        :param base_url: The URL of the Odoo server
+        :param token: The token sent in the ``Auth-Token`` header
+        :param timeout: The default timeout of the requests, in seconds
+        :param timeouts: Timeouts per endpoint, keyed by the last segment of the path
+            (e.g. ``get_products``)
+        :param connect_timeout: The timeout to open a connection, in seconds
+        :param max_connections: The maximum number of open connections
+        :param max_keepalive_connections: The maximum number of idle connections kept alive
+        :param keepalive_expiry: Seconds before an idle connection is closed
+        :param http2: Use HTTP/2 when the server supports it (requires ``h2``)
+        :param retries: The number of retries of an idempotent request
+        :param retry_backoff: The base of the exponential backoff between retries, in
+            seconds; each wait is a random fraction of it
+        :param max_concurrency: The maximum number of calls in flight per endpoint, 0
+            for no limit
+        :param concurrency: Limits of calls in flight per endpoint, keyed like
+            ``timeouts``
+        :param breaker: The keyword arguments of the circuit breaker of each endpoint
+        """
+        self.base_url = base_url
+        self.token = token
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.connect_timeout = connect_timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.max_concurrency = max_concurrency
+        self.concurrency = concurrency or {}
+        self.breaker = breaker or {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._in_flight: Counter = Counter()
+        self._retried: Counter = Counter()
+        self._throttled: Counter = Counter()
+        self._clients: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+        ) = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_config(
+        cls, config: configparser.ConfigParser, token: str = ""
+    ) -> "OdooClient":
+        """Create a client from the configuration of the module.
+
+        The settings are read from the ``[settings_odoo]``, ``[odoo_timeouts]``,
+        ``[odoo_concurrency]`` and ``[circuit_breaker]`` sections.
+
+        :param config: The configuration of the module
+        :param token: The token sent in the ``Auth-Token`` header
+        :return: The client
+        """
+        settings = "settings_odoo"
+        timeouts = {}
+        if config.has_section("odoo_timeouts"):
+            timeouts = {
+                endpoint: config.getfloat("odoo_timeouts", endpoint)
+                for endpoint in config.options("odoo_timeouts")
+            }
+        concurrency = {}
+        if config.has_section("odoo_concurrency"):
+            concurrency = {
+                endpoint: config.getint("odoo_concurrency", endpoint)
+                for endpoint in config.options("odoo_concurrency")
+            }
+        breaker = {}
+        if config.has_section("circuit_breaker"):
+            section = "circuit_breaker"
+            breaker = {
+                "window": config.getint(section, "window", fallback=20),
+                "min_calls": config.getint(section, "min_calls", fallback=10),
+                "failure_rate": config.getfloat(section, "failure_rate", fallback=0.5),
+                "open_for": config.getfloat(section, "open_for", fallback=30),
+                "half_open_calls": config.getint(
+                    section, "half_open_calls", fallback=1
+                ),
+            }
+        return cls(
+            config.get(settings, "url_odoo"),
+            token=token,
+            timeout=config.getfloat(settings, "timeout", fallback=15),
+            timeouts=timeouts,
+            connect_timeout=config.getfloat(settings, "connect_timeout", fallback=5),
+            max_connections=config.getint(settings, "max_connections", fallback=100),
+            max_keepalive_connections=config.getint(
+                settings, "max_keepalive_connections", fallback=20
+            ),
+            keepalive_expiry=config.getfloat(settings, "keepalive_expiry", fallback=30),
+            http2=config.getboolean(settings, "http2", fallback=False),
+            retries=config.getint(settings, "retries", fallback=2),
+            retry_backoff=config.getfloat(settings, "retry_backoff", fallback=0.2),
+            max_concurrency=config.getint(settings, "max_concurrency", fallback=0),
+            concurrency=concurrency,
+            breaker=breaker,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the HTTP client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._clients[loop] = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Auth-Token": self.token, "Content-Type": "application/json"},
+                limits=self.limits,
+                http2=self.http2,
+                verify=True,
+            )
+        return client
+
+    @staticmethod
+    def get_endpoint(path: str) -> str:
+        """Return the name of an endpoint, the last segment of its path.
+
+        :param path: The path of the endpoint, e.g. ``/hemago/get_products/``
+        :return: The name, e.g. ``get_products``
+        """
+        return path.strip("/").rsplit("/", 1)[-1]
+
+    def get_timeout(self, path: str) -> float:
+        """Return the timeout of an endpoint.
+
+        :param path: The path of the endpoint, e.g. ``/hemago/get_products/``
+        :return: The timeout in seconds
+        """
+        return self.timeouts.get(self.get_endpoint(path), self.timeout)
+
+    def get_breaker(self, path: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint.
+
+        :param path: The path of the endpoint
+        :return: The circuit breaker
+        """
+        endpoint = self.get_endpoint(path)
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(**self.breaker)
+        return breaker
+
+    async def request(
+        self, method: str, path: str, data: Dict[str, Any] = None
+    ) -> httpx.Response:
+        """Send a request to Odoo, with the data as a JSON body.
+
+        :param method: The HTTP method
+        :param path: The path of the endpoint
+        :param data: The data sent as JSON, also on GET requests as Odoo expects it
+        :return: The response
+        :raises OdooUnavailableError: When the circuit of the endpoint is open or its
+            limit of calls in flight is reached
+        """
+        endpoint = self.get_endpoint(path)
+        breaker = self.get_breaker(path)
+        limit = self.concurrency.get(endpoint, self.max_concurrency)
+        timeout = httpx.Timeout(self.get_timeout(path), connect=self.connect_timeout)
+        content = json.dumps(data) if data is not None else None
+        retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            if limit and self._in_flight[endpoint] >= limit:
+                self._throttled[endpoint] += 1
+                raise OdooUnavailableError(
+                    "Demasiadas solicitudes a Odoo, intente más tarde"
+                )
+            if not breaker.allow():
+                raise OdooUnavailableError("Odoo no está disponible, intente más tarde")
+            self._in_flight[endpoint] += 1
+            try:
+                response = await self.client.request(
+                    method, path, content=content, timeout=timeout
+                )
+            except httpx.TransportError as e:
+                breaker.record(False)
+                if attempt >= (
+                    self.retries if isinstance(e, CONNECT_ERRORS) else retries
+                ):
+                    raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record(response.status_code < 500)
+                if attempt >= retries or response.status_code not in RETRY_STATUSES:
+                    return response
+            finally:
+                self._in_flight[endpoint] -= 1
+            self._retried[endpoint] += 1
+            await asyncio.sleep(random.uniform(0, self.retry_backoff * 2**attempt))
+            attempt += 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the circuit, the calls in flight, retried and throttled per endpoint."""
+        return {
+            endpoint: {
+                **breaker.stats(),
+                "in_flight": self._in_flight[endpoint],
+                "retried": self._retried[endpoint],
+                "throttled": self._throttled[endpoint],
+            }
+            for endpoint, breaker in self._breakers.items()
+        }
+
+    async def get(self, path: str, data: Dict[str, Any] = None) -> httpx.Response:
+        """Send a GET request to Odoo."""
+        return await self.request("GET", path, data)
+
+    async def post(self, path: str, data: Dict[str, Any] = None) -> httpx.Response:
+        """Send a POST request to Odoo."""
+        return await self.request("POST", path, data)
+
+    async def aclose(self):
+        """Close the HTTP client of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
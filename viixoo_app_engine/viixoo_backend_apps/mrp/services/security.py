@@ -1,18 +1,32 @@
 """This module contains functions for managing application security, including the creation and verification of JWT tokens."""
 
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any
-import secrets
+from typing import Any, Dict, Tuple
+import hashlib
+import os
+import threading
+import time
 
 import jwt
 from passlib.context import CryptContext
-
+from .keys import SigningKey, key_provider_from_env
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 ALGORITHM = "HS256"
-SECRET_KEY: str = secrets.token_urlsafe(32)
+# Keys shared by every worker, see keys.key_provider_from_env
+key_provider = key_provider_from_env()
+
+# Payloads of the tokens already verified, keyed by the digest of the token, with the
+# key that verified them
+PAYLOAD_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", 4096))
+PAYLOAD_CACHE_TTL = float(os.getenv("JWT_CACHE_TTL", 300))
+_payload_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float, SigningKey]]" = (
+    OrderedDict()
+)
+_payload_lock = threading.Lock()
 
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
@@ -25,7 +39,10 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     """
     expire = datetime.now(timezone.utc) + expires_delta
     to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    key = key_provider.current()
+    encoded_jwt = jwt.encode(
+        to_encode, key.secret, algorithm=ALGORITHM, headers={"kid": key.kid}
+    )
     return encoded_jwt
 
 
@@ -51,10 +68,47 @@ def get_password_hash(password: str) -> str:
 
 
 def get_payload(token):
-    """Get payload."""
+    """Get payload.
+
+    The token is verified with the key of its ``kid`` header. The payloads of the
+    valid tokens are cached for ``PAYLOAD_CACHE_TTL`` seconds at
+    most, and never after the ``exp`` claim of the token. A cached payload is
+    dropped as soon as its key is no longer valid, e.g. past its rotation grace.
+    """
+    if not token:
+        return False
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _payload_lock:
+        cached = _payload_cache.get(key)
+    if cached is not None:
+        payload, expires_at, cached_key = cached
+        if now < expires_at and key_provider.get(cached_key.kid) == cached_key:
+            with _payload_lock:
+                if key in _payload_cache:
+                    _payload_cache.move_to_end(key)
+            return payload
+        with _payload_lock:
+            _payload_cache.pop(key, None)
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        signing_key = key_provider.get(jwt.get_unverified_header(token).get("kid"))
+        if signing_key is None:
+            return False
+        payload = jwt.decode(token, signing_key.secret, algorithms=[ALGORITHM])
     except Exception:
         return False
     else:
+        expires_at = now + PAYLOAD_CACHE_TTL
+        if isinstance(payload.get("exp"), (int, float)):
+            expires_at = min(expires_at, payload["exp"])
+        with _payload_lock:
+            _payload_cache[key] = (payload, expires_at, signing_key)
+            while len(_payload_cache) > PAYLOAD_CACHE_SIZE:
+                _payload_cache.popitem(last=False)
         return payload
+
+
+def clear_payload_cache():
+    """Forget the payloads of the tokens already verified, e.g. when the keys change."""
+    with _payload_lock:
+        _payload_cache.clear()
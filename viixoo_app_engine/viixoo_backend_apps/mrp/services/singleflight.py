@@ -0,0 +1,49 @@
+"""Coalescing of identical concurrent calls to Odoo."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run one call per key at a time, sharing its result with every caller.
+
+    While a call is in flight, the callers asking for the same key wait for it
+    instead of starting their own. Its result, or its error, is given to all of them.
+    """
+
+    def __init__(self):
+        """Initialize a SingleFlight instance."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn``, or wait for the call in flight of the same key.
+
+        :param key: The key identifying identical calls
+        :param fn: A coroutine function making the call
+        :return: The result of the call
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.shared += 1
+        # A caller cancelled must not cancel the call the others wait for
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        """Remove a finished call, so the next caller starts a new one."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of calls made, of calls saved and of calls in flight."""
+        return {
+            "calls": self.calls,
+            "saved": self.shared,
+            "in_flight": len(self._calls),
+        }
@@ -1,7 +1,13 @@
 """Unit testing module for MRP service endpoints."""
 
+import asyncio
+import configparser
+import os
+import tempfile
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+import httpx
 from fastapi.testclient import TestClient
 from viixoo_core.app import app
 from datetime import timedelta
@@ -9,6 +15,16 @@ import json
 import random
 import string
 from mrp.services import security
+from mrp.services import mrp_service
+from mrp.services.cache import TTLCache
+from mrp.services.breaker import CircuitBreaker
+from mrp.services.odoo_client import OdooClient, OdooUnavailableError
+from mrp.services.singleflight import SingleFlight
+from mrp.services.events import EventHub
+from mrp.services import keys
+from mrp.models.fieldsets import fieldset_model
+from mrp.models.models import User
+from mrp.services.keys import FileKeyProvider, KeyProvider, KeySet, SigningKey
 from fastapi import HTTPException
 
 client = TestClient(app)
@@ -19,6 +35,11 @@ class TestMrpEndpoints(unittest.TestCase):
 
     def setUp(self):
         """Set initial data for testing."""
+        mrp_service.reference_cache.purge()
+        mrp_service.workorder_snapshots.purge()
+        mrp_service.response_cache.purge()
+        mrp_service.profile_cache.purge()
+        security.clear_payload_cache()
         self.valid_token = security.create_access_token(
             1, expires_delta=timedelta(minutes=600)
         )
@@ -51,7 +72,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "wororderblock_ids": [],
         }
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     def test_authenticate_user_success(self, mock_post):
         """Tests successful authentication of a user."""
         mock_response = type("MockResponse", (), {"text": '{"employee": {"id": 1}}'})
@@ -64,7 +85,7 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn("access_token", response.json())
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     def test_authenticate_user_invalid_credentials(self, mock_post):
         """Tests for failed authentication due to invalid credentials."""
         mock_post.side_effect = HTTPException(
@@ -78,7 +99,36 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertIn("Usuario o contraseña incorrecto", response.json()["detail"])
 
-    @patch("requests.get")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
+    def test_authenticate_user_odoo_unavailable(self, mock_post):
+        """Tests a login refused by the circuit breaker is answered with a 503 error."""
+        mock_post.side_effect = OdooUnavailableError(
+            "Odoo no está disponible, intente más tarde"
+        )
+
+        response = client.post(
+            "/login/access-token", data={"username": "test", "password": "valid"}
+        )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(
+            response.json()["detail"], "Odoo no está disponible, intente más tarde"
+        )
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_products_odoo_unavailable(self, mock_get):
+        """Tests the products refused by the circuit breaker give a 503 error."""
+        mock_get.side_effect = OdooUnavailableError(
+            "Odoo no está disponible, intente más tarde"
+        )
+
+        response = client.get(
+            "/products/", headers={"Authorization": f"Bearer {self.valid_token}"}
+        )
+
+        self.assertEqual(response.status_code, 503)
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
     def test_get_user_success(self, mock_get):
         """Tests to obtain information from the authenticated user."""
         mock_get.return_value.text = (
@@ -92,7 +142,57 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["full_name"], "Test User")
 
-    @patch("requests.get")
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
+    def test_get_user_cached_at_login(self, mock_post, mock_get):
+        """Tests that the profile returned at login is served without calling Odoo."""
+        mock_post.return_value.text = json.dumps(
+            {"employee": {"id": 1, "name": "Test User", "email": "test@example.com"}}
+        )
+        token = client.post(
+            "/login/access-token", data={"username": "test", "password": "valid"}
+        ).json()["access_token"]
+
+        response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["full_name"], "Test User")
+        mock_get.assert_not_called()
+
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_user_refreshed_after_password_reset(self, mock_get, mock_post):
+        """Tests that the cached profile is reloaded after a password reset."""
+        mock_get.return_value.text = (
+            '{"employee": {"name": "Test User", "email": "test@example.com"}}'
+        )
+        mock_post.return_value.text = json.dumps({"status": "success"})
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+
+        client.get("/users/me", headers=headers)
+        client.get("/users/me", headers=headers)
+        self.assertEqual(mock_get.call_count, 1)
+
+        client.patch(
+            "/users/me/password",
+            headers=headers,
+            json={
+                "new_password": self.generate_test_password(),
+                "current_password": self.generate_test_password(),
+            },
+        )
+        client.get("/users/me", headers=headers)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_profile_purged_by_other_worker(self):
+        """Tests a profile purge received on the channel empties the cache."""
+        mrp_service.profile_cache.set("1", "cached")
+
+        mrp_service.event_channel._deliver("profile", {"sub": "1"})
+
+        self.assertEqual(len(mrp_service.profile_cache), 0)
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
     def test_get_production_orders(self, mock_get):
         """Tests to obtain information from the production order."""
         mock_data = {
@@ -113,7 +213,7 @@ class TestMrpEndpoints(unittest.TestCase):
             ],
             "count": 1,
         }
-        mock_get.return_value.text = json.dumps(mock_data)
+        mock_get.return_value.content = json.dumps(mock_data).encode()
 
         response = client.get(
             "/production-orders/?skip=0&limit=3&order_search=&show_all_state=false",
@@ -133,7 +233,7 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 403)
         self.assertIn("Usuario no autenticado", response.json()["detail"])
 
-    @patch("requests.get")
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
     def test_get_workorders(self, mock_get):
         """Tests to obtain information from the workorder."""
         mock_data = {
@@ -141,7 +241,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "workorder_ids": [self.work_order],
             "count": 1,
         }
-        mock_get.return_value.text = json.dumps(mock_data)
+        mock_get.return_value.content = json.dumps(mock_data).encode()
 
         response = client.get(
             "/work-orders/?skip=0&limit=3&order_search=&show_all_state=false",
@@ -152,7 +252,7 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(len(response.json()["data"]), 1)
         self.assertEqual(response.json()["count"], 1)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_start_workorder_success(self, mock_jwt_decode, mock_post):
         """Tests start work order success."""
@@ -172,7 +272,31 @@ class TestMrpEndpoints(unittest.TestCase):
             "Orden de trabajo iniciada satisfactoriamente",
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
+    def test_start_workorder_published(self, mock_post):
+        """Tests a work order started is published to the subscribers."""
+        mock_post.return_value.text = json.dumps({"status": "success"})
+        queue = mrp_service.workorder_events.subscribe()
+        self.addCleanup(mrp_service.workorder_events.unsubscribe, queue)
+
+        client.patch(
+            "/workorder/start",
+            headers={"Authorization": f"Bearer {self.valid_token}"},
+            json={"workorder_id": 7},
+        )
+
+        message = queue.get_nowait().decode()
+        self.assertIn("event: workorder\n", message)
+        self.assertIn('"action":"start"', message)
+        self.assertIn('"workorder_id":7', message)
+
+    def test_workorder_events_unauthenticated(self):
+        """Tests the events stream requires a valid token."""
+        response = client.get("/work-orders/events", params={"access_token": "x"})
+
+        self.assertEqual(response.status_code, 403)
+
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_start_workorder_odoo_failure(self, mock_jwt_decode, mock_post):
         """Tests start work order failure."""
@@ -188,7 +312,7 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_pause_workorder_success(self, mock_jwt_decode, mock_post):
         """Tests pause work order success."""
@@ -208,7 +332,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "Orden de trabajo pausada satisfactoriamente",
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_pause_workorder_odoo_failure(self, mock_jwt_decode, mock_post):
         """Test pause work order failure."""
@@ -224,7 +348,7 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_finish_workorder_success(self, mock_jwt_decode, mock_post):
         """Test finish work order success."""
@@ -244,7 +368,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "Orden de trabajo finalizada satisfactoriamente",
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_finish_workorder_success_production_to_closed(
         self, mock_jwt_decode, mock_post
@@ -268,7 +392,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "La orden de fabricación permanece en Por cerrar pendiente del número de serie/lote.",
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_finish_workorder_odoo_failure(self, mock_jwt_decode, mock_post):
         """Test finish work order failure."""
@@ -284,7 +408,7 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_unblock_workorder_success(self, mock_jwt_decode, mock_post):
         """Test unblock work order success."""
@@ -304,7 +428,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "Orden de trabajo desbloqueada satisfactoriamente",
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_unblock_workorder_odoo_failure(self, mock_jwt_decode, mock_post):
         """Test unblock work order failure."""
@@ -320,7 +444,7 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_block_workorder_success(self, mock_jwt_decode, mock_post):
         """Test block work order success."""
@@ -340,7 +464,7 @@ class TestMrpEndpoints(unittest.TestCase):
             "Orden de trabajo bloqueada satisfactoriamente",
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_block_workorder_odoo_failure(self, mock_jwt_decode, mock_post):
         """Test block work order failure."""
@@ -356,7 +480,204 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
-    @patch("requests.get")
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_workorders_fields(self, mock_get):
+        """Tests the work orders are restricted to the fields requested."""
+        mock_get.return_value.content = json.dumps(
+            {"status": "success", "workorder_ids": [self.work_order], "count": 1}
+        ).encode()
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+
+        response = client.get(
+            "/work-orders/",
+            params={"order_search": "", "fields": "state,name"},
+            headers=headers,
+        )
+        unknown = client.get(
+            "/work-orders/",
+            params={"order_search": "", "fields": "state,unknown"},
+            headers=headers,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["data"],
+            [{"workorder_id": 1, "name": "op1", "state": "ready"}],
+        )
+        self.assertEqual(
+            mock_get.await_args.args[1]["fields"], ["workorder_id", "name", "state"]
+        )
+        self.assertEqual(unknown.status_code, 422)
+        mock_get.assert_awaited_once()
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_workorders_etag(self, mock_get):
+        """Tests an unchanged listing is answered with a 304 and rendered once."""
+        mock_get.return_value.content = json.dumps(
+            {"status": "success", "workorder_ids": [self.work_order], "count": 1}
+        ).encode()
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        params = {"order_search": ""}
+
+        first = client.get("/work-orders/", params=params, headers=headers)
+        etag = first.headers["ETag"]
+        with patch.object(mrp_service, "loads") as mock_loads:
+            cached = client.get(
+                "/work-orders/",
+                params=params,
+                headers=dict(headers, **{"If-None-Match": etag}),
+            )
+            stale = client.get(
+                "/work-orders/",
+                params=params,
+                headers=dict(headers, **{"If-None-Match": '"other"'}),
+            )
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.headers["ETag"], etag)
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(stale.content, first.content)
+        mock_loads.assert_not_called()
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_products_etag(self, mock_get):
+        """Tests the products answer a 304 while the cached catalog is the same."""
+        mock_get.return_value.text = json.dumps(
+            {"status": "success", "product_ids": [{"value": 1, "label": "test"}]}
+        )
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+
+        first = client.get("/products/", headers=headers)
+        cached = client.get(
+            "/products/",
+            headers=dict(headers, **{"If-None-Match": first.headers["ETag"]}),
+        )
+
+        self.assertEqual(cached.status_code, 304)
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_workorders_delta(self, mock_get):
+        """Tests the delta returns only the work orders changed and removed."""
+        second = dict(self.work_order, workorder_id=2)
+        third = dict(self.work_order, workorder_id=3)
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        mock_get.return_value.content = json.dumps(
+            {
+                "status": "success",
+                "workorder_ids": [self.work_order, second],
+                "count": 2,
+            }
+        ).encode()
+        first = client.get(
+            "/work-orders/delta", params={"order_search": ""}, headers=headers
+        ).json()
+
+        changed = dict(self.work_order, state="progress")
+        mock_get.return_value.content = json.dumps(
+            {"status": "success", "workorder_ids": [changed, third], "count": 2}
+        ).encode()
+        delta = client.get(
+            "/work-orders/delta",
+            params={"order_search": "", "sync_token": first["sync_token"]},
+            headers=headers,
+        ).json()
+        unchanged = client.get(
+            "/work-orders/delta",
+            params={"order_search": "", "sync_token": delta["sync_token"]},
+            headers=headers,
+        ).json()
+
+        self.assertTrue(first["full"])
+        self.assertEqual(len(first["data"]), 2)
+        self.assertFalse(delta["full"])
+        self.assertEqual([w["workorder_id"] for w in delta["data"]], [1, 3])
+        self.assertEqual(delta["data"][0]["state"], "progress")
+        self.assertEqual(delta["removed"], [2])
+        self.assertEqual(unchanged["data"], [])
+        self.assertEqual(unchanged["sync_token"], delta["sync_token"])
+
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
+    def test_batch_workorder(self, mock_post):
+        """Tests a batch returns the result of each transition, in order."""
+
+        async def post(path, data):
+            if data["workorder_id"] == 2:
+                raise HTTPException(status_code=400, detail="Orden no encontrada")
+            return type("MockResponse", (), {"text": '{"status": "success"}'})
+
+        mock_post.side_effect = post
+
+        response = client.patch(
+            "/workorder/batch",
+            headers={"Authorization": f"Bearer {self.valid_token}"},
+            json={
+                "transitions": [
+                    {"action": "start", "workorder_id": 1},
+                    {"action": "pause", "workorder_id": 2},
+                    {"action": "block", "workorder_id": 3, "loss_id": 1},
+                    {"action": "block", "workorder_id": 4},
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["data"]
+        self.assertEqual([r["status_code"] for r in results], [200, 400, 200, 422])
+        self.assertEqual(
+            results[0]["message"], "Orden de trabajo iniciada satisfactoriamente"
+        )
+        self.assertEqual(
+            [call.args[0] for call in mock_post.await_args_list],
+            [
+                "/hemago/start_workorder/",
+                "/hemago/pause_workorder/",
+                "/hemago/block_workorder/",
+            ],
+        )
+
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
+    def test_batch_workorder_same_order(self, mock_post):
+        """Tests the transitions of one work order are applied in order."""
+        running = set()
+        calls = []
+
+        async def post(path, data):
+            self.assertNotIn(data["workorder_id"], running)
+            running.add(data["workorder_id"])
+            await asyncio.sleep(0.01)
+            running.discard(data["workorder_id"])
+            calls.append((path, data["workorder_id"]))
+            return type("MockResponse", (), {"text": '{"status": "success"}'})
+
+        mock_post.side_effect = post
+
+        response = client.patch(
+            "/workorder/batch",
+            headers={"Authorization": f"Bearer {self.valid_token}"},
+            json={
+                "transitions": [
+                    {"action": "start", "workorder_id": 1},
+                    {"action": "start", "workorder_id": 2},
+                    {"action": "pause", "workorder_id": 1},
+                    {"action": "finish", "workorder_id": 1},
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["data"]
+        self.assertEqual([r["status_code"] for r in results], [200, 200, 200, 200])
+        self.assertEqual(
+            [path for path, workorder_id in calls if workorder_id == 1],
+            [
+                "/hemago/start_workorder/",
+                "/hemago/pause_workorder/",
+                "/hemago/finish_workorder/",
+            ],
+        )
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
     def test_get_reasons_loss(self, mock_get):
         """Test to obtain information from the reasons loss."""
         mock_data = {
@@ -372,7 +693,7 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()["data"]), 1)
 
-    @patch("requests.get")
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
     def test_get_products(self, mock_get):
         """Test to obtain information from the products."""
         mock_data = {
@@ -388,7 +709,63 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()["data"]), 1)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_products_cached(self, mock_get):
+        """Test the products are read from Odoo once and then served from the cache."""
+        mock_data = {
+            "status": "success",
+            "product_ids": [{"value": 1, "label": "product test"}],
+        }
+        mock_get.return_value.text = json.dumps(mock_data)
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+
+        first = client.get("/products/", headers=headers)
+        second = client.get("/products/", headers=headers)
+
+        self.assertEqual(first.json(), second.json())
+        mock_get.assert_awaited_once()
+
+    @patch.object(mrp_service, "ADMIN_TOKEN", "admin")
+    def test_get_metrics(self):
+        """Test the metrics require the admin token."""
+        denied = client.get("/metrics/")
+        response = client.get("/metrics/", headers={"Auth-Token": "admin"})
+
+        self.assertEqual(denied.status_code, 403)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("saved", response.json()["singleflight"])
+        self.assertIn("odoo", response.json())
+
+    @patch.object(OdooClient, "get", new_callable=AsyncMock)
+    def test_get_workorders_odoo_unavailable(self, mock_get):
+        """Tests a call refused by the circuit breaker is answered with a 503 error."""
+        mock_get.side_effect = OdooUnavailableError(
+            "Odoo no está disponible, intente más tarde"
+        )
+
+        response = client.get(
+            "/work-orders/",
+            params={"order_search": ""},
+            headers={"Authorization": f"Bearer {self.valid_token}"},
+        )
+
+        self.assertEqual(response.status_code, 503)
+
+    @patch.object(mrp_service, "ADMIN_TOKEN", "admin")
+    def test_purge_cache(self):
+        """Test the cache purge requires the admin token."""
+        mrp_service.reference_cache.set("products", "cached")
+
+        denied = client.delete("/cache/", headers={"Auth-Token": "wrong"})
+        response = client.delete(
+            "/cache/", params={"name": "products"}, headers={"Auth-Token": "admin"}
+        )
+
+        self.assertEqual(denied.status_code, 403)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mrp_service.reference_cache), 0)
+
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_reset_password_failure(self, mock_jwt_decode, mock_post):
         """Test reset password failure."""
@@ -407,7 +784,7 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 403)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_reset_password_success(self, mock_jwt_decode, mock_post):
         """Test reset password success."""
@@ -434,7 +811,7 @@ class TestMrpEndpoints(unittest.TestCase):
         password = "".join(random.choice(characters) for _ in range(15))
         return password
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_consume_component_failure(self, mock_jwt_decode, mock_post):
         """Test consume components failure."""
@@ -453,7 +830,7 @@ class TestMrpEndpoints(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 403)
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_consume_component_success(self, mock_jwt_decode, mock_post):
         """Test consume component success."""
@@ -474,7 +851,7 @@ class TestMrpEndpoints(unittest.TestCase):
             response.json().get("message"), "Componente consumido satisfactoriamente"
         )
 
-    @patch("requests.post")
+    @patch.object(OdooClient, "post", new_callable=AsyncMock)
     @patch("jwt.decode")
     def test_add_component_failure(self, mock_jwt_decode, mock_post):
         """Test add components failure."""
@@ -495,5 +872,435 @@ class TestMrpEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 403)
 
 
+class TestTTLCache(unittest.TestCase):
+    """Test class for the reference data cache."""
+
+    def test_stale_while_revalidate(self):
+        """Tests a stale value is served while it is refreshed in the background."""
+        cache = TTLCache(ttl=0, stale_ttl=60)
+        loader = AsyncMock(side_effect=["old", "new"])
+
+        async def read():
+            first = await cache.get("key", loader)
+            stale = await cache.get("key", loader)
+            await asyncio.gather(*cache._tasks)
+            return first, stale, cache._entries["key"][0]
+
+        first, stale, refreshed = asyncio.run(read())
+
+        self.assertEqual((first, stale, refreshed), ("old", "old", "new"))
+        self.assertEqual(loader.await_count, 2)
+
+    def test_cold_key_loaded_once(self):
+        """Tests concurrent reads of a cold key share one call to the loader."""
+        cache = TTLCache()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            return "products"
+
+        loader = AsyncMock(side_effect=load)
+
+        async def read():
+            return await asyncio.gather(*(cache.get("key", loader) for _ in range(10)))
+
+        values = asyncio.run(read())
+
+        self.assertEqual(values, ["products"] * 10)
+        loader.assert_awaited_once()
+
+    def test_expired_and_maxsize(self):
+        """Tests expired values are reloaded and the least recently used key evicted."""
+        cache = TTLCache(ttl=0, stale_ttl=0, maxsize=2)
+        loader = AsyncMock(side_effect=[1, 2, 3, 4])
+
+        async def read():
+            await cache.get("a", loader)
+            await cache.get("a", loader)
+            await cache.get("b", loader)
+            await cache.get("c", loader)
+
+        asyncio.run(read())
+
+        self.assertEqual(loader.await_count, 4)
+        self.assertEqual(list(cache._entries), ["b", "c"])
+
+
+class TestPayloadCache(unittest.TestCase):
+    """Test class for the cache of the verified tokens."""
+
+    def setUp(self):
+        """Clear the cache of the verified tokens."""
+        security.clear_payload_cache()
+
+    def test_payload_cached(self):
+        """Tests a token is verified once while it is cached."""
+        token = security.create_access_token(1, expires_delta=timedelta(minutes=5))
+
+        with patch("jwt.decode", wraps=security.jwt.decode) as mock_decode:
+            first = security.get_payload(token)
+            second = security.get_payload(token)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["sub"], "1")
+        mock_decode.assert_called_once()
+
+    def test_expired_not_cached(self):
+        """Tests a cached payload is not returned after the exp claim."""
+        token = security.create_access_token(1, expires_delta=timedelta(minutes=5))
+        payload = security.get_payload(token)
+
+        with patch("time.time", return_value=payload["exp"] + 1), patch(
+            "jwt.decode", side_effect=security.jwt.ExpiredSignatureError
+        ):
+            self.assertFalse(security.get_payload(token))
+        self.assertFalse(security.get_payload("invalid"))
+
+
+class TestKeyProvider(unittest.TestCase):
+    """Test class for the keys signing the access tokens."""
+
+    def setUp(self):
+        """Clear the cache of the verified tokens."""
+        security.clear_payload_cache()
+
+    def test_rotation(self):
+        """Tests a retired key verifies its tokens only during the grace window."""
+        old = SigningKey("old", "old-secret")
+        provider = KeyProvider({"old": old}, "old", grace=60)
+        with patch.object(security, "key_provider", provider):
+            token = security.create_access_token(1, timedelta(minutes=5))
+            provider.keyset = KeySet.create(
+                {
+                    "new": SigningKey("new", "new-secret"),
+                    "old": old._replace(retired_at=time.time()),
+                },
+                "new",
+            )
+            new_token = security.create_access_token(2, timedelta(minutes=5))
+
+            self.assertEqual(security.jwt.get_unverified_header(token)["kid"], "old")
+            self.assertEqual(security.get_payload(token)["sub"], "1")
+            self.assertEqual(security.get_payload(new_token)["sub"], "2")
+            # The payload cached for the old key is dropped past the grace window
+            with patch("time.time", return_value=time.time() + 120):
+                self.assertFalse(security.get_payload(token))
+
+    def test_file_reloaded(self):
+        """Tests the keys of a file are reloaded when it changes."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"current": "a", "keys": {"a": {"secret": "s1"}}}, f)
+        self.addCleanup(os.remove, f.name)
+        provider = FileKeyProvider(f.name, grace=0, check_interval=0)
+
+        with open(f.name, "w") as keys_file:
+            json.dump(
+                {
+                    "current": "b",
+                    "keys": {"a": {"secret": "s1"}, "b": {"secret": "s2"}},
+                },
+                keys_file,
+            )
+        os.utime(f.name, (time.time() + 10, time.time() + 10))
+
+        self.assertEqual(provider.current(), SigningKey("b", "s2"))
+        self.assertIsNone(provider.get("unknown"))
+
+    def test_from_env(self):
+        """Tests the keys given in the environment, the first one signing."""
+        with patch.dict(os.environ, {"JWT_KEYS": "k2:second, k1:first"}, clear=True):
+            provider = keys.key_provider_from_env()
+
+        self.assertEqual(provider.current(), SigningKey("k2", "second"))
+        self.assertEqual(provider.get("k1").secret, "first")
+
+    def test_from_env_invalid(self):
+        """Tests an entry of JWT_KEYS without a key id is reported by its position."""
+        with patch.dict(os.environ, {"JWT_KEYS": "k1:first,hunter2"}, clear=True):
+            with self.assertRaises(ValueError) as error:
+                keys.key_provider_from_env()
+
+        self.assertIn("entry 2", str(error.exception))
+        self.assertNotIn("hunter2", str(error.exception))
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test class for the coalescing of identical calls to Odoo."""
+
+    def test_concurrent_calls_coalesced(self):
+        """Tests concurrent calls with the same key share one call."""
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        async def read():
+            return await asyncio.gather(
+                flight.do("a", lambda: fetch("a")),
+                flight.do("a", lambda: fetch("a")),
+                flight.do("b", lambda: fetch("b")),
+            )
+
+        results = asyncio.run(read())
+
+        self.assertEqual(results, ["a", "a", "b"])
+        self.assertEqual(calls, ["a", "b"])
+        self.assertEqual(flight.stats(), {"calls": 2, "saved": 1, "in_flight": 0})
+
+    def test_error_shared(self):
+        """Tests the error of a call is raised to every caller and not kept."""
+        flight = SingleFlight()
+        fetch = AsyncMock(side_effect=[HTTPException(status_code=400), "ok"])
+
+        async def read():
+            results = await asyncio.gather(
+                flight.do("a", fetch), flight.do("a", fetch), return_exceptions=True
+            )
+            return results, await flight.do("a", fetch)
+
+        results, retried = asyncio.run(read())
+
+        self.assertTrue(all(isinstance(r, HTTPException) for r in results))
+        self.assertEqual(retried, "ok")
+
+
+class TestEventHub(unittest.TestCase):
+    """Test class for the fan-out of the work order events."""
+
+    def test_stream(self):
+        """Tests every subscriber receives the events, and pings while idle."""
+        hub = EventHub()
+
+        async def read():
+            streams = [hub.stream(heartbeat=0.01) for _ in range(3)]
+            for stream in streams:
+                await anext(stream)
+            hub.publish("workorder", {"workorder_id": 1})
+            events = [await anext(stream) for stream in streams]
+            ping = await anext(streams[0])
+            for stream in streams:
+                await stream.aclose()
+            return events, ping
+
+        events, ping = asyncio.run(read())
+
+        self.assertEqual(
+            events, [b'id: 1\nevent: workorder\ndata: {"workorder_id":1}\n\n'] * 3
+        )
+        self.assertEqual(ping, b": ping\n\n")
+        self.assertEqual(len(hub), 0)
+
+    def test_slow_subscriber(self):
+        """Tests the oldest event of a full queue is dropped."""
+        hub = EventHub(queue_size=2)
+        queue = hub.subscribe()
+
+        for workorder_id in range(3):
+            hub.publish("workorder", {"workorder_id": workorder_id})
+
+        self.assertEqual(queue.qsize(), 2)
+        self.assertIn(b'"workorder_id":1', queue.get_nowait())
+        self.assertEqual(hub.dropped, 1)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test class for the circuit breaker of the Odoo endpoints."""
+
+    def test_opens_on_failure_rate(self):
+        """Tests the circuit opens once the failure rate of the window is reached."""
+        breaker = CircuitBreaker(window=4, min_calls=4, failure_rate=0.5)
+
+        for success in (True, True, False):
+            self.assertTrue(breaker.allow())
+            breaker.record(success)
+        self.assertEqual(breaker.state, "closed")
+        breaker.allow()
+        breaker.record(False)
+
+        self.assertEqual(breaker.state, "open")
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.stats()["rejected"], 1)
+
+    def test_half_open_probe(self):
+        """Tests a single probe is let through after the open delay."""
+        breaker = CircuitBreaker(min_calls=1, open_for=10)
+        breaker.allow()
+        breaker.record(False)
+
+        with patch("time.monotonic", return_value=time.monotonic() + 11):
+            self.assertEqual(breaker.state, "half_open")
+            self.assertTrue(breaker.allow())
+            self.assertFalse(breaker.allow())
+            breaker.record(True)
+            self.assertEqual(breaker.state, "closed")
+
+    def test_failed_probe_reopens(self):
+        """Tests a failed probe opens the circuit again."""
+        breaker = CircuitBreaker(min_calls=1, open_for=10)
+        breaker.allow()
+        breaker.record(False)
+
+        with patch("time.monotonic", return_value=time.monotonic() + 11):
+            breaker.allow()
+            breaker.record(False)
+            self.assertEqual(breaker.state, "open")
+        self.assertEqual(breaker.opened, 2)
+
+
+class TestOdooClient(unittest.TestCase):
+    """Test class for the shared Odoo HTTP client."""
+
+    def test_timeouts_from_config(self):
+        """Tests the per-endpoint timeouts and pool limits read from the config."""
+        config = configparser.ConfigParser()
+        config.read_dict(
+            {
+                "settings_odoo": {
+                    "url_odoo": "http://odoo",
+                    "timeout": "20",
+                    "max_connections": "5",
+                },
+                "odoo_timeouts": {"get_products": "3"},
+            }
+        )
+
+        odoo = OdooClient.from_config(config, "token")
+
+        self.assertEqual(odoo.get_timeout("/hemago/get_products/"), 3)
+        self.assertEqual(odoo.get_timeout("/hemago/get_workorder/"), 20)
+        self.assertEqual(odoo.limits.max_connections, 5)
+
+    def test_client_reused(self):
+        """Tests the requests of an event loop share one client sending JSON bodies."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"status": "success"})
+
+        odoo = OdooClient("http://odoo", token="token", timeouts={"get_products": 3})
+
+        async def send():
+            odoo._clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+                base_url=odoo.base_url,
+                headers={"Auth-Token": odoo.token},
+                transport=httpx.MockTransport(handler),
+            )
+            first = odoo.client
+            await odoo.get("/hemago/get_products/", {"limit": 1})
+            await odoo.post("/hemago/start_workorder/")
+            self.assertIs(odoo.client, first)
+            await odoo.aclose()
+
+        asyncio.run(send())
+
+        self.assertEqual([r.method for r in requests], ["GET", "POST"])
+        self.assertEqual(json.loads(requests[0].content), {"limit": 1})
+        self.assertEqual(requests[0].headers["Auth-Token"], "token")
+        self.assertEqual(requests[0].extensions["timeout"]["read"], 3)
+
+    def send(self, odoo, handler, method, path):
+        """Send a request with a mock transport, returning the response or the error."""
+
+        async def send():
+            odoo._clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+                base_url=odoo.base_url, transport=httpx.MockTransport(handler)
+            )
+            try:
+                return await odoo.request(method, path)
+            except Exception as e:
+                return e
+            finally:
+                await odoo.aclose()
+
+        return asyncio.run(send())
+
+    def test_idempotent_request_retried(self):
+        """Tests a GET failing with a 503 error is retried, a POST is not."""
+        statuses = [503, 503, 200]
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(statuses.pop(0))
+
+        odoo = OdooClient("http://odoo", retries=2, retry_backoff=0)
+
+        response = self.send(odoo, handler, "GET", "/hemago/get_workorder/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(methods, ["GET"] * 3)
+        self.assertEqual(odoo.stats()["get_workorder"]["retried"], 2)
+
+        statuses[:] = [503, 200]
+        response = self.send(odoo, handler, "POST", "/hemago/start_workorder/")
+        self.assertEqual(response.status_code, 503)
+
+    def test_circuit_opens(self):
+        """Tests the calls are refused without reaching Odoo once the circuit opens."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        odoo = OdooClient(
+            "http://odoo", retries=0, breaker={"min_calls": 2, "open_for": 60}
+        )
+
+        for _ in range(2):
+            error = self.send(odoo, handler, "GET", "/hemago/get_products/")
+            self.assertIsInstance(error, httpx.ReadTimeout)
+        error = self.send(odoo, handler, "GET", "/hemago/get_products/")
+
+        self.assertIsInstance(error, OdooUnavailableError)
+        self.assertEqual(error.status_code, 503)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(odoo.stats()["get_products"]["state"], "open")
+
+    def test_concurrency_limit(self):
+        """Tests the calls over the limit of an endpoint are refused at once."""
+        odoo = OdooClient("http://odoo", concurrency={"get_workorder": 1})
+        release = None
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200)
+
+        async def send():
+            nonlocal release
+            release = asyncio.Event()
+            odoo._clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+                base_url=odoo.base_url, transport=httpx.MockTransport(handler)
+            )
+            first = asyncio.ensure_future(odoo.get("/hemago/get_workorder/"))
+            await asyncio.sleep(0)
+            with self.assertRaises(OdooUnavailableError):
+                await odoo.get("/hemago/get_workorder/")
+            release.set()
+            await first
+            await odoo.aclose()
+
+        asyncio.run(send())
+
+        self.assertEqual(odoo.stats()["get_workorder"]["throttled"], 1)
+        self.assertEqual(odoo.stats()["get_workorder"]["in_flight"], 0)
+
+
+class TestFieldsets(unittest.TestCase):
+    """Test the models restricted to some fields."""
+
+    def test_fields_keep_defaults_and_validators(self):
+        """Tests a sparse model keeps the defaults, constraints and validators."""
+        model = fieldset_model(User, ("full_name", "email"))
+
+        self.assertIsNone(model(full_name="Test").email)
+        self.assertIsNone(model(full_name="Test", email=False).email)
+        with self.assertRaises(ValueError):
+            model(full_name="Test", email="a" * 256)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+"""Compare the requests/second of routes using PostgresModel and AsyncPostgresModel.
+
+A FastAPI app with a sync route (run in the threadpool) and an async route is
+called in-process through httpx, ``--concurrency`` requests at a time. Needs
+``asyncpg`` (``pip install viixoo_core[async]``).
+
+Usage::
+
+    python bench_async.py --requests 2000 --concurrency 10 50 200
+"""
+
+import time
+import asyncio
+import argparse
+from contextlib import asynccontextmanager
+import httpx
+from fastapi import FastAPI
+from common import BenchModel, config, execute
+from viixoo_core.models.async_pool import close_all_async, get_async_pool
+from viixoo_core.models.async_postgres import AsyncPostgresModel
+
+
+class BenchOrder(BenchModel):
+    """Row of the async benchmark, read with the sync model."""
+
+    __tablename__ = "bench_async"
+
+    name: str
+    value: int
+
+
+class BenchAsyncOrder(AsyncPostgresModel):
+    """Row of the async benchmark, read with the async model."""
+
+    __tablename__ = "bench_async"
+
+    name: str
+    value: int
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """Get a connection from the benchmark async pool."""
+        pool = await get_async_pool("bench", config)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+
+app = FastAPI()
+
+
+@app.get("/sync/{value}")
+def read_sync(value: int):
+    """Read the orders of a value with the sync model."""
+    return BenchOrder.model_construct().search(domain=[("value", "=", value)])
+
+
+@app.get("/async/{value}")
+async def read_async(value: int):
+    """Read the orders of a value with the async model."""
+    return await BenchAsyncOrder.model_construct().search(
+        domain=[("value", "=", value)]
+    )
+
+
+async def run(path: str, requests: int, concurrency: int) -> float:
+    """Send ``requests`` requests to a route, ``concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def call(i):
+            async with semaphore:
+                response = await client.get(f"{path}/{i % 100}")
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call(i) for i in range(requests)))
+        return time.perf_counter() - start
+
+
+async def bench(args):
+    """Run every route at every concurrency level."""
+    for concurrency in args.concurrency:
+        for path in ("/sync", "/async"):
+            seconds = await run(path, args.requests, concurrency)
+            print(
+                f"{path:<8} concurrency {concurrency:>4} "
+                f"{args.requests / seconds:>10,.0f} req/s"
+            )
+    await close_all_async()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+
+    execute(
+        "CREATE TABLE IF NOT EXISTS bench_async ("
+        "id serial PRIMARY KEY, name varchar NOT NULL, value integer NOT NULL)"
+    )
+    execute(
+        "INSERT INTO bench_async (name, value) "
+        "SELECT 'Order ' || i, i % 100 FROM generate_series(1, 10000) AS i"
+    )
+    execute("CREATE INDEX IF NOT EXISTS bench_async_value ON bench_async (value)")
+    try:
+        asyncio.run(bench(args))
+    finally:
+        execute("DROP TABLE bench_async")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare query_insert with the COPY-based bulk_insert.
+
+Usage::
+
+    python bench_bulk_insert.py --rows 50000 --chunk-size 10000 --batch 1000
+"""
+
+import argparse
+from datetime import date, timedelta
+from typing import Optional
+from common import BenchModel, best_of, execute, report
+
+
+class BenchBulkInsert(BenchModel):
+    """Row of the bulk insert benchmark."""
+
+    __tablename__ = "bench_bulk_insert"
+
+    name: str
+    value: int
+    amount: Optional[float] = None
+    created: Optional[date] = None
+
+
+def make_rows(count: int):
+    """Generate the rows to insert."""
+    today = date.today()
+    return [
+        {
+            "name": f"Work order {i}",
+            "value": i,
+            "amount": i / 3 if i % 10 else None,
+            "created": today - timedelta(days=i % 365),
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    execute(
+        "CREATE TABLE IF NOT EXISTS bench_bulk_insert ("
+        "id serial PRIMARY KEY, name varchar NOT NULL, value integer NOT NULL, "
+        "amount double precision, created date)"
+    )
+    truncate = lambda: execute("TRUNCATE bench_bulk_insert")  # noqa: E731
+    rows = make_rows(args.rows)
+    model = BenchBulkInsert(name="", value=0)
+
+    def query_insert():
+        for start in range(0, len(rows), args.batch):
+            model.query_insert(rows[start : start + args.batch])
+
+    print(f"Inserting {args.rows} rows")
+    results = {
+        f"query_insert (batches of {args.batch})": query_insert,
+        "bulk_insert (COPY csv)": lambda: model.bulk_insert(
+            rows, chunk_size=args.chunk_size
+        ),
+        "bulk_insert (COPY csv, returning ids)": lambda: model.bulk_insert(
+            rows, chunk_size=args.chunk_size, returning=True
+        ),
+    }
+    for name, func in results.items():
+        report(name, best_of(func, args.repeat, setup=truncate), args.rows)
+    execute("DROP TABLE bench_bulk_insert")
+
+
+if __name__ == "__main__":
+    main()
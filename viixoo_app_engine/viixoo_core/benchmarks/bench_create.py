@@ -0,0 +1,63 @@
+"""Compare create() with the insert-then-select flow it replaced.
+
+Usage::
+
+    python bench_create.py --rows 1000 --batch 1 10 100
+"""
+
+import argparse
+from typing import Optional
+from common import BenchModel, best_of, execute, report
+
+
+class BenchCreate(BenchModel):
+    """Row of the create benchmark."""
+
+    __tablename__ = "bench_create"
+
+    name: str
+    value: int
+    state: Optional[str] = None
+
+
+def insert_then_select(model: BenchCreate, rows):
+    """Insert the rows, then read them back by id (the former create flow)."""
+    ids = [row["id"] for row in model.query_insert(rows)]
+    return model.load_model(BenchCreate, [("id", "in", ids)])
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    execute(
+        "CREATE TABLE IF NOT EXISTS bench_create ("
+        "id serial PRIMARY KEY, name varchar NOT NULL, value integer NOT NULL, "
+        "state varchar DEFAULT 'draft')"
+    )
+    truncate = lambda: execute("TRUNCATE bench_create")  # noqa: E731
+    rows = [{"name": f"Order {i}", "value": i} for i in range(args.rows)]
+    model = BenchCreate(name="", value=0)
+
+    print(f"Creating {args.rows} rows")
+    for batch in args.batch:
+        batches = [rows[start : start + batch] for start in range(0, len(rows), batch)]
+        results = {
+            f"insert + select (batches of {batch})": lambda: [
+                insert_then_select(model, chunk) for chunk in batches
+            ],
+            f"create RETURNING * (batches of {batch})": lambda: [
+                model.create(chunk) for chunk in batches
+            ],
+        }
+        for name, func in results.items():
+            report(name, best_of(func, args.repeat, setup=truncate), args.rows)
+    execute("DROP TABLE bench_create")
+
+
+if __name__ == "__main__":
+    main()
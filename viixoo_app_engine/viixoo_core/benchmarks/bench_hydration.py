@@ -0,0 +1,153 @@
+"""Compare validated and trusted hydration of rows into models.
+
+The model has the columns of ``res_partner`` declared in
+``converted_models/res_partner_pydantic.py``; the relational fields are read as
+their ids, as they come from the table. The rows are built in memory, so the
+benchmark needs no database.
+
+Usage::
+
+    python bench_hydration.py --rows 100000
+"""
+
+import time
+import argparse
+from datetime import date
+from enum import Enum
+from pydantic import Field
+from typing import Any, List, Optional
+from viixoo_core.models.postgres import PostgresModel
+
+
+class PartnerType(str, Enum):
+    """Address type of a partner."""
+
+    contact = "contact"
+    invoice = "invoice"
+    delivery = "delivery"
+    other = "other"
+
+
+class BenchPartner(PostgresModel):
+    """Contact."""
+
+    __tablename__ = "res_partner"
+    __order__ = "complete_name ASC, id DESC"
+
+    name: Optional[str]
+    complete_name: Optional[str]
+    date: Optional[date]
+    title: Optional[int]
+    parent_id: Optional[int] = Field(description="Related Company")
+    ref: Optional[str] = Field(description="Reference")
+    lang: Optional[str] = Field(description="Language")
+    tz: Optional[str] = Field(description="Timezone")
+    user_id: Optional[int] = Field(description="Salesperson")
+    vat: Optional[str] = Field(description="Tax ID")
+    company_registry: Optional[str] = Field(description="Company ID")
+    bank_ids: List[Any] = Field(description="Banks", default_factory=list)
+    website: Optional[str]
+    comment: Optional[str] = Field(description="Notes")
+    active: Optional[bool]
+    employee: Optional[bool]
+    function: Optional[str] = Field(description="Job Position")
+    type: Optional[PartnerType] = Field(description="Address Type")
+    street: Optional[str]
+    street2: Optional[str]
+    zip: Optional[str]
+    city: Optional[str]
+    state_id: Optional[int] = Field(description="State")
+    country_id: Optional[int] = Field(description="Country")
+    country_code: Optional[str] = Field(description="Country Code")
+    partner_latitude: Optional[float] = Field(description="Geo Latitude")
+    partner_longitude: Optional[float] = Field(description="Geo Longitude")
+    email: Optional[str]
+    phone: Optional[str]
+    mobile: Optional[str]
+    is_company: Optional[bool] = Field(description="Is a Company")
+    industry_id: Optional[int]
+    company_id: Optional[int]
+    color: Optional[int] = Field(description="Color Index")
+    commercial_partner_id: Optional[int] = Field(description="Commercial Entity")
+    commercial_company_name: Optional[str] = Field(description="Company Name Entity")
+    company_name: Optional[str] = Field(description="Company Name")
+
+
+def make_rows(count: int):
+    """Generate rows as read from res_partner."""
+    today = date.today()
+    return [
+        {
+            "id": i,
+            "name": f"Partner {i}",
+            "complete_name": f"Company, Partner {i}",
+            "date": today,
+            "title": None,
+            "parent_id": i // 10 or None,
+            "ref": f"P{i:06d}",
+            "lang": "es_MX",
+            "tz": "America/Mexico_City",
+            "user_id": 2,
+            "vat": None,
+            "company_registry": None,
+            "website": None,
+            "comment": None,
+            "active": True,
+            "employee": False,
+            "function": "Buyer",
+            "type": "contact",
+            "street": f"Street {i}",
+            "street2": None,
+            "zip": "01000",
+            "city": "Mexico",
+            "state_id": 9,
+            "country_id": 156,
+            "country_code": "MX",
+            "partner_latitude": 19.43,
+            "partner_longitude": -99.13,
+            "email": f"partner{i}@example.com",
+            "phone": "+52 55 0000 0000",
+            "mobile": None,
+            "is_company": False,
+            "industry_id": None,
+            "company_id": 1,
+            "color": i % 12,
+            "commercial_partner_id": i // 10 or i,
+            "commercial_company_name": "Company",
+            "company_name": None,
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    model = BenchPartner.model_construct()
+    modes = {
+        "validated (model(**row))": lambda: list(model._hydrate(rows, trusted=False)),
+        "model_construct(**row)": lambda: [
+            BenchPartner.model_construct(**row) for row in rows
+        ],
+        "trusted (row factory)": lambda: list(model._hydrate(rows, trusted=True)),
+    }
+    print(f"Hydrating {args.rows} rows of {len(rows[0])} columns")
+    for name, func in modes.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        seconds = min(timings)
+        print(
+            f"{name:<28} {seconds * 1000:>10.1f} ms {args.rows / seconds:>14,.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
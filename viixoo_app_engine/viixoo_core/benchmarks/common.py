@@ -0,0 +1,52 @@
+"""Helpers shared by the benchmarks.
+
+The benchmarks run against a real PostgreSQL database, configured with the
+``BENCH_DB_NAME``, ``BENCH_DB_USER``, ``BENCH_DB_PASSWORD``, ``BENCH_DB_HOST``
+and ``BENCH_DB_PORT`` environment variables. Run them from this directory, e.g.::
+
+    BENCH_DB_NAME=bench python bench_bulk_insert.py --rows 50000
+"""
+
+import time
+from typing import Callable
+from viixoo_core.config import BaseConfig
+from viixoo_core.models.pool import ConnectionPool
+from viixoo_core.models.postgres import PostgresModel
+
+config = BaseConfig.from_env("BENCH")
+pool = ConnectionPool(
+    {key: config[key] for key in ("dbname", "user", "password", "host", "port")},
+    maxconn=config["pool_maxconn"],
+)
+
+
+class BenchModel(PostgresModel):
+    """Model bound to the benchmark database."""
+
+    def get_connection(self):
+        """Get a connection from the benchmark pool."""
+        return pool.connection()
+
+
+def execute(query: str):
+    """Run a statement on the benchmark database."""
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query)
+
+
+def best_of(func: Callable[[], None], repeat: int = 3, setup: Callable = None) -> float:
+    """Return the best wall time of ``repeat`` runs of ``func``, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(name: str, seconds: float, rows: int):
+    """Print a benchmark result."""
+    print(f"{name:<40} {seconds * 1000:>10.1f} ms {rows / seconds:>14,.0f} rows/s")
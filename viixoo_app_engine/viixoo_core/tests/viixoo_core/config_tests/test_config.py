@@ -9,6 +9,14 @@ from viixoo_core.config import BaseConfig
 class TestBaseConfig:
     """Test BaseConfig class."""
 
+    def setup_method(self):
+        """Start every test with an empty configuration cache."""
+        BaseConfig.invalidate()
+
+    def teardown_method(self):
+        """Drop the configuration cached by the test."""
+        BaseConfig.invalidate()
+
     @patch.dict("os.environ", clear=True)
     def test_from_env(self):
         """Test from_env method."""
@@ -44,6 +52,7 @@ class TestBaseConfig:
         assert config["password"] == ""
         assert config["host"] == "localhost"
         assert config["port"] == 5432
+        assert config["pool_health_check"] == 30
 
     @patch(
         "builtins.open",
@@ -175,3 +184,56 @@ class TestBaseConfig:
             "📂 Config from file: /test/path/test_module/test_module.conf"
             in captured.out
         )
+
+    @patch.object(BaseConfig, "from_env")
+    def test_get_config_cached(self, mock_from_env):
+        """Test get_config resolves the configuration once per base path and module."""
+        # Arrange
+        mock_from_env.return_value = {"db_type": "postgresql", "dbname": "env_db"}
+
+        # Act
+        config = BaseConfig.get_config("/test/path", "test_module")
+        config["dbname"] = "changed_db"
+        cached_config = BaseConfig.get_config("/test/path", "test_module")
+        BaseConfig.get_config("/test/path", "other_module")
+
+        # Assert
+        assert cached_config == {"db_type": "postgresql", "dbname": "env_db"}
+        assert mock_from_env.call_count == 2
+
+    @patch.object(BaseConfig, "from_env")
+    def test_invalidate(self, mock_from_env):
+        """Test invalidate drops only the selected configuration."""
+        # Arrange
+        mock_from_env.return_value = {"db_type": "postgresql"}
+        BaseConfig.get_config("/test/path", "test_module")
+        BaseConfig.get_config("/test/path", "other_module")
+
+        # Act
+        BaseConfig.invalidate(module="test_module")
+        BaseConfig.get_config("/test/path", "test_module")
+        BaseConfig.get_config("/test/path", "other_module")
+
+        # Assert
+        assert mock_from_env.call_count == 3
+
+    @patch.dict("os.environ", clear=True)
+    @patch.object(BaseConfig, "watch_interval", 0)
+    @patch.object(BaseConfig, "watch_files", True)
+    def test_get_config_watch_files(self, tmp_path, capsys):
+        """Test get_config reloads the .conf file when it changes."""
+        # Arrange
+        config_file = tmp_path / "test_module" / "test_module.conf"
+        config_file.parent.mkdir()
+        config_file.write_text("[database]\ndbname=first_db\n")
+        assert (
+            BaseConfig.get_config(str(tmp_path), "test_module")["dbname"] == "first_db"
+        )
+
+        # Act
+        config_file.write_text("[database]\ndbname=second_db\n")
+        os.utime(config_file, (1, 1))
+        config = BaseConfig.get_config(str(tmp_path), "test_module")
+
+        # Assert
+        assert config["dbname"] == "second_db"
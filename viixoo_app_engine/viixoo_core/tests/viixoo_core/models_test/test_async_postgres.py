@@ -0,0 +1,182 @@
+"""Tests for the AsyncPostgresModel class and its asyncpg pools."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from viixoo_core.models import async_pool
+from viixoo_core.models.async_postgres import AsyncPostgresModel, render_query
+from typing import Optional
+
+
+class MockAsyncModel(AsyncPostgresModel):
+    """A mock class for testing the AsyncPostgresModel class."""
+
+    __tablename__ = "mock_table"
+    __order__ = "name"
+
+    name: Optional[str] = None
+    value: Optional[int] = 0
+
+
+def mock_connection(records=()):
+    """Return a mocked asyncpg connection and the get_connection patch using it."""
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=list(records))
+    conn.execute = AsyncMock()
+    get_connection = MagicMock()
+    get_connection.return_value.__aenter__.return_value = conn
+    return conn, patch.object(AsyncPostgresModel, "get_connection", get_connection)
+
+
+class TestRenderQuery:
+    """Test the rendering of the queries for asyncpg."""
+
+    def test_render_select(self):
+        """Test identifiers are quoted and placeholders numbered."""
+        query, params = MockAsyncModel()._select_query(
+            columns=["id", "name"],
+            domain=[("name", "ilike", "a"), ("value", "in", [1, 2])],
+            limit=10,
+            order="name",
+        )
+
+        assert render_query(query, params) == (
+            'SELECT "id", "name" FROM "mock_table" '
+            "WHERE name ILIKE $1 AND value IN ($2, $3) "
+            'ORDER BY "name" ASC, "id" ASC LIMIT $4 OFFSET $5',
+            ["a", 1, 2, 10, 0],
+        )
+
+    def test_render_parameter_count(self):
+        """Test a mismatch between placeholders and parameters is rejected."""
+        query, _ = MockAsyncModel()._delete_query([("id", "=", 1)])
+
+        with pytest.raises(ValueError):
+            render_query(query, [])
+
+
+class TestAsyncPostgresModel:
+    """Test the queries of the AsyncPostgresModel class."""
+
+    def test_query_select(self):
+        """Test query_select fetches the rows as dictionaries."""
+        # Arrange
+        conn, patched = mock_connection([{"id": 1, "name": "Test"}])
+
+        # Act
+        with patched:
+            rows = asyncio.run(
+                MockAsyncModel().query_select(domain=[("id", "=", 1)], limit=1)
+            )
+
+        # Assert
+        assert rows == [{"id": 1, "name": "Test"}]
+        conn.fetch.assert_awaited_once_with(
+            'SELECT * FROM "mock_table" WHERE id = $1  LIMIT $2 OFFSET $3', 1, 1, 0
+        )
+
+    def test_create(self):
+        """Test create inserts the rows in one statement and returns models."""
+        # Arrange
+        conn, patched = mock_connection(
+            [{"id": 1, "name": "A", "value": 1}, {"id": 2, "name": "B", "value": 0}]
+        )
+
+        # Act
+        with patched:
+            created = asyncio.run(
+                MockAsyncModel().create(
+                    [{"name": "A", "value": 1}, {"name": "B", "value": 0}]
+                )
+            )
+
+        # Assert
+        text, *args = conn.fetch.await_args[0]
+        assert text == (
+            'INSERT INTO "mock_table" ("name", "value") VALUES ($1, $2), ($3, $4) '
+            "RETURNING *"
+        )
+        assert args == ["A", 1, "B", 0]
+        assert [model.id for model in created] == [1, 2]
+        assert isinstance(created[0], MockAsyncModel)
+
+    def test_search_load(self):
+        """Test search_load sorts by __order__ and builds models."""
+        # Arrange
+        conn, patched = mock_connection([{"id": 3, "name": "C", "value": 2}])
+
+        # Act
+        with patched:
+            models = asyncio.run(MockAsyncModel().search_load(limit=5))
+
+        # Assert
+        text, *args = conn.fetch.await_args[0]
+        assert 'ORDER BY "name" ASC, "id" ASC LIMIT $1 OFFSET $2' in text
+        assert args == [5, 0]
+        assert models == [MockAsyncModel(id=3, name="C", value=2)]
+
+    def test_write_and_delete(self):
+        """Test write updates the row of the model and delete requires a domain."""
+        # Arrange
+        conn, patched = mock_connection([{"id": 4}])
+        model = MockAsyncModel(id=4, name="D", value=1)
+
+        # Act
+        with patched:
+            written = asyncio.run(model.write([{"name": "E"}]))
+            deleted = asyncio.run(model.delete([("id", "=", 4)]))
+            with pytest.raises(ValueError):
+                asyncio.run(model.delete([]))
+
+        # Assert
+        assert written == [{"id": 4}]
+        conn.fetch.assert_awaited_once_with(
+            'UPDATE "mock_table" SET "name" = $1 WHERE id = $2 RETURNING id', "E", 4
+        )
+        assert deleted is True
+        conn.execute.assert_awaited_once_with(
+            'DELETE FROM "mock_table" WHERE id = $1', 4
+        )
+
+
+class TestGetAsyncPool:
+    """Test the async pool registry."""
+
+    def test_pool_created_once(self):
+        """Test concurrent first calls share the pool of the event loop."""
+        # Arrange
+        mock_asyncpg = MagicMock()
+        pool = MagicMock()
+        pool.is_closing.return_value = False
+        mock_asyncpg.create_pool = AsyncMock(return_value=pool)
+        config = {
+            "dbname": "test_db",
+            "user": "test_user",
+            "password": "test_password",
+            "host": "test_host",
+            "port": 5432,
+            "pool_maxconn": 4,
+            "prepared_statements": 0,
+        }
+
+        async def get_pools():
+            return await asyncio.gather(
+                async_pool.get_async_pool("mrp", config),
+                async_pool.get_async_pool("mrp", config),
+            )
+
+        # Act
+        with patch.object(async_pool, "asyncpg", mock_asyncpg):
+            pools = asyncio.run(get_pools())
+
+        # Assert
+        assert pools == [pool, pool]
+        mock_asyncpg.create_pool.assert_awaited_once()
+        assert mock_asyncpg.create_pool.await_args.kwargs["max_size"] == 4
+        assert mock_asyncpg.create_pool.await_args.kwargs["statement_cache_size"] == 100
+
+    def test_asyncpg_missing(self):
+        """Test a clear error is raised without asyncpg."""
+        with patch.object(async_pool, "asyncpg", None):
+            with pytest.raises(RuntimeError):
+                asyncio.run(async_pool.get_async_pool("mrp", {}))
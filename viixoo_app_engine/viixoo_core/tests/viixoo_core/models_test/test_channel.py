@@ -0,0 +1,142 @@
+"""Tests for the channels sharing messages between the workers."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from viixoo_core.models import channel
+from viixoo_core.models.channel import LocalChannel, PostgresChannel
+
+CONFIG = {
+    "dbname": "test_db",
+    "user": "test_user",
+    "password": "test_password",
+    "host": "test_host",
+    "port": 5432,
+}
+
+
+def mock_asyncpg():
+    """Return a mocked asyncpg module and the listening connection it opens."""
+    connection = MagicMock()
+    connection.add_listener = AsyncMock()
+    connection.is_closed.return_value = False
+    asyncpg = MagicMock()
+    asyncpg.connect = AsyncMock(return_value=connection)
+    return asyncpg, connection
+
+
+class TestLocalChannel:
+    """Test the LocalChannel class."""
+
+    def test_publish_calls_handlers(self):
+        """Test a message reaches the handlers of its topic only."""
+        # Arrange
+        local = LocalChannel()
+        received = []
+        local.subscribe("workorder", received.append)
+        local.subscribe("profile", lambda data: received.append("profile"))
+
+        # Act
+        local.publish("workorder", {"workorder_id": 1})
+
+        # Assert
+        assert received == [{"workorder_id": 1}]
+        assert local.stats() == {"published": 1, "received": 1}
+
+    def test_handler_error_isolated(self):
+        """Test an error in a handler does not stop the others."""
+        # Arrange
+        local = LocalChannel()
+        received = []
+        local.subscribe("workorder", lambda data: 1 / 0)
+        local.subscribe("workorder", received.append)
+
+        # Act
+        local.publish("workorder", {"workorder_id": 1})
+
+        # Assert
+        assert received == [{"workorder_id": 1}]
+
+
+class TestPostgresChannel:
+    """Test the PostgresChannel class."""
+
+    def test_publish_notifies(self):
+        """Test a message is sent with NOTIFY and delivered when it comes back."""
+        # Arrange
+        asyncpg, connection = mock_asyncpg()
+        pool = MagicMock()
+        pool.execute = AsyncMock()
+        received = []
+
+        async def publish(shared):
+            shared.publish("workorder", {"workorder_id": 1})
+            await asyncio.gather(*shared._tasks)
+            await shared.start()
+
+        # Act
+        with patch.object(channel, "asyncpg", asyncpg), patch.object(
+            channel, "get_async_pool", AsyncMock(return_value=pool)
+        ):
+            shared = PostgresChannel("mrp_events", "mrp", CONFIG)
+            shared.subscribe("workorder", received.append)
+            asyncio.run(publish(shared))
+
+        # Assert
+        asyncpg.connect.assert_awaited_once()
+        assert asyncpg.connect.await_args.kwargs["database"] == "test_db"
+        connection.add_listener.assert_awaited_once_with(
+            "mrp_events", shared._on_notification
+        )
+        sql, name, payload = pool.execute.await_args.args
+        assert "pg_notify" in sql and name == "mrp_events"
+        assert received == []
+
+        shared._on_notification(connection, 1, "mrp_events", payload)
+        assert received == [{"workorder_id": 1}]
+        assert json.loads(payload) == {
+            "topic": "workorder",
+            "data": {"workorder_id": 1},
+        }
+
+    def test_notify_failure_delivers_locally(self):
+        """Test a message is still delivered to this process when NOTIFY fails."""
+        # Arrange
+        asyncpg, _ = mock_asyncpg()
+        pool = MagicMock()
+        pool.execute = AsyncMock(side_effect=OSError("connection refused"))
+        received = []
+
+        async def publish(shared):
+            shared.publish("profile", {"employee_id": "1"})
+            await asyncio.gather(*shared._tasks)
+
+        # Act
+        with patch.object(channel, "asyncpg", asyncpg), patch.object(
+            channel, "get_async_pool", AsyncMock(return_value=pool)
+        ):
+            shared = PostgresChannel("mrp_events", "mrp", CONFIG)
+            shared.subscribe("profile", received.append)
+            asyncio.run(publish(shared))
+
+        # Assert
+        assert received == [{"employee_id": "1"}]
+        assert shared.stats()["failed"] == 1
+
+    def test_listen_failure_retried(self):
+        """Test a failed LISTEN connection is opened again on the next start."""
+        # Arrange
+        asyncpg, connection = mock_asyncpg()
+        asyncpg.connect.side_effect = [OSError("connection refused"), connection]
+
+        async def start(shared):
+            return [await shared.start(), await shared.start(), await shared.start()]
+
+        # Act
+        with patch.object(channel, "asyncpg", asyncpg):
+            shared = PostgresChannel("mrp_events", "mrp", CONFIG)
+            started = asyncio.run(start(shared))
+
+        # Assert
+        assert started == [False, True, True]
+        assert asyncpg.connect.await_count == 2
@@ -301,3 +301,79 @@ class TestDomainTranslator:
         # Assert
         assert sql_query == "WHERE (name = %s OR (field1 = %s AND field2 = %s))"
         assert params == ["Jack", "Sam", "Daniel"]
+
+
+class TestDomainTranslatorCache:
+    """Test the compiled-domain cache of the DomainTranslator class."""
+
+    def setup_method(self):
+        """Start every test with an empty cache."""
+        DomainTranslator.cache_clear()
+
+    def teardown_method(self):
+        """Restore the cache state."""
+        DomainTranslator.cache_clear()
+
+    def test_compile_same_shape_hits_cache(self):
+        """Test domains differing only by their values share the compiled SQL."""
+        # Arrange
+        first = ["|", ("name", "ilike", "John"), ("age", "in", [30, 40])]
+        second = ["|", ("name", "ilike", "Jane"), ("age", "in", [50, 60])]
+
+        # Act
+        compiled = DomainTranslator.compile(first)
+        sql_query, params = DomainTranslator.translate(second)
+
+        # Assert
+        assert DomainTranslator.compile(second) is compiled
+        assert sql_query == "WHERE (name ILIKE %s OR age IN (%s, %s))"
+        assert params == ["Jane", 50, 60]
+        assert compiled.extract(first) == ["John", 30, 40]
+        info = DomainTranslator.cache_info()
+        assert (info["hits"], info["misses"], info["size"]) == (2, 1, 1)
+
+    def test_compile_different_shapes(self):
+        """Test operators, fields and list lengths are part of the shape."""
+        # Act
+        DomainTranslator.compile([("name", "=", "John")])
+        DomainTranslator.compile([("name", "!=", "John")])
+        DomainTranslator.compile([("city", "=", "John")])
+        DomainTranslator.compile([("id", "in", [1])])
+        sql_query, params = DomainTranslator.translate([("id", "in", [1, 2])])
+
+        # Assert
+        assert sql_query == "WHERE id IN (%s, %s)"
+        assert params == [1, 2]
+        assert DomainTranslator.cache_info()["misses"] == 5
+
+    def test_compile_lru_eviction(self, monkeypatch):
+        """Test the least recently used shape is evicted when the cache is full."""
+        # Arrange
+        monkeypatch.setattr(DomainTranslator, "cache_size", 2)
+        DomainTranslator.compile([("a", "=", 1)])
+        DomainTranslator.compile([("b", "=", 1)])
+        DomainTranslator.compile([("a", "=", 2)])
+
+        # Act
+        DomainTranslator.compile([("c", "=", 1)])
+
+        # Assert
+        assert DomainTranslator.shape([("a", "=", 3)]) in DomainTranslator._cache
+        assert DomainTranslator.shape([("b", "=", 3)]) not in DomainTranslator._cache
+        assert DomainTranslator.cache_info()["size"] == 2
+
+    def test_translate_like_params_with_cache(self):
+        """Test the like-family values are rewritten on cache hits."""
+        # Arrange
+        domain = [("name", "startswith", "Jo"), ("city", "contains", "York")]
+        DomainTranslator.translate(domain)
+
+        # Act
+        sql_query, params = DomainTranslator.translate(
+            [("name", "startswith", "Ja"), ("city", "contains", "Paris")]
+        )
+
+        # Assert
+        assert sql_query == "WHERE name LIKE %s AND city LIKE %s"
+        assert params == ["Ja%", "%Paris%"]
+        assert DomainTranslator.cache_info()["hits"] == 1
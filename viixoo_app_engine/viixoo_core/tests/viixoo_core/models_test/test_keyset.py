@@ -0,0 +1,142 @@
+"""Tests for the keyset pagination helpers and the paginated search."""
+
+import pytest
+from datetime import date
+from psycopg2.sql import SQL, Identifier
+from unittest.mock import patch
+from viixoo_core.models.keyset import (
+    Page,
+    decode_token,
+    encode_token,
+    keyset_condition,
+    keyset_params,
+    parse_order,
+)
+from viixoo_core.models.postgres import PostgresModel
+from typing import Optional
+
+
+class MockPostgresModel(PostgresModel):
+    """A mock class for testing the paginated search."""
+
+    __tablename__ = "mock_table"
+    __order__ = "name DESC"
+
+    name: Optional[str] = None
+
+
+class TestKeyset:
+    """Test the keyset helpers."""
+
+    def test_parse_order(self):
+        """Test the order is parsed and id appended as tie-breaker."""
+        assert parse_order("complete_name ASC, date desc") == (
+            ("complete_name", False),
+            ("date", True),
+            ("id", False),
+        )
+        assert parse_order("id DESC") == (("id", True),)
+
+    def test_parse_order_invalid(self):
+        """Test an order with an expression is rejected."""
+        with pytest.raises(ValueError):
+            parse_order("name; DROP TABLE users")
+
+    def test_keyset_condition_same_direction(self):
+        """Test a row comparison is used when every column goes the same way."""
+        order = parse_order("name DESC, id DESC")
+
+        assert keyset_condition(order) == SQL("({}) {} ({})").format(
+            SQL(", ").join([Identifier("name"), Identifier("id")]),
+            SQL("<"),
+            SQL(", ").join([SQL("%s"), SQL("%s")]),
+        )
+        assert keyset_params(order, ["b", 3]) == ["b", 3]
+
+    def test_keyset_condition_mixed_directions(self):
+        """Test mixed directions are expanded in alternatives."""
+        order = parse_order("name DESC")
+
+        condition = keyset_condition(order)
+
+        assert condition == SQL("({})").format(
+            SQL(" OR ").join(
+                [
+                    SQL("({})").format(
+                        SQL(" AND ").join([SQL("{} < %s").format(Identifier("name"))])
+                    ),
+                    SQL("({})").format(
+                        SQL(" AND ").join(
+                            [
+                                SQL("{} = %s").format(Identifier("name")),
+                                SQL("{} > %s").format(Identifier("id")),
+                            ]
+                        )
+                    ),
+                ]
+            )
+        )
+        assert keyset_params(order, ["b", 3]) == ["b", "b", 3]
+
+    def test_token_round_trip(self):
+        """Test a token gives back the position of the row."""
+        order = parse_order("date DESC")
+
+        token = encode_token(order, {"id": 7, "date": date(2024, 5, 1), "x": 1})
+
+        assert decode_token(order, token) == ["2024-05-01", 7]
+
+    def test_token_other_order(self):
+        """Test a token is rejected by another order or when tampered."""
+        token = encode_token(parse_order("name"), {"id": 1, "name": "a"})
+
+        with pytest.raises(ValueError):
+            decode_token(parse_order("name DESC"), token)
+        with pytest.raises(ValueError):
+            decode_token(parse_order("name"), "not a token")
+
+
+class TestPostgresModelSearchPage:
+    """Test the keyset pagination of search and search_load."""
+
+    @patch.object(PostgresModel, "query_select")
+    def test_search_first_page(self, mock_query_select):
+        """Test a full page returns the token of its last row."""
+        # Arrange
+        rows = [{"id": 2, "name": "b"}, {"id": 1, "name": "a"}]
+        mock_query_select.return_value = rows
+        model = MockPostgresModel()
+
+        # Act
+        page = model.search(domain=[("id", ">", 0)], limit=2, paginate=True)
+
+        # Assert
+        mock_query_select.assert_called_once_with(
+            domain=[("id", ">", 0)], limit=2, order="name DESC", after=None
+        )
+        assert page.records == rows
+        assert decode_token(parse_order("name DESC"), page.next_token) == ["a", 1]
+
+    @patch.object(PostgresModel, "query_select")
+    def test_search_load_next_page(self, mock_query_select):
+        """Test the token positions the next page and the last page has no token."""
+        # Arrange
+        mock_query_select.return_value = [{"id": 5, "name": "a"}]
+        token = encode_token(parse_order("name DESC"), {"id": 1, "name": "b"})
+        model = MockPostgresModel()
+
+        # Act
+        page = model.search_load(limit=2, token=token)
+
+        # Assert
+        mock_query_select.assert_called_once_with(
+            domain=[], limit=2, order="name DESC", after=["b", 1]
+        )
+        assert isinstance(page, Page)
+        assert isinstance(page.records[0], MockPostgresModel)
+        assert page.next_token is None
+
+    def test_search_page_requires_limit(self):
+        """Test keyset pagination needs a page size."""
+        with pytest.raises(ValueError):
+            MockPostgresModel().search(paginate=True)
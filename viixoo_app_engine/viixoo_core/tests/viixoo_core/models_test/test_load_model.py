@@ -1,5 +1,7 @@
 """Test the load_model method of the PostgresModel class."""
 
+from pydantic import Field
+from typing import List
 from unittest.mock import patch
 from viixoo_core.models.postgres import PostgresModel
 
@@ -27,10 +29,61 @@ class TestPostgresModelLoadModel:
         loaded_models = model.load_model()
 
         # Assert
-        mock_query_select.assert_called_once_with([])
+        mock_query_select.assert_called_once_with(domain=[])
         assert len(loaded_models) == 2
         assert isinstance(loaded_models[0], MockModel)
         assert loaded_models[0].id == 1
         assert loaded_models[0].name == "Test 1"
         assert loaded_models[1].id == 2
         assert loaded_models[1].name == "Test 2"
+
+    @patch.object(PostgresModel, "query_select")
+    def test_load_model_trusted(self, mock_query_select):
+        """Test trusted models are built without validation, defaults filled."""
+        # Arrange
+        mock_query_select.return_value = [
+            {"id": "1", "name": "Test 1", "extra": True},
+            {"id": 2, "name": "Test 2", "extra": False},
+        ]
+
+        class MockModel(PostgresModel):
+            __tablename__ = "mock_table"
+            id: int
+            name: str
+            tags: List[str] = Field(default_factory=list)
+
+        model = MockModel(id=1, name="Fake name")
+
+        # Act
+        loaded_models = model.load_model(trusted=True)
+
+        # Assert
+        assert [type(loaded) for loaded in loaded_models] == [MockModel] * 2
+        # Not validated: the value is kept as read
+        assert loaded_models[0].id == "1"
+        assert loaded_models[0].tags == []
+        assert loaded_models[0].tags is not loaded_models[1].tags
+        assert loaded_models[1].model_dump() == {"id": 2, "name": "Test 2", "tags": []}
+        assert loaded_models[1].model_fields_set == {"id", "name"}
+
+    @patch.object(PostgresModel, "query_select")
+    def test_load_model_trusted_class_default(self, mock_query_select):
+        """Test ``__trusted__`` enables the trusted mode for a model class."""
+        # Arrange
+        mock_query_select.return_value = [{"id": "1", "name": "Test 1"}]
+
+        class MockModel(PostgresModel):
+            __tablename__ = "mock_table"
+            __trusted__ = True
+            id: int
+            name: str
+
+        model = MockModel(id=1, name="Fake name")
+
+        # Act
+        trusted_models = model.load_model()
+        validated_models = model.load_model(trusted=False)
+
+        # Assert
+        assert trusted_models[0].id == "1"
+        assert validated_models[0].id == 1
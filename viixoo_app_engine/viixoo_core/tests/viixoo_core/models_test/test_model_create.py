@@ -1,7 +1,7 @@
 """Test cases for the create method in the PostgresModel class."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from viixoo_core.models.postgres import PostgresModel
 from typing import Optional
 
@@ -29,10 +29,10 @@ class TestPostgresModelCreate:
         """Test create method with rows."""
         # Arrange
         mock_rows = [{"name": "Test 1", "value": 10}, {"name": "Test 2", "value": 20}]
-        mock_ids = [{"id": 1}, {"id": 2}]
-        mock_query_insert.return_value = mock_ids
-        mock_loaded_model = MagicMock()
-        mock_load_model.return_value = [mock_loaded_model]
+        mock_query_insert.return_value = [
+            {"id": 1, "name": "Test 1", "value": 10},
+            {"id": 2, "name": "Test 2", "value": 20},
+        ]
 
         model = MockPostgresModel(id=1)
 
@@ -40,22 +40,19 @@ class TestPostgresModelCreate:
         result = model.create(rows=mock_rows)
 
         # Assert
-        mock_query_insert.assert_called_once_with(mock_rows)
-        mock_load_model.assert_called_once()
-        # check the parameter in load_model
-        assert mock_load_model.call_args[0][0] == MockPostgresModel
-        assert mock_load_model.call_args[0][1] == [("id", "=", 1), ("id", "=", 2)]
-        assert result == mock_loaded_model
+        mock_query_insert.assert_called_once_with(mock_rows, returning="*")
+        mock_load_model.assert_not_called()
+        assert [type(created) for created in result] == [MockPostgresModel] * 2
+        assert [(created.id, created.name) for created in result] == [
+            (1, "Test 1"),
+            (2, "Test 2"),
+        ]
 
     @patch.object(PostgresModel, "query_insert")
-    @patch.object(PostgresModel, "load_model")
-    def test_create_no_rows(self, mock_load_model, mock_query_insert):
+    def test_create_no_rows(self, mock_query_insert):
         """Test create method with no rows (using model_dump)."""
         # Arrange
-        mock_ids = [{"id": 1}]
-        mock_query_insert.return_value = mock_ids
-        mock_loaded_model = MagicMock()
-        mock_load_model.return_value = [mock_loaded_model]
+        mock_query_insert.return_value = [{"id": 1, "name": "Test", "value": 10}]
         model = MockPostgresModel(id=1, name="Test", value=10)
 
         # Act
@@ -63,17 +60,26 @@ class TestPostgresModelCreate:
 
         # Assert
         mock_query_insert.assert_called_once_with(
-            [{"id": 1, "name": "Test", "value": 10}]
+            [{"id": 1, "name": "Test", "value": 10}], returning="*"
         )
-        mock_load_model.assert_called_once()
-        # check the parameter in load_model
-        assert mock_load_model.call_args[0][0] == MockPostgresModel
-        assert mock_load_model.call_args[0][1] == [("id", "=", 1)]
-        assert result == mock_loaded_model
+        assert result == [MockPostgresModel(id=1, name="Test", value=10)]
 
     @patch.object(PostgresModel, "query_insert")
-    @patch.object(PostgresModel, "load_model")
-    def test_create_error(self, mock_load_model, mock_query_insert):
+    def test_create_null_ids(self, mock_query_insert):
+        """Test null ids are left to the sequence."""
+        # Arrange
+        mock_query_insert.return_value = [{"id": 7, "name": "Test", "value": 0}]
+        model = MockPostgresModel(id=1)
+
+        # Act
+        result = model.create(rows=[{"id": None, "name": "Test"}])
+
+        # Assert
+        mock_query_insert.assert_called_once_with([{"name": "Test"}], returning="*")
+        assert result[0].id == 7
+
+    @patch.object(PostgresModel, "query_insert")
+    def test_create_error(self, mock_query_insert):
         """Test create method error."""
         # Arrange
         mock_rows = [{"name": "Test 1", "value": 10}]
@@ -87,5 +93,4 @@ class TestPostgresModelCreate:
         assert "Some error" in str(e.value)
 
         # Assert
-        mock_query_insert.assert_called_once_with(mock_rows)
-        mock_load_model.assert_not_called()
+        mock_query_insert.assert_called_once_with(mock_rows, returning="*")
@@ -37,7 +37,9 @@ class TestPostgresModelSearch:
         results = model.search(domain=mock_domain)
 
         # Assert
-        mock_query_select.assert_called_once_with(mock_domain, limit=0, offset=0)
+        mock_query_select.assert_called_once_with(
+            domain=mock_domain, limit=0, offset=0, order="id"
+        )
         assert results == mock_result
 
     @patch.object(PostgresModel, "query_select")
@@ -53,7 +55,9 @@ class TestPostgresModelSearch:
         results = model.search()
 
         # Assert
-        mock_query_select.assert_called_once_with([], limit=0, offset=0)
+        mock_query_select.assert_called_once_with(
+            domain=[], limit=0, offset=0, order="id"
+        )
         assert results == mock_result
 
 
@@ -76,7 +80,9 @@ class TestPostgresModelSearchLoad:
         results = model.search_load(domain=mock_domain)
 
         # Assert
-        mock_query_select.assert_called_once_with(mock_domain)
+        mock_query_select.assert_called_once_with(
+            domain=mock_domain, limit=0, order="id"
+        )
         assert len(results) == 2
         assert isinstance(results[0], MockPostgresModel)
         assert results[0].id == 1
@@ -102,7 +108,7 @@ class TestPostgresModelSearchLoad:
         results = model.search_load()
 
         # Assert
-        mock_query_select.assert_called_once_with([])
+        mock_query_select.assert_called_once_with(domain=[], limit=0, order="id")
         assert len(results) == 2
         assert isinstance(results[0], MockPostgresModel)
         assert results[0].id == 1
@@ -112,3 +118,45 @@ class TestPostgresModelSearchLoad:
         assert results[1].id == 2
         assert results[1].name == "Test2"
         assert results[1].value == 20
+
+
+class TestPostgresModelSearchStream:
+    """Tests for the streaming mode of the search and search_load methods."""
+
+    @patch.object(PostgresModel, "iter_select")
+    def test_search_stream(self, mock_iter_select):
+        """Test search returns the iter_select generator when streaming."""
+        # Arrange
+        mock_domain = [("name", "=", "Test")]
+        mock_iter_select.return_value = iter([{"id": 1, "name": "Test"}])
+        model = MockPostgresModel(id=1)
+
+        # Act
+        results = model.search(domain=mock_domain, stream=True, itersize=100)
+
+        # Assert
+        mock_iter_select.assert_called_once_with(
+            domain=mock_domain, limit=0, offset=0, order="id", itersize=100
+        )
+        assert list(results) == [{"id": 1, "name": "Test"}]
+
+    @patch.object(PostgresModel, "iter_select")
+    def test_search_load_stream(self, mock_iter_select):
+        """Test search_load yields models lazily when streaming."""
+        # Arrange
+        mock_iter_select.return_value = iter(
+            [{"id": 1, "name": "Test", "value": 10}, {"id": 2, "name": "Test"}]
+        )
+        model = MockPostgresModel(id=1)
+
+        # Act
+        results = model.search_load(stream=True)
+
+        # Assert
+        mock_iter_select.assert_called_once_with(
+            domain=[], limit=0, order="id", itersize=2000
+        )
+        first = next(results)
+        assert isinstance(first, MockPostgresModel)
+        assert first.value == 10
+        assert [result.id for result in results] == [2]
@@ -0,0 +1,178 @@
+"""Tests for the connection pool used by the PostgreSQL models."""
+
+import pytest
+import psycopg2
+from psycopg2 import extensions
+from unittest.mock import MagicMock, patch
+from viixoo_core.models import pool
+from viixoo_core.models.pool import ConnectionPool, PoolExhaustedError
+from viixoo_core.models.prepared import PreparedStatements
+
+DSN = {
+    "dbname": "test_db",
+    "user": "test_user",
+    "password": "test_password",
+    "host": "test_host",
+    "port": 5432,
+}
+
+
+def make_connection():
+    """Return a mock of an open connection without a running transaction."""
+    conn = MagicMock()
+    conn.closed = False
+    conn.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+    return conn
+
+
+@patch.object(pool.psycopg2, "connect")
+class TestConnectionPool:
+    """Test the ConnectionPool class."""
+
+    def test_getconn_opens_lazily(self, mock_connect):
+        """Test connections are only opened when checked out."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        conn_pool = ConnectionPool(DSN, minconn=1, maxconn=2)
+
+        assert conn_pool.stats()["size"] == 0
+        conn = conn_pool.getconn()
+
+        assert not conn.closed
+        assert conn_pool.stats()["size"] == 1
+        assert conn_pool.stats()["in_use"] == 1
+        mock_connect.assert_called_once_with(
+            connection_factory=pool.PooledConnection, **DSN
+        )
+
+    def test_putconn_reuses_connection(self, mock_connect):
+        """Test a released connection is handed out again."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        conn_pool = ConnectionPool(DSN, maxconn=2)
+
+        conn = conn_pool.getconn()
+        conn_pool.putconn(conn)
+
+        assert conn_pool.getconn() is conn
+        assert mock_connect.call_count == 1
+        assert conn_pool.stats()["checkouts"] == 2
+
+    def test_getconn_exhausted(self, mock_connect):
+        """Test the pool raises when every connection is in use."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        conn_pool = ConnectionPool(DSN, maxconn=1, timeout=0.01)
+        conn_pool.getconn()
+
+        with pytest.raises(PoolExhaustedError):
+            conn_pool.getconn()
+
+        stats = conn_pool.stats()
+        assert stats["exhausted"] == 1
+        assert stats["waits"] == 1
+
+    def test_health_check_discards_broken_connection(self, mock_connect):
+        """Test an idle connection failing the ping is replaced."""
+        broken = make_connection()
+        broken.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError("server closed the connection")
+        )
+        healthy = make_connection()
+        mock_connect.side_effect = [broken, healthy]
+        conn_pool = ConnectionPool(DSN, maxconn=1, health_check_interval=0)
+
+        conn_pool.putconn(conn_pool.getconn())
+        conn = conn_pool.getconn()
+
+        assert conn is healthy
+        broken.close.assert_called_once()
+        assert conn_pool.stats()["health_check_failures"] == 1
+
+    def test_recycle_idle_connections(self, mock_connect):
+        """Test idle connections above minconn are closed after max_idle."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        conn_pool = ConnectionPool(DSN, minconn=1, maxconn=3, max_idle=0)
+
+        first = conn_pool.getconn()
+        second = conn_pool.getconn()
+        conn_pool.putconn(first)
+        conn_pool.putconn(second)
+
+        stats = conn_pool.stats()
+        assert stats["size"] == 1
+        assert stats["recycled"] == 1
+        first.close.assert_called_once()
+
+    def test_putconn_rolls_back_open_transaction(self, mock_connect):
+        """Test a connection released inside a transaction is rolled back."""
+        conn = make_connection()
+        mock_connect.return_value = conn
+        conn_pool = ConnectionPool(DSN)
+
+        conn_pool.getconn()
+        conn.info.transaction_status = extensions.TRANSACTION_STATUS_INERROR
+        conn_pool.putconn(conn)
+
+        conn.rollback.assert_called_once()
+        assert conn_pool.stats()["idle"] == 1
+
+    def test_connection_context_manager(self, mock_connect):
+        """Test connection() runs a transaction and releases the connection."""
+        conn = make_connection()
+        mock_connect.return_value = conn
+        conn_pool = ConnectionPool(DSN)
+
+        with pytest.raises(ValueError):
+            with conn_pool.connection() as used:
+                assert used is conn
+                raise ValueError("Some error")
+
+        conn.__exit__.assert_called_once()
+        assert conn_pool.stats()["in_use"] == 0
+
+    def test_prepared_statements_enabled(self, mock_connect):
+        """Test connections get a prepared-statement cache when enabled."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        conn_pool = ConnectionPool(DSN, prepared_statements=5)
+
+        conn = conn_pool.getconn()
+
+        assert isinstance(conn.prepared_statements, PreparedStatements)
+        assert conn.prepared_statements.max_size == 5
+
+    def test_connect_error_releases_slot(self, mock_connect):
+        """Test a failed connection attempt does not leak a pool slot."""
+        mock_connect.side_effect = psycopg2.OperationalError("Some error")
+        conn_pool = ConnectionPool(DSN, maxconn=1)
+
+        with pytest.raises(psycopg2.OperationalError):
+            conn_pool.getconn()
+
+        assert conn_pool.stats()["size"] == 0
+
+
+class TestGetPool:
+    """Test the pool registry."""
+
+    def teardown_method(self):
+        """Drop the pools created by the test."""
+        pool.close_all()
+
+    def test_get_pool_per_module_and_dsn(self):
+        """Test pools are shared per module and DSN."""
+        config = {**DSN, "pool_minconn": 2, "pool_maxconn": 5}
+
+        first = pool.get_pool("mrp", config)
+
+        assert pool.get_pool("mrp", dict(config)) is first
+        assert pool.get_pool("example", config) is not first
+        assert pool.get_pool("mrp", {**config, "dbname": "other"}) is not first
+        assert (first.minconn, first.maxconn) == (2, 5)
+        assert "mrp:test_user@test_host:5432/test_db" in pool.pools_stats()
+
+    def test_close_all(self):
+        """Test close_all closes the pools."""
+        first = pool.get_pool("mrp", DSN)
+
+        pool.close_all()
+
+        assert first.closed
+        assert pool.get_pool("mrp", DSN) is not first
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-import viixoo_core
+from viixoo_core.models import pool
 from viixoo_core.models.postgres import PostgresModel
 from viixoo_core.config import BaseConfig
 import importlib
@@ -11,8 +11,16 @@ import importlib
 class TestPostgresModelGetConnection:
     """Test the get_connection method of the PostgresModel class."""
 
+    def setup_method(self):
+        """Start every test without pools."""
+        pool.close_all()
+
+    def teardown_method(self):
+        """Drop the pools created by the test."""
+        pool.close_all()
+
     @patch.object(BaseConfig, "get_config")
-    @patch("psycopg2.connect")
+    @patch.object(pool.psycopg2, "connect")
     @patch.object(importlib, "import_module")
     def test_get_connection_new_connection(
         self, mock_import_module, mock_psycopg2_connect, mock_get_config
@@ -33,84 +41,103 @@ class TestPostgresModelGetConnection:
         mock_import_module.return_value = mock_module
 
         mock_connection = MagicMock()
+        mock_connection.closed = False
         mock_psycopg2_connect.return_value = mock_connection
-        viixoo_core.models.postgres.db_connection = mock_connection
 
         model = PostgresModel(id=1)
         model.__class__.__module__ = "test_module.models"
 
         # Act
-        connection = model.get_connection()
+        with model.get_connection() as connection:
+            pass
 
         # Assert
         assert connection == mock_connection
         mock_import_module.assert_called_once_with("test_module")
         mock_get_config.assert_called_once_with(base_path="/test/path", module="models")
-        mock_psycopg2_connect.assert_called_once_with(**mock_config)
+        mock_psycopg2_connect.assert_called_once_with(
+            connection_factory=pool.PooledConnection, **mock_config
+        )
+        mock_connection.__enter__.assert_called_once()
+        mock_connection.__exit__.assert_called_once()
 
-        # Clean up
-        viixoo_core.models.postgres.db_connection = False
-
-    @patch("psycopg2.connect")
-    def test_get_connection_existing_connection(self, mock_psycopg2_connect):
-        """Test get_connection when an existing connection is available and open."""
+    @patch.object(BaseConfig, "get_config")
+    @patch.object(pool.psycopg2, "connect")
+    @patch.object(importlib, "import_module")
+    def test_get_connection_reuses_pooled_connection(
+        self, mock_import_module, mock_psycopg2_connect, mock_get_config
+    ):
+        """Test get_connection reuses the connection returned to the pool."""
         # Arrange
+        mock_get_config.return_value = {
+            "dbname": "test_db",
+            "user": "test_user",
+            "password": "test_password",
+            "host": "test_host",
+            "port": 5432,
+        }
+        mock_module = MagicMock()
+        mock_module.__path__ = ["/test/path"]
+        mock_import_module.return_value = mock_module
+
         mock_connection = MagicMock()
         mock_connection.closed = False
-        viixoo_core.models.postgres.db_connection = mock_connection
+        mock_psycopg2_connect.return_value = mock_connection
         model = PostgresModel(id=1)
 
         # Act
-        connection = model.get_connection()
+        with model.get_connection() as first:
+            pass
+        with model.get_connection() as second:
+            pass
 
         # Assert
-        assert connection == mock_connection
-        mock_psycopg2_connect.assert_not_called()
-
-        # Clean up
-        viixoo_core.models.postgres.db_connection = False
+        assert first is second
+        mock_psycopg2_connect.assert_called_once()
 
     @patch.object(BaseConfig, "get_config")
-    @patch("psycopg2.connect")
+    @patch.object(pool.psycopg2, "connect")
     @patch.object(importlib, "import_module")
     def test_get_connection_existing_connection_closed(
         self, mock_import_module, mock_psycopg2_connect, mock_get_config
     ):
-        """Test get_connection when an existing connection is available but closed."""
+        """Test get_connection when the pooled connection was closed."""
         # Arrange
-        mock_config = {
+        mock_get_config.return_value = {
             "dbname": "test_db",
             "user": "test_user",
             "password": "test_password",
             "host": "test_host",
             "port": 5432,
         }
-        mock_get_config.return_value = mock_config
-
-        mock_connection_closed = MagicMock()
-        mock_connection_closed.closed = True
-        viixoo_core.models.postgres.db_connection = mock_connection_closed
-
         mock_module = MagicMock()
         mock_module.__path__ = ["/test/path"]
         mock_import_module.return_value = mock_module
 
+        mock_connection_closed = MagicMock()
+        mock_connection_closed.closed = False
         mock_connection_new = MagicMock()
-        mock_psycopg2_connect.return_value = mock_connection_new
-
+        mock_connection_new.closed = False
+        mock_psycopg2_connect.side_effect = [
+            mock_connection_closed,
+            mock_connection_new,
+        ]
         model = PostgresModel(id=1)
+
+        with model.get_connection():
+            pass
+        mock_connection_closed.closed = True
+
         # Act
-        connection = model.get_connection()
+        with model.get_connection() as connection:
+            pass
 
         # Assert
         assert connection == mock_connection_new
-        mock_psycopg2_connect.assert_called_once_with(**mock_config)
-
-        # Clean up
-        viixoo_core.models.postgres.db_connection = False
+        assert mock_psycopg2_connect.call_count == 2
 
     @patch.object(BaseConfig, "get_config")
-    @patch("psycopg2.connect")
+    @patch.object(pool.psycopg2, "connect")
     @patch.object(importlib, "import_module")
     def test_get_connection_error(
         self, mock_import_module, mock_psycopg2_connect, mock_get_config
@@ -123,9 +150,6 @@ class TestPostgresModelGetConnection:
         mock_module.__path__ = ["/test/path"]
         mock_import_module.return_value = mock_module
 
-        mock_connection = MagicMock()
-        mock_psycopg2_connect.return_value = mock_connection
-
         model = PostgresModel(id=1)
         model.__class__.__module__ = "test_module.models"
 
@@ -0,0 +1,143 @@
+"""Tests for the prepared statements of the pooled connections."""
+
+from unittest.mock import MagicMock, patch
+from psycopg2.sql import Composed
+from viixoo_core.models import prepared
+from viixoo_core.models.async_postgres import _as_string
+from viixoo_core.models.postgres import PostgresModel
+from viixoo_core.models.prepared import PreparedStatements, to_dollar_params
+
+
+class MockPostgresModel(PostgresModel):
+    """A mock class for testing the prepared statements."""
+
+    __tablename__ = "mock_table"
+
+
+class TestToDollarParams:
+    """Test the to_dollar_params function."""
+
+    def test_positional_placeholders(self):
+        """Test %s placeholders are numbered and %% unescaped."""
+        assert to_dollar_params(
+            "SELECT * FROM t WHERE a = %s AND b LIKE '%%x' AND c IN (%s, %s)"
+        ) == ("SELECT * FROM t WHERE a = $1 AND b LIKE '%x' AND c IN ($2, $3)", 3)
+
+    def test_named_placeholders(self):
+        """Test queries with named placeholders are not rewritten."""
+        assert to_dollar_params("UPDATE t SET a = %(a)s") is None
+
+
+class TestPreparedStatements:
+    """Test the PreparedStatements class."""
+
+    def setup_method(self):
+        """Reset the metrics."""
+        prepared.reset_prepared_stats()
+
+    def test_prepare_then_execute(self):
+        """Test a query is prepared once and executed by name afterwards."""
+        # Arrange
+        cur = MagicMock()
+        statements = PreparedStatements()
+        query = "SELECT * FROM t WHERE a = %s"
+
+        # Act
+        statements.execute(cur, query, ["x"])
+        statements.execute(cur, query, ["y"])
+
+        # Assert
+        assert [call[0] for call in cur.execute.call_args_list] == [
+            ("PREPARE viixoo_stmt_1 AS SELECT * FROM t WHERE a = $1",),
+            ("EXECUTE viixoo_stmt_1 (%s)", ["x"]),
+            ("EXECUTE viixoo_stmt_1 (%s)", ["y"]),
+        ]
+        stats = prepared.prepared_stats()
+        assert (stats["prepares"], stats["executions"], stats["hits"]) == (1, 2, 1)
+        assert stats["saved_prepare_time"] >= 0
+
+    def test_lru_deallocation(self):
+        """Test the least recently used statement is deallocated."""
+        # Arrange
+        cur = MagicMock()
+        statements = PreparedStatements(max_size=2)
+        statements.execute(cur, "SELECT 1")
+        statements.execute(cur, "SELECT 2")
+        statements.execute(cur, "SELECT 1")
+
+        # Act
+        statements.execute(cur, "SELECT 3")
+
+        # Assert
+        cur.execute.assert_any_call("DEALLOCATE viixoo_stmt_2")
+        assert list(statements.statements) == ["SELECT 1", "SELECT 3"]
+        assert prepared.prepared_stats()["deallocations"] == 1
+
+    def test_fallback(self):
+        """Test tuple parameters and named placeholders are executed directly."""
+        # Arrange
+        cur = MagicMock()
+        statements = PreparedStatements()
+
+        # Act
+        statements.execute(cur, "INSERT INTO t (a, b) VALUES %s", [("x", 1)])
+        statements.execute(cur, "UPDATE t SET a = %(a)s", {"a": 1})
+
+        # Assert
+        assert cur.execute.call_args_list[0][0] == (
+            "INSERT INTO t (a, b) VALUES %s",
+            [("x", 1)],
+        )
+        assert statements.statements == {}
+        assert prepared.prepared_stats()["fallbacks"] == 2
+
+
+class TestPostgresModelExecute:
+    """Test the PostgresModel queries use the prepared statements of the connection."""
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_query_delete_prepared(self, mock_get_connection):
+        """Test the query goes through the prepared statements of the connection."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.connection.prepared_statements = PreparedStatements()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+
+        with patch.object(PreparedStatements, "execute") as mock_execute:
+            # Act
+            MockPostgresModel().query_delete([("id", "=", 1)])
+
+        # Assert
+        mock_execute.assert_called_once()
+        assert mock_execute.call_args[0][2] == [1]
+        mock_cursor.execute.assert_not_called()
+
+    def test_pages_share_statement(self):
+        """Test the pages of a query reuse one prepared statement."""
+        # Arrange
+        cur = MagicMock()
+        statements = PreparedStatements()
+        model = MockPostgresModel()
+
+        # Act
+        with patch.object(
+            Composed, "as_string", lambda query, context: _as_string(query)
+        ):
+            for offset in (0, 50):
+                statements.execute(
+                    cur,
+                    *model._select_query(
+                        domain=[("id", ">", 1)], limit=50, offset=offset
+                    ),
+                )
+
+        # Assert
+        calls = [call[0] for call in cur.execute.call_args_list]
+        assert calls[0][0].startswith("PREPARE viixoo_stmt_1 AS SELECT")
+        assert calls[0][0].endswith("LIMIT $2 OFFSET $3")
+        assert calls[1:] == [
+            ("EXECUTE viixoo_stmt_1 (%s, %s, %s)", [1, 50, 0]),
+            ("EXECUTE viixoo_stmt_1 (%s, %s, %s)", [1, 50, 50]),
+        ]
@@ -2,11 +2,16 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-from psycopg2.sql import SQL, Identifier
+from psycopg2.sql import SQL, Identifier, Placeholder
 from viixoo_core.models.postgres import PostgresModel
 from typing import Optional
 
 
+def row_values(count):
+    """Return the VALUES tuple of a row of ``count`` columns."""
+    return SQL("({})").format(SQL(", ").join([Placeholder()] * count))
+
+
 class MockPostgresModel(PostgresModel):
     """A mock class for testing the query_insert method of the PostgresModel class."""
 
@@ -46,11 +51,13 @@ class TestPostgresModelQueryInsert:
         mock_get_connection.assert_called_once()
         mock_cursor.execute.assert_called_once()
         assert results == mock_result
-        assert mock_cursor.execute.call_args[0][1] == [["Test 1", 10]]
+        assert mock_cursor.execute.call_args[0][1] == ["Test 1", 10]
         # Check query
         expected_query = SQL(
-            "INSERT INTO {table} ({cols}) VALUES %s RETURNING id"
+            "INSERT INTO {table} ({cols}) VALUES {values} RETURNING {returning}"
         ).format(
+            returning=SQL(", ").join([Identifier("id")]),
+            values=SQL(", ").join([row_values(2)] * 1),
             table=Identifier("mock_table"),
             cols=SQL(", ").join(map(Identifier, ["name", "value"])),
         )
@@ -79,11 +86,13 @@ class TestPostgresModelQueryInsert:
         mock_cursor.execute.assert_called_once()
         assert results == mock_result
         # Check if the execute was called with multiple values
-        assert mock_cursor.execute.call_args[0][1] == [["Test 1", 10], ["Test 2", 20]]
+        assert mock_cursor.execute.call_args[0][1] == ["Test 1", 10, "Test 2", 20]
         # Check query
         expected_query = SQL(
-            "INSERT INTO {table} ({cols}) VALUES %s RETURNING id"
+            "INSERT INTO {table} ({cols}) VALUES {values} RETURNING {returning}"
         ).format(
+            returning=SQL(", ").join([Identifier("id")]),
+            values=SQL(", ").join([row_values(2)] * 2),
             table=Identifier("mock_table"),
             cols=SQL(", ").join(map(Identifier, ["name", "value"])),
         )
@@ -111,16 +120,43 @@ class TestPostgresModelQueryInsert:
         mock_cursor.execute.assert_called_once()
         assert results == mock_result
         # Check if the execute was called with multiple values
-        assert mock_cursor.execute.call_args[0][1] == [[1, "test", 10]]
+        assert mock_cursor.execute.call_args[0][1] == [1, "test", 10]
         # Check query
         expected_query = SQL(
-            "INSERT INTO {table} ({cols}) VALUES %s RETURNING id"
+            "INSERT INTO {table} ({cols}) VALUES {values} RETURNING {returning}"
         ).format(
+            returning=SQL(", ").join([Identifier("id")]),
+            values=SQL(", ").join([row_values(3)] * 1),
             table=Identifier("mock_table"),
             cols=SQL(", ").join(map(Identifier, ["id", "name", "value"])),
         )
         assert str(mock_cursor.execute.call_args[0][0]) == str(expected_query)
 
+    @patch.object(PostgresModel, "get_connection")
+    def test_query_insert_returning_all(self, mock_get_connection):
+        """Test query_insert returns every column when asked for ``*``."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+
+        model = MockPostgresModel(id=1)
+
+        # Act
+        model.query_insert([{"name": "Test 1", "value": 10}], returning="*")
+
+        # Assert
+        expected_query = SQL(
+            "INSERT INTO {table} ({cols}) VALUES {values} RETURNING {returning}"
+        ).format(
+            returning=SQL("*"),
+            values=SQL(", ").join([row_values(2)] * 1),
+            table=Identifier("mock_table"),
+            cols=SQL(", ").join(map(Identifier, ["name", "value"])),
+        )
+        assert str(mock_cursor.execute.call_args[0][0]) == str(expected_query)
+
     @patch.object(PostgresModel, "get_connection")
     def test_query_insert_error(self, mock_get_connection):
         """Test query_insert method when an error occurs."""
@@ -141,3 +177,89 @@ class TestPostgresModelQueryInsert:
         assert "Some error" in str(e.value)
         mock_get_connection.assert_called_once()
         mock_cursor.execute.assert_called_once()
+
+
+class TestPostgresModelBulkInsert:
+    """Tests for the bulk_insert method of the PostgresModel class."""
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_insert_chunks(self, mock_get_connection):
+        """Test bulk_insert sends the rows with COPY in chunks."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        copied = []
+        mock_cursor.copy_expert.side_effect = lambda query, buffer: copied.append(
+            (str(query), buffer.read())
+        )
+        rows = (
+            {"id": None, "name": name, "value": value}
+            for name, value in [("Test 1", 10), ('Say "hi"', None), ("", 30)]
+        )
+
+        model = MockPostgresModel(id=1)
+
+        # Act
+        count = model.bulk_insert(rows, chunk_size=2)
+
+        # Assert
+        assert count == 3
+        mock_get_connection.assert_called_once()
+        mock_cursor.execute.assert_not_called()
+        expected_query = SQL(
+            "COPY {table} ({cols}) FROM STDIN WITH (FORMAT csv)"
+        ).format(
+            table=Identifier("mock_table"),
+            cols=SQL(", ").join(map(Identifier, ["name", "value"])),
+        )
+        assert copied == [
+            (str(expected_query), '"Test 1","10"\n"Say ""hi""",\n'),
+            (str(expected_query), '"","30"\n'),
+        ]
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_insert_returning(self, mock_get_connection):
+        """Test bulk_insert returns the ids through the staging table."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_cursor.fetchall.side_effect = [[(7,), (8,)], [(9,)]]
+        rows = [
+            MockPostgresModel(id=1, name="Test 1", value=10),
+            MockPostgresModel(id=2, name="Test 2", value=20),
+            MockPostgresModel(id=3, name="Test 3", value=30),
+        ]
+
+        model = MockPostgresModel(id=1)
+
+        # Act
+        ids = model.bulk_insert(rows, chunk_size=2, returning=True)
+
+        # Assert
+        assert ids == [7, 8, 9]
+        assert mock_cursor.copy_expert.call_count == 2
+        staging = Identifier("_bulk_mock_table")
+        assert str(mock_cursor.copy_expert.call_args[0][0]) == str(
+            SQL("COPY {table} ({cols}) FROM STDIN WITH (FORMAT csv)").format(
+                table=staging,
+                cols=SQL(", ").join(map(Identifier, ["id", "name", "value"])),
+            )
+        )
+        queries = [str(call[0][0]) for call in mock_cursor.execute.call_args_list]
+        assert len(queries) == 5
+        assert "CREATE TEMP TABLE " in queries[0]
+        assert "ORDER BY ctid RETURNING id" in queries[1]
+        assert "TRUNCATE " in queries[2]
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_insert_empty(self, mock_get_connection):
+        """Test bulk_insert without rows does not touch the database."""
+        model = MockPostgresModel(id=1)
+
+        assert model.bulk_insert([]) == 0
+        assert model.bulk_insert(iter([]), returning=True) == []
+        mock_get_connection.assert_not_called()
@@ -4,7 +4,8 @@ import pytest
 from unittest.mock import MagicMock, patch
 from viixoo_core.models.postgres import PostgresModel
 from viixoo_core.models.domain import DomainTranslator
-from psycopg2.sql import SQL, Identifier
+from viixoo_core.models.keyset import keyset_condition, order_clause, parse_order
+from psycopg2.sql import SQL, Identifier, Placeholder
 
 
 class MockPostgresModel(PostgresModel):
@@ -45,19 +46,21 @@ class TestPostgresModelQuerySelect:
         # Act
         results = model.query_select()
         expected_query = SQL(
-            "SELECT {fields} FROM {table} {where_clause} LIMIT {limit} OFFSET {offset}"
+            "SELECT {fields} FROM {table} {where_clause} {order_by} "
+            "LIMIT {limit} OFFSET {offset}"
         ).format(
             fields=SQL("*"),
             table=Identifier("mock_table"),
-            where_clause=SQL(" 1=1 "),
-            limit=SQL("ALL"),
-            offset=SQL("0"),
+            where_clause=SQL(""),
+            order_by=SQL(""),
+            limit=Placeholder(),
+            offset=Placeholder(),
         )
 
         # Assert
         mock_get_connection.assert_called_once()
         mock_translate.assert_called_once_with([])
-        mock_cursor.execute.assert_called_once_with(expected_query, [])
+        mock_cursor.execute.assert_called_once_with(expected_query, [None, 0])
         assert results == mock_result
 
     @patch.object(PostgresModel, "get_connection")
@@ -90,18 +93,59 @@ class TestPostgresModelQuerySelect:
         mock_translate.assert_called_once_with(mock_domain)
         mock_cursor.execute.assert_called_once_with(
             SQL(
-                "SELECT {fields} FROM {table} {where_clause} LIMIT {limit} OFFSET {offset}"
+                "SELECT {fields} FROM {table} {where_clause} {order_by} "
+                "LIMIT {limit} OFFSET {offset}"
             ).format(
                 fields=SQL(", ").join(map(Identifier, mock_columns)),
                 table=Identifier("mock_table"),
                 where_clause=SQL(mock_where),
-                limit=SQL("ALL"),
-                offset=SQL("0"),
+                order_by=SQL(""),
+                limit=Placeholder(),
+                offset=Placeholder(),
             ),
-            mock_params,
+            mock_params + [None, 0],
         )
         assert results == mock_result
 
+    @patch.object(PostgresModel, "get_connection")
+    def test_query_select_keyset(self, mock_get_connection):
+        """Test query_select orders the rows and seeks after the given position."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        order = parse_order("name")
+
+        model = MockPostgresModel(id=1)
+
+        # Act
+        model.query_select(
+            domain=[("active", "=", True)], limit=10, order="name", after=["b", 4]
+        )
+
+        # Assert
+        query, params = mock_cursor.execute.call_args[0]
+        assert params == [True, "b", 4, 10, 0]
+        assert query == SQL(
+            "SELECT {fields} FROM {table} {where_clause} {order_by} "
+            "LIMIT {limit} OFFSET {offset}"
+        ).format(
+            fields=SQL("*"),
+            table=Identifier("mock_table"),
+            where_clause=SQL("{} AND {}").format(
+                SQL("WHERE active = %s"), keyset_condition(order)
+            ),
+            order_by=order_clause(order),
+            limit=Placeholder(),
+            offset=Placeholder(),
+        )
+
+    def test_query_select_after_requires_order(self):
+        """Test a keyset position without an order is rejected."""
+        with pytest.raises(ValueError):
+            MockPostgresModel(id=1).query_select(after=[1])
+
     @patch.object(PostgresModel, "get_connection")
     @patch.object(DomainTranslator, "translate")
     def test_query_select_error(self, mock_translate, mock_get_connection):
@@ -122,3 +166,54 @@ class TestPostgresModelQuerySelect:
             model.query_select()
         assert "Some error" in str(e.value)
         mock_get_connection.assert_called_once()
+
+
+class TestPostgresModelIterSelect:
+    """Tests for the iter_select method of the PostgresModel class."""
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_iter_select_server_side_cursor(self, mock_get_connection):
+        """Test iter_select streams the rows through a named cursor."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([{"id": 1}, {"id": 2}])
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+
+        model = MockPostgresModel(id=1)
+
+        # Act
+        rows = model.iter_select(domain=[("id", ">", 0)], itersize=500)
+
+        # Assert
+        mock_get_connection.assert_not_called()
+        assert list(rows) == [{"id": 1}, {"id": 2}]
+        assert mock_conn.cursor.call_args.kwargs["name"].startswith(
+            "mock_table_stream_"
+        )
+        assert mock_cursor.itersize == 500
+        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_args[0][1] == [0, None, 0]
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_iter_select_closed_early(self, mock_get_connection):
+        """Test closing the generator releases the cursor and the connection."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([{"id": 1}, {"id": 2}])
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+
+        model = MockPostgresModel(id=1)
+        rows = model.iter_select()
+
+        # Act
+        assert next(rows) == {"id": 1}
+        rows.close()
+
+        # Assert
+        mock_conn.cursor.return_value.__exit__.assert_called_once()
+        exit_args = mock_get_connection.return_value.__exit__.call_args[0]
+        assert exit_args[0] is GeneratorExit
@@ -1,7 +1,10 @@
 """Test the query_update method of the PostgresModel class."""
 
 import pytest
+import psycopg2.errors
 from unittest.mock import MagicMock, patch
+from psycopg2.sql import SQL, Identifier, Placeholder
+from viixoo_core.models import postgres
 from viixoo_core.models.postgres import PostgresModel
 from viixoo_core.models.domain import DomainTranslator
 from typing import Optional
@@ -81,6 +84,36 @@ class TestPostgresModelQueryUpdate:
         mock_cursor.execute.assert_called_once()
         assert results == mock_result
 
+    @patch.object(PostgresModel, "get_connection")
+    def test_query_update_positional_params(self, mock_get_connection):
+        """Test the values are sent before the domain parameters."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+
+        model = MockPostgresModel(id=1)
+
+        # Act
+        model.query_update(
+            rows=[{"name": "Test", "value": 20}], domain=[("id", "=", 1)]
+        )
+
+        # Assert
+        query, params = mock_cursor.execute.call_args[0]
+        assert params == ["Test", 20, 1]
+        assert query == SQL(
+            "UPDATE {table} SET {assignment} {where_clause} RETURNING id"
+        ).format(
+            table=Identifier("mock_table"),
+            assignment=SQL(", ").join(
+                SQL("{} = {}").format(Identifier(s), Placeholder())
+                for s in ["name", "value"]
+            ),
+            where_clause=SQL("WHERE id = %s"),
+        )
+
     @patch.object(PostgresModel, "get_connection")
     @patch.object(DomainTranslator, "translate")
     def test_query_update_error(self, mock_translate, mock_get_connection):
@@ -105,3 +138,130 @@ class TestPostgresModelQueryUpdate:
         mock_get_connection.assert_called_once()
         mock_translate.assert_called_once()
         mock_cursor.execute.assert_called_once()
+
+
+class TestPostgresModelBulkUpdate:
+    """Test the bulk_update method of the PostgresModel class."""
+
+    def setup_method(self):
+        """Forget the column types read by other tests."""
+        postgres._column_types.clear()
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_update_values_join(self, mock_get_connection):
+        """Test bulk_update sends the rows as a VALUES list joined on the key."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_cursor.fetchall.side_effect = [
+            [("id", "integer"), ("name", "character varying"), ("value", "integer")],
+            [(1,), (2,)],
+            [(3,)],
+        ]
+        rows = [
+            {"id": 1, "name": "Test 1", "value": 10},
+            {"id": 2, "name": "Test 2", "value": 20},
+            MockPostgresModel(id=3, name="Test 3", value=30),
+        ]
+        model = MockPostgresModel(id=1)
+
+        # Act
+        result = model.bulk_update(rows, chunk_size=2)
+
+        # Assert
+        assert result == [1, 2, 3]
+        mock_get_connection.assert_called_once()
+        calls = mock_cursor.execute.call_args_list
+        assert len(calls) == 3
+        assert calls[0][0][1] == ["mock_table"]
+        row_template = SQL("({})").format(
+            SQL(", ").join(
+                SQL("{}::{}").format(Placeholder(), SQL(sql_type))
+                for sql_type in ("integer", "character varying", "integer")
+            )
+        )
+        expected_query = SQL(
+            "UPDATE {table} AS t SET {assignment} FROM (VALUES {values}) "
+            "AS v ({cols}) WHERE t.{key} = v.{key} RETURNING t.id"
+        ).format(
+            table=Identifier("mock_table"),
+            assignment=SQL(", ").join(
+                SQL("{} = v.{}").format(Identifier(s), Identifier(s))
+                for s in ("name", "value")
+            ),
+            values=SQL(", ").join([row_template] * 2),
+            cols=SQL(", ").join(map(Identifier, ["id", "name", "value"])),
+            key=Identifier("id"),
+        )
+        assert calls[1][0] == (expected_query, [1, "Test 1", 10, 2, "Test 2", 20])
+        assert calls[2][0][1] == [3, "Test 3", 30]
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_update_column_types_cached(self, mock_get_connection):
+        """Test the column types are read once per table."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_cursor.fetchall.side_effect = [
+            [("id", "integer"), ("value", "integer")],
+            [(1,)],
+            [(1,)],
+        ]
+        model = MockPostgresModel(id=1)
+
+        # Act
+        model.bulk_update([{"id": 1, "value": 10}])
+        model.bulk_update([{"id": 1, "value": 20}])
+
+        # Assert
+        assert mock_cursor.execute.call_count == 3
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_update_value_too_long(self, mock_get_connection):
+        """Test an over-length value fails instead of being truncated by the cast."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_cursor.fetchall.return_value = [
+            ("id", "integer"),
+            ("name", "character varying"),
+        ]
+        mock_cursor.execute.side_effect = [
+            None,
+            psycopg2.errors.StringDataRightTruncation(
+                "value too long for type character varying(5)"
+            ),
+        ]
+        model = MockPostgresModel(id=1)
+
+        # Act & Assert
+        with pytest.raises(psycopg2.errors.StringDataRightTruncation):
+            model.bulk_update([{"id": 1, "name": "Too long"}])
+        catalog_query = mock_cursor.execute.call_args_list[0][0][0]
+        assert "format_type(atttypid, NULL)" in catalog_query
+
+    @patch.object(PostgresModel, "get_connection")
+    def test_bulk_update_invalid_rows(self, mock_get_connection):
+        """Test bulk_update rejects rows without key or with unknown columns."""
+        # Arrange
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_cursor.fetchall.return_value = [("id", "integer")]
+        model = MockPostgresModel(id=1)
+
+        # Act & Assert
+        assert model.bulk_update([]) == []
+        with pytest.raises(ValueError) as e:
+            model.bulk_update([{"name": "Test"}])
+        assert "key column 'id'" in str(e.value)
+        with pytest.raises(ValueError) as e:
+            model.bulk_update([{"id": 1, "name": "Test"}])
+        assert "Unknown columns" in str(e.value)
@@ -0,0 +1 @@
+"""Init Package."""
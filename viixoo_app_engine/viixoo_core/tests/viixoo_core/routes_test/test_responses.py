@@ -0,0 +1,58 @@
+"""Tests for the fast JSON parsing and responses."""
+
+import json
+from unittest.mock import patch
+from pydantic import BaseModel
+from viixoo_core.routes import responses
+from viixoo_core.routes.responses import (
+    FastJSONResponse,
+    dumps,
+    etag_matches,
+    etag_response,
+    loads,
+)
+
+
+class Item(BaseModel):
+    """A model serialized by the tests."""
+
+    name: str
+    quantity: float | None = None
+
+
+class TestResponses:
+    """Test the JSON parsing and the FastJSONResponse class."""
+
+    def test_loads_bytes(self):
+        """Test a document is parsed from bytes, with and without orjson."""
+        content = json.dumps({"name": "Ñandú", "ids": [1, 2]}).encode()
+
+        with patch.object(responses, "orjson", None):
+            fallback = loads(content)
+
+        assert loads(content) == fallback == {"name": "Ñandú", "ids": [1, 2]}
+
+    def test_render_model(self):
+        """Test a model is written straight to JSON bytes."""
+        response = FastJSONResponse(Item(name="A"))
+
+        assert response.body == b'{"name":"A","quantity":null}'
+        assert response.headers["content-type"] == "application/json"
+
+    def test_dumps_without_orjson(self):
+        """Test documents are serialized with the standard library without orjson."""
+        with patch.object(responses, "orjson", None):
+            body = dumps({"name": "Ñandú", 1: True})
+
+        assert json.loads(body) == {"name": "Ñandú", "1": True}
+
+    def test_etag(self):
+        """Test If-None-Match is matched against the ETag of the response."""
+        etag = '"abc"'
+
+        assert etag_matches('"x", W/"abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"x"', etag)
+        assert not etag_matches(None, etag)
+        assert etag_response(etag, b"{}", '"abc"').status_code == 304
+        assert etag_response(etag, b"{}", '"x"').body == b"{}"
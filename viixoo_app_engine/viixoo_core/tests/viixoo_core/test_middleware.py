@@ -0,0 +1,101 @@
+"""Tests for the compression middleware."""
+
+import gzip
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.testclient import TestClient
+from viixoo_core import middleware
+from viixoo_core.middleware import CompressionMiddleware, parse_accept_encoding
+
+BODY = '{"data": [' + ", ".join(['{"name": "op"}'] * 200) + "]}"
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+@app.get("/json")
+async def json_body():
+    """Return a large JSON body with an ETag."""
+    return Response(BODY, media_type="application/json", headers={"ETag": '"v1"'})
+
+
+@app.get("/small")
+async def small_body():
+    """Return a JSON body under the minimum size."""
+    return Response("{}", media_type="application/json")
+
+
+@app.get("/image")
+async def image_body():
+    """Return a body of a content type not compressed."""
+    return Response(b"\0" * 2000, media_type="image/png")
+
+
+@app.get("/stream")
+async def stream_body():
+    """Return a streamed text body."""
+    return StreamingResponse((chunk for chunk in [BODY, BODY]), media_type="text/plain")
+
+
+@app.get("/text")
+async def text_body():
+    """Return a large text body."""
+    return PlainTextResponse(BODY)
+
+
+client = TestClient(app)
+
+
+class TestCompressionMiddleware:
+    """Test the compression of the responses."""
+
+    def test_gzip(self):
+        """Test a large JSON body is compressed and its ETag weakened."""
+        response = client.get("/json", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(BODY)
+        assert response.text == BODY
+
+    def test_not_compressed(self):
+        """Test small bodies, other types and clients without gzip are not compressed."""
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        image = client.get("/image", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/json", headers={"Accept-Encoding": "identity"})
+
+        for response in (small, image, identity):
+            assert "content-encoding" not in response.headers
+        assert identity.headers["etag"] == '"v1"'
+
+    def test_stream(self):
+        """Test a streamed body is compressed chunk by chunk."""
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == BODY * 2
+
+    def test_brotli_preferred(self):
+        """Test brotli is used when installed and accepted."""
+
+        class FakeBrotli:
+            """Brotli stand-in compressing with gzip."""
+
+            @staticmethod
+            def compress(body, quality):
+                return gzip.compress(body)
+
+        with patch.object(middleware, "brotli", FakeBrotli):
+            response = client.get(
+                "/text",
+                headers={"Accept-Encoding": "gzip, br"},
+            )
+
+        assert response.headers["content-encoding"] == "br"
+
+    def test_parse_accept_encoding(self):
+        """Test the encodings refused with q=0 are ignored."""
+        assert parse_accept_encoding("gzip;q=0, br;q=0.8, *") == ["br", "*"]
@@ -6,6 +6,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from viixoo_core.import_utils import APPS_PATH, ImportUtils
 from starlette.middleware.cors import CORSMiddleware
+from viixoo_core.middleware import CompressionMiddleware, DEFAULT_COMPRESSIBLE_TYPES
 import os
 from dotenv import load_dotenv
 
@@ -28,6 +29,18 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+compressible_types = os.getenv("COMPRESSION_TYPES", "")
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024)),
+    gzip_level=int(os.getenv("COMPRESSION_GZIP_LEVEL", 6)),
+    brotli_quality=int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4)),
+    content_types=(
+        [media_type.strip() for media_type in compressible_types.split(",")]
+        if compressible_types
+        else DEFAULT_COMPRESSIBLE_TYPES
+    ),
+)
 
 router = APIRouter()
 controller = BaseController(router)
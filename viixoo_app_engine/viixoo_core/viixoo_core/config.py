@@ -1,14 +1,21 @@
 """Settings module."""
 
 import os
+import time
+import threading
 import configparser
 from abc import ABC
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 
 
 class BaseConfig(ABC):
     """Base class for database configuration, allowing reading from environment variables or `.conf` files."""
 
+    # Reload the configuration when its .conf file changes
+    watch_files: bool = os.getenv("VIIXOO_CONFIG_WATCH", "").lower() in ("1", "true")
+    watch_interval: float = float(os.getenv("VIIXOO_CONFIG_WATCH_INTERVAL", 2))
+
     @classmethod
     def from_env(cls, module) -> Dict[str, Any]:
         """Read the settings from environment variables."""
@@ -19,6 +26,17 @@ class BaseConfig(ABC):
             "password": os.getenv(f"{module}_DB_PASSWORD", ""),
             "host": os.getenv(f"{module}_DB_HOST", "localhost"),
             "port": int(os.getenv(f"{module}_DB_PORT", 5432)),
+            "pool_minconn": int(os.getenv(f"{module}_DB_POOL_MINCONN", 1)),
+            "pool_maxconn": int(os.getenv(f"{module}_DB_POOL_MAXCONN", 10)),
+            "pool_max_idle": float(os.getenv(f"{module}_DB_POOL_MAX_IDLE", 300)),
+            "pool_timeout": float(os.getenv(f"{module}_DB_POOL_TIMEOUT", 30)),
+            "pool_health_check": float(os.getenv(f"{module}_DB_POOL_HEALTH_CHECK", 30)),
+            "prepared_statements": int(
+                os.getenv(f"{module}_DB_PREPARED_STATEMENTS", 0)
+            ),
+            "async_statement_cache_size": int(
+                os.getenv(f"{module}_DB_ASYNC_STATEMENT_CACHE_SIZE", 100)
+            ),
         }
         return config
 
@@ -38,16 +56,99 @@ class BaseConfig(ABC):
             "password": config.get("database", "password", fallback=""),
             "host": config.get("database", "host", fallback="localhost"),
             "port": config.getint("database", "port", fallback=5432),
+            "pool_minconn": config.getint("database", "pool_minconn", fallback=1),
+            "pool_maxconn": config.getint("database", "pool_maxconn", fallback=10),
+            "pool_max_idle": config.getfloat("database", "pool_max_idle", fallback=300),
+            "pool_timeout": config.getfloat("database", "pool_timeout", fallback=30),
+            "pool_health_check": config.getfloat(
+                "database", "pool_health_check", fallback=30
+            ),
+            "prepared_statements": config.getint(
+                "database", "prepared_statements", fallback=0
+            ),
+            "async_statement_cache_size": config.getint(
+                "database", "async_statement_cache_size", fallback=100
+            ),
         }
 
     @classmethod
-    def get_config(cls, base_path: str, module: str) -> Dict[str, Any]:
-        """Obtiene la configuración, ya sea desde variables de entorno o archivo .conf."""
+    def resolve_config(cls, base_path: str, module: str) -> Tuple[Dict[str, Any], str]:
+        """Read the configuration, either from environment variables or a .conf file.
+
+        :return: The configuration and the path of the .conf file read, if any
+        """
         # We prefer environment variables, if they are not there, we use the .conf file
         config = cls.from_env(module=module)
+        file_path = None
         if not config["db_type"]:
             file_path = os.path.join(base_path, f"{module}", f"{module}.conf")
             file_config = cls.from_file(file_path)
             print(f"📂 Config from file: {file_path}")
             config = {**config, **file_config}
-        return config
+        return config, file_path
+
+    @classmethod
+    def get_config(cls, base_path: str, module: str) -> Dict[str, Any]:
+        """Obtiene la configuración, ya sea desde variables de entorno o archivo .conf.
+
+        The resolved configuration is cached per ``(base_path, module)`` until
+        ``invalidate`` is called. When ``watch_files`` is enabled, the modification
+        time of the .conf file is checked at most every ``watch_interval`` seconds
+        and the configuration is read again when the file changes.
+        """
+        key = (base_path, module)
+        entry = _config_cache.get(key)
+        if entry is not None:
+            if not cls.watch_files or not entry.file_path:
+                return dict(entry.config)
+            now = time.monotonic()
+            if now - entry.checked_at < cls.watch_interval:
+                return dict(entry.config)
+            if _get_mtime(entry.file_path) == entry.mtime:
+                entry.checked_at = now
+                return dict(entry.config)
+
+        with _config_lock:
+            config, file_path = cls.resolve_config(base_path, module)
+            _config_cache[key] = _CachedConfig(
+                config=config,
+                file_path=file_path,
+                mtime=_get_mtime(file_path) if file_path else None,
+                checked_at=time.monotonic(),
+            )
+        return dict(config)
+
+    @classmethod
+    def invalidate(cls, base_path: str = None, module: str = None):
+        """Drop the cached configuration.
+
+        :param base_path: The base path of the cached configuration, all paths if not given
+        :param module: The module of the cached configuration, all modules if not given
+        """
+        with _config_lock:
+            for key in list(_config_cache):
+                if base_path not in (None, key[0]) or module not in (None, key[1]):
+                    continue
+                del _config_cache[key]
+
+
+@dataclass
+class _CachedConfig:
+    """Configuration resolved by BaseConfig.get_config."""
+
+    config: Dict[str, Any]
+    file_path: Optional[str]
+    mtime: Optional[float]
+    checked_at: float
+
+
+def _get_mtime(file_path: str) -> Optional[float]:
+    """Return the modification time of a file, None if it does not exist."""
+    try:
+        return os.stat(file_path).st_mtime
+    except OSError:
+        return None
+
+
+_config_cache: Dict[Tuple[str, str], _CachedConfig] = {}
+_config_lock = threading.Lock()
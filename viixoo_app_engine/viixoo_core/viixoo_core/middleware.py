@@ -0,0 +1,176 @@
+"""ASGI middlewares of the application."""
+
+import gzip
+import zlib
+from typing import Iterable, List, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "text/html",
+    "text/plain",
+    "text/css",
+)
+
+
+def parse_accept_encoding(value: str) -> List[str]:
+    """Return the encodings accepted by a client, without the ones with ``q=0``.
+
+    :param value: The value of the ``Accept-Encoding`` header
+    :return: The encodings, in lowercase
+    """
+    encodings = []
+    for part in value.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, number = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            encodings.append(name.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """Compress the responses with brotli or gzip, as the client accepts.
+
+    Brotli is preferred when the ``brotli`` package is installed. Only the responses
+    of the allowed content types and of at least ``minimum_size`` bytes are
+    compressed; the others, and the responses already encoded, are sent as they are.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Iterable[str] = DEFAULT_COMPRESSIBLE_TYPES,
+    ):
+        """Initialize a CompressionMiddleware instance.
+
+        :param app: The ASGI application
+        :param minimum_size: The minimum size of a body to compress it, in bytes
+        :param gzip_level: The gzip compression level, from 1 to 9
+        :param brotli_quality: The brotli quality, from 0 to 11
+        :param content_types: The media types compressed
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = frozenset(content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run the application, compressing its response if possible."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accepted = parse_accept_encoding(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if brotli is not None and "br" in accepted:
+            encoding = "br"
+        elif "gzip" in accepted:
+            encoding = "gzip"
+        else:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Compress the messages of one response."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        """Initialize the responder of a response."""
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start: Message = None
+        self.compress = None
+        self.flush = None
+        self.passthrough = False
+
+    async def send(self, message: Message):
+        """Send a message of the response, compressed if needed."""
+        if message["type"] == "http.response.start":
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").split(";")[0].strip()
+            self.passthrough = (
+                "content-encoding" in headers
+                or media_type not in self.middleware.content_types
+            )
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compress is None:
+            if not more_body:
+                # The whole body is known: compress it in one go, if large enough
+                if len(body) >= self.middleware.minimum_size:
+                    body = self._compress_all(body)
+                    self._set_headers(len(body))
+                await self._flush_start()
+                await self._send({**message, "body": body})
+                return
+            self.compress, self.flush = self._compressor()
+            self._set_headers(None)
+            await self._flush_start()
+        chunk = self.compress(body)
+        if not more_body:
+            chunk += self.flush()
+        await self._send({**message, "body": chunk})
+
+    async def _flush_start(self):
+        """Send the start message, once."""
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self._send(start)
+
+    def _set_headers(self, length: int | None):
+        """Set the headers of the compressed response."""
+        headers = MutableHeaders(scope=self.start)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+        # The compressed body is a different representation of the same content
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+
+    def _compress_all(self, body: bytes) -> bytes:
+        """Compress a whole body."""
+        if self.encoding == "br":
+            return brotli.compress(body, quality=self.middleware.brotli_quality)
+        return gzip.compress(body, compresslevel=self.middleware.gzip_level, mtime=0)
+
+    def _compressor(self) -> Tuple:
+        """Return the functions compressing a streamed body and flushing its end."""
+        if self.encoding == "br":
+            compressor = brotli.Compressor(quality=self.middleware.brotli_quality)
+            return compressor.process, compressor.finish
+        compressor = zlib.compressobj(
+            self.middleware.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+        return compressor.compress, compressor.flush
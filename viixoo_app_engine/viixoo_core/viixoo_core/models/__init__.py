@@ -1,3 +1,9 @@
 from . import base  # noqa
 from . import domain  # noqa
+from . import keyset  # noqa
+from . import prepared  # noqa
+from . import pool  # noqa
 from . import postgres  # noqa
+from . import async_pool  # noqa
+from . import async_postgres  # noqa
+from . import channel  # noqa
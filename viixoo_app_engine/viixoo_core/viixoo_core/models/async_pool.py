@@ -0,0 +1,103 @@
+"""Asyncio connection pools for the async PostgreSQL models, based on asyncpg."""
+
+import os
+import asyncio
+from typing import Dict, Any, Tuple
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - optional dependency
+    asyncpg = None
+
+# Pools being created or created, per event loop, module and DSN
+_async_pools: Dict[Tuple, "asyncio.Future"] = {}
+_async_pools_pid = os.getpid()
+
+
+async def get_async_pool(module: str, config: Dict[str, Any]) -> "asyncpg.Pool":
+    """Return the asyncpg pool of the given module and DSN, creating it on first use.
+
+    The pools are bound to the event loop running the call. Concurrent first calls
+    wait for the same pool instead of each opening one.
+
+    :param module: The module owning the models
+    :param config: The database configuration of the module
+    :return: The connection pool
+    """
+    global _async_pools_pid
+
+    if asyncpg is None:
+        raise RuntimeError(
+            "asyncpg is required by the async models: pip install viixoo_core[async]"
+        )
+    if _async_pools_pid != os.getpid():
+        # Connections cannot be shared with a forked worker
+        _async_pools.clear()
+        _async_pools_pid = os.getpid()
+
+    dsn = async_dsn(config)
+    loop = asyncio.get_running_loop()
+    key = (id(loop), module, *dsn.values())
+    future = _async_pools.get(key)
+    if future is None or (future.done() and _is_unusable(future)):
+        future = _async_pools[key] = loop.create_task(
+            asyncpg.create_pool(
+                **dsn,
+                min_size=int(config.get("pool_minconn", 1)),
+                max_size=int(config.get("pool_maxconn", 10)),
+                max_inactive_connection_lifetime=float(
+                    config.get("pool_max_idle", 300)
+                ),
+                timeout=float(config.get("pool_timeout", 30)),
+                # asyncpg's own prepared statement cache, distinct from the
+                # PREPARE cache of the psycopg2 pools (prepared_statements)
+                statement_cache_size=int(config.get("async_statement_cache_size", 100)),
+            )
+        )
+    return await asyncio.shield(future)
+
+
+def async_dsn(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the connection arguments of asyncpg for a database configuration."""
+    return {
+        "database": config["dbname"],
+        "user": config["user"],
+        "password": config["password"],
+        "host": config["host"],
+        "port": config["port"],
+    }
+
+
+def _is_unusable(future: "asyncio.Future") -> bool:
+    """Tell whether a pool creation failed or its pool was closed."""
+    if future.cancelled() or future.exception() is not None:
+        return True
+    return future.result().is_closing()
+
+
+def async_pools_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the sizes of every async pool, keyed by ``module:user@host:port/dbname``."""
+    stats = {}
+    for key, future in list(_async_pools.items()):
+        if not future.done() or _is_unusable(future):
+            continue
+        pool = future.result()
+        stats[f"{key[1]}:{key[3]}@{key[5]}:{key[6]}/{key[2]}"] = {
+            "size": pool.get_size(),
+            "idle": pool.get_idle_size(),
+            "in_use": pool.get_size() - pool.get_idle_size(),
+            "minconn": pool.get_min_size(),
+            "maxconn": pool.get_max_size(),
+        }
+    return stats
+
+
+async def close_all_async():
+    """Close the async pools of the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    for key, future in list(_async_pools.items()):
+        if key[0] != loop_id:
+            continue
+        del _async_pools[key]
+        if future.done() and not _is_unusable(future):
+            await future.result().close()
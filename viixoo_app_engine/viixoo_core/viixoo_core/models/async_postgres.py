@@ -0,0 +1,246 @@
+"""Async base model class, for models used from async FastAPI routes."""
+
+import importlib
+from contextlib import asynccontextmanager
+from psycopg2.sql import Composable, Composed, Identifier, Literal, SQL, Placeholder
+from typing import Dict, Any, List, Tuple
+from viixoo_core.models.base import BaseDBModel
+from viixoo_core.models.async_pool import get_async_pool
+from viixoo_core.models.postgres import PostgresQueryBuilder
+from viixoo_core.models.prepared import to_dollar_params
+from viixoo_core.config import BaseConfig
+
+
+def render_query(query: Composable, params: List[Any]) -> Tuple[str, List[Any]]:
+    """Render a ``psycopg2.sql`` query with ``$n`` placeholders, as asyncpg expects.
+
+    :param query: A query built with ``psycopg2.sql`` using positional placeholders
+    :param params: The parameters of the query
+    :return: The query text and its parameters
+    """
+    rendered = to_dollar_params(_as_string(query))
+    if rendered is None:
+        raise ValueError("Named placeholders are not supported.")
+    text, count = rendered
+    if count != len(params):
+        raise ValueError(f"The query expects {count} parameters, {len(params)} given.")
+    return text, list(params)
+
+
+def _as_string(query: Composable) -> str:
+    """Return the text of a query without needing a psycopg2 connection."""
+    if isinstance(query, Composed):
+        return "".join(_as_string(part) for part in query.seq)
+    if isinstance(query, SQL):
+        return query.string
+    if isinstance(query, Identifier):
+        return ".".join('"' + name.replace('"', '""') + '"' for name in query.strings)
+    if isinstance(query, Placeholder):
+        if query.name:
+            raise ValueError("Named placeholders are not supported.")
+        return "%s"
+    if isinstance(query, Literal) and isinstance(query.wrapped, int):
+        return str(int(query.wrapped))
+    raise TypeError(f"Unsupported query part: {query!r}")
+
+
+class AsyncPostgresModel(PostgresQueryBuilder, BaseDBModel):
+    """PostgreSQL Base model with async queries, run on an asyncpg pool.
+
+    It builds the same SQL as ``PostgresModel`` and shares the ``DomainTranslator``;
+    every method touching the database is a coroutine.
+    """
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """Get a database connection from the async pool of the model's module.
+
+        Use it as an async context manager: the connection is acquired from the pool,
+        the block runs in a transaction and the connection goes back to the pool on exit.
+        """
+        # Get the package name where the model is defined
+        package_name = self.__class__.__module__.split(".")
+
+        module = importlib.import_module(package_name[0])
+
+        # Get the base path of the package
+        basepath = module.__path__[0]
+
+        # Load the configuration for the package
+        config = BaseConfig.get_config(base_path=basepath, module=package_name[1])
+
+        pool = await get_async_pool(package_name[1], config)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+    async def _fetch(self, query: Composable, params: List[Any]) -> List[Dict]:
+        """Run a query and return its rows as dictionaries."""
+        text, args = render_query(query, params)
+        async with self.get_connection() as conn:
+            records = await conn.fetch(text, *args)
+        return [dict(record) for record in records]
+
+    async def load_model(
+        self,
+        model_class: BaseDBModel = None,
+        domain: List[Any] = [],
+        trusted: bool = None,
+    ) -> List[BaseDBModel]:
+        """Load a model from the database.
+
+        :param model_class: The class of the model to load
+        :param domain: A list of tuples, each containing a field name, an operator and a value
+        :param trusted: Build the models without validating the rows (see ``__trusted__``)
+        :return: A list of models loaded from the database
+        """
+        query_results = await self.query_select(domain=domain)
+        return list(self._hydrate(query_results, model_class, trusted))
+
+    async def query_select(
+        self,
+        columns: List[str] = False,
+        domain: List[Any] = [],
+        limit: int = 0,
+        offset: int = 0,
+        order: str = None,
+        after: List[Any] = None,
+    ) -> List[Dict]:
+        """Select the given columns from the table. Filter by domain. If no domain is given, return all rows.
+
+        :param columns: A list of column names to select
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :param limit: The maximum number of rows to return
+        :param offset: The number of rows to skip before returning rows
+        :param order: The ORDER BY specification, e.g. ``"name ASC, id DESC"``
+        :param after: The values of the order columns of a row; only the rows after it are returned
+        :return: A list of dictionaries, each representing a row in the table
+        """
+        query, params = self._select_query(columns, domain, limit, offset, order, after)
+        return await self._fetch(query, params)
+
+    async def query_insert(
+        self, rows: List[Dict] = [], returning: List[str] | str = "id"
+    ) -> List[Dict]:
+        """Insert the given rows into the table.
+
+        :param rows: A list of dictionaries
+        :param returning: The columns returned for every row inserted, ``"*"`` for all of them
+        :return: A list of dictionaries with the returned columns of the rows inserted, in the order of the rows
+        """
+        if not rows:
+            rows = [self.model_dump()]
+
+        query, params = self._insert_query(rows, returning)
+        return await self._fetch(query, params)
+
+    async def query_update(
+        self, rows: List[Dict] = [], domain: List[Any] = []
+    ) -> List[Dict]:
+        """Update the given rows in the table. Filter by domain. If no domain is given, update all rows.
+
+        :param rows: A list of dictionaries. The values of the first one are set on the rows matching the domain
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :return: A list of ids of the rows updated
+        """
+        if not rows:
+            rows = [self.model_dump()]
+
+        query, params = self._update_query(rows, domain)
+        return await self._fetch(query, params)
+
+    async def query_delete(self, domain: List[Any]) -> bool:
+        """Delete the given rows from the table.
+
+        Filter by domain. If no domain is given, raise a ValueError.
+
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :return: True if the rows were deleted successfully, False otherwise
+        """
+        if not domain:
+            raise ValueError("Domain is required to delete rows.")
+
+        query, params = self._delete_query(domain)
+        text, args = render_query(query, params)
+        async with self.get_connection() as conn:
+            await conn.execute(text, *args)
+        return True
+
+    async def write(self, rows: List[Dict] = [], domain: List[Any] = []) -> List[int]:
+        """Write the given rows to the table.
+
+        :param rows: A list of dictionaries
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :return: A list of ids of the rows written
+        """
+        if not rows:
+            rows = [self.model_dump()]
+
+        if not domain:
+            domain = [("id", "=", self.id)]
+
+        return await self.query_update(rows, domain)
+
+    async def create(self, rows: List[Dict] = []) -> List[BaseDBModel]:
+        """
+        Create the given rows to the table, in a single ``INSERT ... RETURNING *``.
+
+        :param rows: A list of dictionaries. A null ``id`` is left to the sequence
+        :return: A list of models created, in the order of the rows
+        """
+        if not rows:
+            rows = [self.model_dump()]
+
+        if all(row.get("id", 0) is None for row in rows):
+            rows = [{k: v for k, v in row.items() if k != "id"} for row in rows]
+
+        created = await self.query_insert(rows, returning="*")
+        return [self.__class__(**row) for row in created]
+
+    async def search(
+        self, domain: List[Any] = [], limit: int = 0, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the given rows from the table, sorted by ``__order__``. Filter by domain. If no domain is given, return all rows.
+
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :param limit: The maximum number of rows to return
+        :param offset: The number of rows to skip
+        :return: A list of dictionaries
+        """
+        return await self.query_select(
+            domain=domain, limit=limit, offset=offset, order=self.__order__
+        )
+
+    async def search_load(
+        self, domain: List[Any] = [], limit: int = 0, trusted: bool = None
+    ) -> List[BaseDBModel]:
+        """
+        Read the given rows from the table as models, sorted by ``__order__``.
+
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :param limit: The maximum number of models to return
+        :param trusted: Build the models without validating the rows (see ``__trusted__``)
+        :return: A list of models
+        """
+        query_results = await self.query_select(
+            domain=domain, limit=limit, order=self.__order__
+        )
+        return list(self._hydrate(query_results, trusted=trusted))
+
+    async def delete(self, domain: List[Any]) -> bool:
+        """Delete the given rows from the table. Filter by domain. If no domain is given, raise a ValueError.
+
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :return: True if the rows were deleted successfully, False otherwise
+        """
+        if not domain:
+            raise ValueError("Domain is required to delete rows.")
+        return await self.query_delete(domain)
@@ -12,6 +12,7 @@ class BaseDBModel(BaseModel, ABC):
     __tablename__ = "table_name"  # Debe ser definido en cada modelo
     __description__ = "model_description"  # Debe ser definido en cada modelo
     __order__ = "id"  # Debe ser definido en cada modelo
+    __trusted__ = False  # Cargar los registros sin validarlos
 
     id: Optional[Annotated[int, Field(json_schema_extra=dict(primary_key=True))]] = None
 
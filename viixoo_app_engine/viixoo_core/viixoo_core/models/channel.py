@@ -0,0 +1,181 @@
+"""Messages shared by the workers of an application, through PostgreSQL LISTEN/NOTIFY."""
+
+import json
+import asyncio
+import logging
+import weakref
+from typing import Any, Callable, Dict, List, Set
+
+from viixoo_core.models.async_pool import async_dsn, get_async_pool
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - optional dependency
+    asyncpg = None
+
+_logger = logging.getLogger(__name__)
+
+
+class LocalChannel:
+    """Messages delivered to the handlers of this process only.
+
+    It is enough with a single worker; with several, use a ``PostgresChannel`` so
+    the messages published by one worker reach the others.
+    """
+
+    def __init__(self):
+        """Initialize a LocalChannel instance."""
+        self._handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, topic: str, handler: Callable[[Dict[str, Any]], None]):
+        """Call a function with the data of every message of a topic.
+
+        :param topic: The topic of the messages
+        :param handler: A function receiving the data of the message
+        """
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def publish(self, topic: str, data: Dict[str, Any]):
+        """Send a message to the handlers of its topic.
+
+        :param topic: The topic of the message
+        :param data: The data of the message, serializable as JSON
+        """
+        self.published += 1
+        self._deliver(topic, data)
+
+    async def start(self) -> bool:
+        """Start receiving the messages; nothing to do in a single process."""
+        return True
+
+    def _deliver(self, topic: str, data: Dict[str, Any]):
+        """Call the handlers of a topic, an error in one not stopping the others."""
+        self.received += 1
+        for handler in self._handlers.get(topic, ()):
+            try:
+                handler(data)
+            except Exception as e:
+                _logger.error("Error handling a message of %s: %s", topic, e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of messages published and received."""
+        return {"published": self.published, "received": self.received}
+
+
+class PostgresChannel(LocalChannel):
+    """Messages delivered to every process listening on a PostgreSQL channel.
+
+    ``start`` opens, once per event loop, a connection running ``LISTEN`` on the
+    channel. ``publish`` sends the message with ``NOTIFY`` through the async pool of
+    the module, and every listening process, the publisher included, delivers it to
+    its handlers. When the notification cannot be sent, or this process cannot
+    listen, the message is delivered to the handlers of this process only.
+    PostgreSQL limits a notification to 8000 bytes, so messages must stay small.
+    """
+
+    def __init__(self, channel: str, module: str, config: Dict[str, Any]):
+        """Initialize a PostgresChannel instance.
+
+        :param channel: The name of the PostgreSQL channel
+        :param module: The module whose async pool sends the notifications
+        :param config: The database configuration of the module
+        """
+        if asyncpg is None:
+            raise RuntimeError(
+                "asyncpg is required by PostgresChannel: pip install viixoo_core[async]"
+            )
+        super().__init__()
+        self.channel = channel
+        self.module = module
+        self.config = config
+        self.failed = 0
+        self._listeners: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Future]"
+        ) = weakref.WeakKeyDictionary()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> bool:
+        """Listen on the channel in the running event loop, once.
+
+        A failure is logged and the connection is opened again on the next call.
+
+        :return: Whether this process is listening
+        """
+        loop = asyncio.get_running_loop()
+        future = self._listeners.get(loop)
+        if future is None or (future.done() and _is_closed(future)):
+            future = self._listeners[loop] = loop.create_task(self._listen())
+        try:
+            await asyncio.shield(future)
+        except Exception as e:
+            _logger.error("Cannot listen on the channel %s: %s", self.channel, e)
+            return False
+        return True
+
+    async def _listen(self) -> "asyncpg.Connection":
+        """Open the connection listening on the channel."""
+        connection = await asyncpg.connect(**async_dsn(self.config))
+        await connection.add_listener(self.channel, self._on_notification)
+        return connection
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str):
+        """Deliver a notification received on the channel."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            _logger.error("Invalid message on the channel %s: %s", channel, payload)
+            return
+        self._deliver(message["topic"], message["data"])
+
+    def publish(self, topic: str, data: Dict[str, Any]):
+        """Send a message to the handlers of its topic in every listening process.
+
+        The notification is sent in the background, so it must be called from a
+        running event loop.
+
+        :param topic: The topic of the message
+        :param data: The data of the message, serializable as JSON
+        """
+        task = asyncio.ensure_future(self._notify(topic, data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _notify(self, topic: str, data: Dict[str, Any]):
+        """Send a message with NOTIFY, or deliver it locally if that fails."""
+        try:
+            listening = await self.start()
+            pool = await get_async_pool(self.module, self.config)
+            await pool.execute(
+                "SELECT pg_notify($1, $2)",
+                self.channel,
+                json.dumps({"topic": topic, "data": data}),
+            )
+            self.published += 1
+        except Exception as e:
+            listening = False
+            self.failed += 1
+            _logger.error("Cannot notify the channel %s: %s", self.channel, e)
+        if not listening:
+            # The notification does not come back to this process
+            self._deliver(topic, data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the messages published, received and failed, and the listeners."""
+        return {
+            **super().stats(),
+            "failed": self.failed,
+            "listening": sum(
+                1
+                for future in list(self._listeners.values())
+                if future.done() and not _is_closed(future)
+            ),
+        }
+
+
+def _is_closed(future: "asyncio.Future") -> bool:
+    """Tell whether a listening connection failed to open or was closed."""
+    if future.cancelled() or future.exception() is not None:
+        return True
+    return future.result().is_closed()
@@ -1,10 +1,38 @@
 """Domain translator for converting Odoo domains to SQL WHERE clauses."""
 
-from typing import List, Tuple, Any
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, NamedTuple, Tuple, Any
+
+LIKE_OPERATORS = (
+    "like",
+    "not like",
+    "ilike",
+    "not ilike",
+    "startswith",
+    "endswith",
+    "contains",
+)
+
+
+class CompiledDomain(NamedTuple):
+    """A domain translated once for every domain of the same shape."""
+
+    sql: str
+    extract: Callable[[List[Any]], List[Any]]
 
 
 class DomainTranslator:
-    """Domain translator for converting Odoo domains to SQL WHERE clauses."""
+    """Domain translator for converting Odoo domains to SQL WHERE clauses.
+
+    Domains are compiled once per shape (structure, operators and field names,
+    values excluded) and kept in an LRU cache of ``cache_size`` entries.
+    """
+
+    cache_size = 512
+    _cache: "OrderedDict[Hashable, CompiledDomain]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    _cache_stats = {"hits": 0, "misses": 0}
 
     TERM_OPERATORS_SQL = {
         "=": "=",
@@ -36,8 +64,108 @@ class DomainTranslator:
         if not domain:
             return "1=1", []
 
-        sql_conditions, params = DomainTranslator._parse_domain(domain)
-        return f"WHERE {sql_conditions}", params
+        compiled = DomainTranslator.compile(domain)
+        return compiled.sql, compiled.extract(domain)
+
+    @classmethod
+    def compile(cls, domain: List[Any]) -> CompiledDomain:
+        """Compile a domain into a WHERE clause and a parameter extractor.
+
+        The result is shared by every domain of the same shape, e.g.
+        ``[("name", "=", "John")]`` and ``[("name", "=", "Jane")]``; the parameters
+        of a given domain are obtained with ``compiled.extract(domain)``.
+        """
+        try:
+            key = cls.shape(domain)
+            hash(key)
+        except TypeError:
+            # Unhashable field names, the domain cannot be cached
+            return cls._compile(domain)
+
+        with cls._cache_lock:
+            compiled = cls._cache.get(key)
+            if compiled is not None:
+                cls._cache.move_to_end(key)
+                cls._cache_stats["hits"] += 1
+                return compiled
+            cls._cache_stats["misses"] += 1
+
+        compiled = cls._compile(domain)
+        with cls._cache_lock:
+            cls._cache[key] = compiled
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def shape(domain: List[Any]) -> Tuple:
+        """Return the cache key of a domain: its structure without the values.
+
+        The length of ``in``/``not in`` lists is part of the shape since it sets
+        the number of placeholders.
+        """
+        shape = []
+        for term in domain:
+            if isinstance(term, str) and term in ("|", "&", "!"):
+                shape.append(term)
+            elif isinstance(term, (list, tuple)) and len(term) == 3:
+                field, operator, value = term
+                size = None
+                if operator in ("in", "not in") and isinstance(value, (list, tuple)):
+                    size = len(value)
+                shape.append((field, operator, size))
+        return tuple(shape)
+
+    @staticmethod
+    def _compile(domain: List[Any]) -> CompiledDomain:
+        """Translate a domain, keeping the SQL and dropping the parameters."""
+        sql_conditions, _ = DomainTranslator._parse_domain(domain)
+        sql = f"WHERE {sql_conditions}"
+        return CompiledDomain(
+            sql=sql,
+            extract=DomainTranslator.extract_params,
+        )
+
+    @staticmethod
+    def extract_params(domain: List[Any]) -> List[Any]:
+        """Return the parameters of a domain, in the order of its placeholders."""
+        params = []
+        for term in domain:
+            if isinstance(term, (list, tuple)) and len(term) == 3:
+                params.extend(DomainTranslator._term_params(term[1], term[2]))
+        return params
+
+    @staticmethod
+    def _term_params(operator: str, value: Any) -> List[Any]:
+        """Return the parameters of a single domain term."""
+        if operator in ("in", "not in") and isinstance(value, (list, tuple)):
+            return list(value)
+        if operator == "startswith":
+            return [f"{value}%"]
+        if operator == "endswith":
+            return [f"%{value}"]
+        if operator == "contains":
+            return [f"%{value}%"]
+        if operator in ("is null", "is not null"):
+            return []
+        return [value]
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, int]:
+        """Return the hits, misses and size of the compiled-domain cache."""
+        with cls._cache_lock:
+            return {
+                **cls._cache_stats,
+                "size": len(cls._cache),
+                "maxsize": cls.cache_size,
+            }
+
+    @classmethod
+    def cache_clear(cls):
+        """Empty the compiled-domain cache and reset its counters."""
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._cache_stats.update(hits=0, misses=0)
 
     @staticmethod
     def _parse_domain(domain: List[Any]) -> Tuple[str, List[Any]]:
@@ -97,34 +225,17 @@ class DomainTranslator:
                 if operator in ("in", "not in") and isinstance(value, (list, tuple)):
                     placeholders = ", ".join(["%s"] * len(value))
                     condition = f"{field} {sql_operator} ({placeholders})"
-                    params.extend(value)
-                elif operator in (
-                    "like",
-                    "not like",
-                    "ilike",
-                    "not ilike",
-                    "startswith",
-                    "endswith",
-                    "contains",
-                ):
-                    if operator == "startswith":
-                        value = f"{value}%"
-                    elif operator == "endswith":
-                        value = f"%{value}"
-                    elif operator == "contains":
-                        value = f"%{value}%"
+                elif operator in LIKE_OPERATORS:
                     condition = f"{field} {sql_operator} %s"
-                    params.append(value)
                 elif operator == "child_of":
                     condition = (
                         f"{field} IN (SELECT id FROM some_table WHERE parent_id = %s)"
                     )
-                    params.append(value)
                 elif operator in ("is null", "is not null"):
                     condition = f"{field} {sql_operator}"
                 else:
                     condition = f"{field} {sql_operator} %s"
-                    params.append(value)
+                params.extend(DomainTranslator._term_params(operator, value))
 
                 sql_conditions.append(condition)
 
@@ -0,0 +1,122 @@
+"""Keyset (cursor) pagination helpers for the PostgreSQL models."""
+
+import re
+import json
+import base64
+import binascii
+import functools
+from psycopg2.sql import Composed, Identifier, SQL
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+_ORDER_TERM = re.compile(r"^\s*(\w+)(?:\s+(asc|desc))?\s*$", re.IGNORECASE)
+
+
+class Page(NamedTuple):
+    """A page of records and the token continuing after its last record."""
+
+    records: List[Any]
+    next_token: Optional[str]
+
+
+@functools.lru_cache(maxsize=256)
+def parse_order(order: str) -> Tuple[Tuple[str, bool], ...]:
+    """Parse an ``__order__`` specification such as ``"name ASC, id DESC"``.
+
+    ``id`` is appended as a tie-breaker when missing, so every row has a unique
+    position in the ordering.
+
+    :param order: A comma separated list of columns, each optionally followed by ASC or DESC
+    :return: A tuple of (column, descending) pairs
+    """
+    terms = []
+    for term in (order or "id").split(","):
+        match = _ORDER_TERM.match(term)
+        if not match:
+            raise ValueError(f"Invalid order term: '{term.strip()}'")
+        terms.append((match.group(1), (match.group(2) or "").lower() == "desc"))
+    if "id" not in (column for column, _ in terms):
+        terms.append(("id", False))
+    return tuple(terms)
+
+
+def order_clause(order: Tuple[Tuple[str, bool], ...]) -> Composed:
+    """Return the ``ORDER BY`` clause of a parsed order."""
+    return SQL("ORDER BY {}").format(
+        SQL(", ").join(
+            SQL("{} DESC" if descending else "{} ASC").format(Identifier(column))
+            for column, descending in order
+        )
+    )
+
+
+def keyset_condition(order: Tuple[Tuple[str, bool], ...]) -> Composed:
+    """Return the condition selecting the rows after a position of the ordering.
+
+    When every column goes the same direction the condition is a row comparison,
+    ``(a, b) > (%s, %s)``, which PostgreSQL resolves with an index on the columns.
+    Mixed directions are expanded as ``a > %s OR (a = %s AND b < %s) ...``; the
+    parameters are given by ``keyset_params``.
+
+    The order columns must not be NULL, NULL values are skipped by the comparison.
+    """
+    columns = [Identifier(column) for column, _ in order]
+    directions = {descending for _, descending in order}
+    if len(directions) == 1:
+        return SQL("({}) {} ({})").format(
+            SQL(", ").join(columns),
+            SQL("<" if directions.pop() else ">"),
+            SQL(", ").join(SQL("%s") for _ in columns),
+        )
+
+    alternatives = []
+    for index, (_, descending) in enumerate(order):
+        terms = [SQL("{} = %s").format(column) for column in columns[:index]]
+        terms.append(SQL("{} < %s" if descending else "{} > %s").format(columns[index]))
+        alternatives.append(SQL("({})").format(SQL(" AND ").join(terms)))
+    return SQL("({})").format(SQL(" OR ").join(alternatives))
+
+
+def keyset_params(order: Tuple[Tuple[str, bool], ...], values: List[Any]) -> List[Any]:
+    """Return the parameters of ``keyset_condition`` for the given position."""
+    if len({descending for _, descending in order}) == 1:
+        return list(values)
+    params = []
+    for index in range(len(order)):
+        params.extend(values[: index + 1])
+    return params
+
+
+def encode_token(order: Tuple[Tuple[str, bool], ...], row: Dict[str, Any]) -> str:
+    """Return the opaque continuation token positioned on a row.
+
+    :param order: The parsed order of the query
+    :param row: The last row of the page, containing every order column
+    :return: A URL-safe token
+    """
+    payload = [_fingerprint(order), [row[column] for column, _ in order]]
+    data = json.dumps(payload, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_token(order: Tuple[Tuple[str, bool], ...], token: str) -> List[Any]:
+    """Return the position stored in a continuation token.
+
+    :param order: The parsed order of the query, which must be the one of the token
+    :param token: A token returned by ``encode_token``
+    :return: The values of the order columns
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        fingerprint, values = json.loads(data)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid continuation token.")
+    if fingerprint != _fingerprint(order) or len(values) != len(order):
+        raise ValueError("The continuation token does not match the order.")
+    return values
+
+
+def _fingerprint(order: Tuple[Tuple[str, bool], ...]) -> str:
+    """Return a short textual form of an order, stored in the tokens."""
+    return ",".join(
+        f"{'-' if descending else ''}{column}" for column, descending in order
+    )
@@ -0,0 +1,302 @@
+"""Thread-safe connection pools shared by the PostgreSQL models."""
+
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Tuple
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+from viixoo_core.models.prepared import PreparedStatements
+
+
+class PoolExhaustedError(PoolError):
+    """Raised when no connection can be checked out before the pool timeout."""
+
+
+class PooledConnection(extensions.connection):
+    """psycopg2 connection that keeps the bookkeeping needed by the pool."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the connection and its pool metadata."""
+        super().__init__(*args, **kwargs)
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """Thread-safe pool of PostgreSQL connections for a single DSN.
+
+    Connections are opened lazily up to ``maxconn``. Idle connections are reused
+    in LIFO order so the hot ones stay warm, the ones idle for longer than
+    ``max_idle`` seconds are closed (keeping at least ``minconn``) and the ones
+    idle for longer than ``health_check_interval`` seconds are pinged before
+    being handed out again.
+    """
+
+    def __init__(
+        self,
+        dsn: Dict[str, Any],
+        minconn: int = 1,
+        maxconn: int = 10,
+        max_idle: float = 300,
+        health_check_interval: float = 30,
+        timeout: float = 30,
+        prepared_statements: int = 0,
+    ):
+        """Initialize a ConnectionPool instance.
+
+        :param dsn: Connection parameters passed to ``psycopg2.connect``
+        :param minconn: Number of idle connections never recycled
+        :param maxconn: Maximum number of connections opened at the same time
+        :param max_idle: Seconds after which an idle connection is closed
+        :param health_check_interval: Idle seconds after which a connection is pinged on checkout
+        :param timeout: Seconds to wait for a free connection before raising PoolExhaustedError
+        :param prepared_statements: Maximum number of prepared statements per connection, 0 disables them
+        """
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError(
+                "Invalid pool size: 0 <= minconn <= maxconn and maxconn >= 1."
+            )
+        self.dsn = dsn
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self.prepared_statements = prepared_statements
+        self.closed = False
+
+        self._idle = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+        self._metrics = {
+            "created": 0,
+            "closed": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "exhausted": 0,
+            "health_check_failures": 0,
+            "recycled": 0,
+        }
+
+    def _connect(self):
+        """Open a new connection to the database."""
+        conn = psycopg2.connect(connection_factory=PooledConnection, **self.dsn)
+        if self.prepared_statements:
+            conn.prepared_statements = PreparedStatements(self.prepared_statements)
+        return conn
+
+    def _close(self, conn):
+        """Close a connection owned by the pool. Must be called with the lock held."""
+        self._size -= 1
+        self._metrics["closed"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._cond.notify()
+
+    def _recycle_idle(self, now: float):
+        """Close the connections idle for too long. Must be called with the lock held."""
+        while self._idle and self._size > self.minconn:
+            conn, released_at = self._idle[0]
+            if now - released_at < self.max_idle:
+                break
+            self._idle.popleft()
+            self._metrics["recycled"] += 1
+            self._close(conn)
+
+    def _is_healthy(self, conn, idle_for: float) -> bool:
+        """Check that a connection taken from the idle queue can be used."""
+        if conn.closed:
+            return False
+        if idle_for < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def getconn(self):
+        """Check out a connection, waiting up to ``timeout`` seconds for a free one.
+
+        :return: An open connection
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        while True:
+            with self._cond:
+                if self.closed:
+                    raise PoolError("Connection pool is closed.")
+                while True:
+                    now = time.monotonic()
+                    self._recycle_idle(now)
+                    if self._idle:
+                        conn, released_at = self._idle.pop()
+                        break
+                    if self._size < self.maxconn:
+                        self._size += 1
+                        conn, released_at = None, now
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._metrics["exhausted"] += 1
+                        raise PoolExhaustedError(
+                            f"Connection pool exhausted: {self.maxconn} connections in use."
+                        )
+                    if not waited:
+                        waited = True
+                        self._metrics["waits"] += 1
+                    self._cond.wait(remaining)
+
+            created = conn is None
+            if created:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._is_healthy(conn, now - released_at):
+                with self._cond:
+                    self._metrics["health_check_failures"] += 1
+                    self._close(conn)
+                continue
+
+            with self._cond:
+                self._metrics["created"] += created
+                self._metrics["checkouts"] += 1
+                if waited:
+                    self._metrics["wait_time"] += time.monotonic() - started
+            return conn
+
+    def putconn(self, conn, close: bool = False):
+        """Return a connection to the pool.
+
+        :param conn: A connection obtained from ``getconn``
+        :param close: Close the connection instead of keeping it idle
+        """
+        if not conn.closed and not close:
+            status = conn.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                close = True
+            elif status != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    close = True
+
+        with self._cond:
+            if close or conn.closed or self.closed:
+                self._close(conn)
+                return
+            now = time.monotonic()
+            conn.last_used = now
+            self._idle.append((conn, now))
+            self._recycle_idle(now)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of a transaction.
+
+        The transaction is committed when the block succeeds and rolled back
+        otherwise; in both cases the connection goes back to the pool.
+        """
+        conn = self.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.putconn(conn)
+
+    def closeall(self):
+        """Close every idle connection and refuse new checkouts."""
+        with self._cond:
+            self.closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._close(conn)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the pool size and usage metrics."""
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "minconn": self.minconn,
+                "maxconn": self.maxconn,
+                **self._metrics,
+            }
+
+
+_pools: Dict[Tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_pools_pid = os.getpid()
+
+
+def get_pool(module: str, config: Dict[str, Any]) -> ConnectionPool:
+    """Return the pool of the given module and DSN, creating it on first use.
+
+    :param module: The module owning the models
+    :param config: The database configuration of the module
+    :return: The connection pool
+    """
+    global _pools_pid
+
+    dsn = {
+        "dbname": config["dbname"],
+        "user": config["user"],
+        "password": config["password"],
+        "host": config["host"],
+        "port": config["port"],
+    }
+    key = (module, *dsn.values())
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            # Connections cannot be shared with a forked worker
+            _pools.clear()
+            _pools_pid = os.getpid()
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = ConnectionPool(
+                dsn,
+                minconn=int(config.get("pool_minconn", 1)),
+                maxconn=int(config.get("pool_maxconn", 10)),
+                max_idle=float(config.get("pool_max_idle", 300)),
+                health_check_interval=float(config.get("pool_health_check", 30)),
+                timeout=float(config.get("pool_timeout", 30)),
+                prepared_statements=int(config.get("prepared_statements", 0)),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def pools_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the metrics of every pool, keyed by ``module:user@host:port/dbname``."""
+    with _pools_lock:
+        pools = dict(_pools)
+    return {
+        f"{key[0]}:{key[2]}@{key[4]}:{key[5]}/{key[1]}": pool.stats()
+        for key, pool in pools.items()
+    }
+
+
+def close_all():
+    """Close every pool."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
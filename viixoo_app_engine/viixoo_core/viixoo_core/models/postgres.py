@@ -1,27 +1,274 @@
 """Base model class for all models in the application."""
 
-import psycopg2
+import io
+import copy
+import json
+import functools
 import importlib
+import itertools
+from datetime import date, time
 from psycopg2.extras import RealDictCursor
-from psycopg2.sql import Identifier, SQL, Placeholder
-from typing import Dict, Any, List
+from psycopg2.sql import Composed, Identifier, SQL, Placeholder
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Tuple
 from viixoo_core.models.base import BaseDBModel
 from viixoo_core.models.domain import DomainTranslator
+from viixoo_core.models.keyset import (
+    Page,
+    decode_token,
+    encode_token,
+    keyset_condition,
+    keyset_params,
+    order_clause,
+    parse_order,
+)
+from viixoo_core.models.pool import get_pool
+from viixoo_core.models.prepared import PreparedStatements
 from viixoo_core.config import BaseConfig
 
+# Unique suffixes for the names of the server-side cursors
+_cursor_ids = itertools.count(1)
+
+# Column types of the tables, read by bulk_update
+_column_types: Dict[str, Dict[str, str]] = {}
+
+# Trusted row factories, per model class and result columns
+_row_factories: Dict[Tuple[type, Tuple[str, ...]], Callable[[Dict], BaseDBModel]] = {}
+
+
+def _chunks(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable in lists of at most ``size`` items."""
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, size)):
+        yield chunk
+
+
+def _copy_value(value: Any) -> str:
+    """Render a value as a field of a ``COPY ... WITH (FORMAT csv)`` row.
+
+    NULL is an unquoted empty field, every other value is quoted so empty strings
+    are kept. Dictionaries and lists are sent as JSON.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (date, time)):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        value = "\\x" + bytes(value).hex()
+    else:
+        value = str(value)
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _row_factory(
+    model_class: type, columns: Tuple[str, ...]
+) -> Callable[[Dict], BaseDBModel]:
+    """Return a function building models of a class from rows with the given columns.
+
+    The models are built without validation, like ``model_construct``, with the
+    work that only depends on the columns (which fields are set, which defaults
+    to fill, which columns to drop) done once. Models using aliases, extra fields
+    or ``model_post_init`` go through ``model_construct``.
+    """
+    key = (model_class, columns)
+    factory = _row_factories.get(key)
+    if factory is not None:
+        return factory
+
+    fields = model_class.model_fields
+    if (
+        model_class.__pydantic_post_init__
+        or model_class.model_config.get("extra") == "allow"
+        or any(field.alias or field.validation_alias for field in fields.values())
+    ):
+        factory = lambda row: model_class.model_construct(**row)  # noqa: E731
+    else:
+        fields_set = frozenset(col for col in columns if col in fields)
+        dropped = len(fields_set) != len(columns)
+        constants, factories = {}, []
+        for name, field in fields.items():
+            if name in fields_set or field.is_required():
+                continue
+            if field.default_factory is not None:
+                takes_data = field.default_factory_takes_validated_data
+                factories.append((name, field.default_factory, takes_data))
+            elif isinstance(field.default, (list, dict, set)):
+                factories.append(
+                    (name, functools.partial(copy.deepcopy, field.default), False)
+                )
+            else:
+                constants[name] = field.default
+        new = model_class.__new__
+        setattr_ = object.__setattr__
+
+        def factory(row: Dict) -> BaseDBModel:
+            values = {k: row[k] for k in fields_set} if dropped else dict(row)
+            values.update(constants)
+            for name, default_factory, takes_data in factories:
+                values[name] = (
+                    default_factory(values) if takes_data else default_factory()
+                )
+            model = new(model_class)
+            setattr_(model, "__dict__", values)
+            setattr_(model, "__pydantic_fields_set__", set(fields_set))
+            setattr_(model, "__pydantic_extra__", None)
+            setattr_(model, "__pydantic_private__", None)
+            return model
+
+    _row_factories[key] = factory
+    return factory
+
+
+class PostgresQueryBuilder:
+    """SQL of the PostgreSQL models, shared by the sync and async models.
+
+    The queries are built with ``psycopg2.sql`` and use ``%s`` placeholders.
+    """
+
+    def _select_query(
+        self,
+        columns: List[str] = False,
+        domain: List[Any] = [],
+        limit: int = 0,
+        offset: int = 0,
+        order: str = None,
+        after: List[Any] = None,
+    ) -> Tuple[Composed, List[Any]]:
+        """Build the SELECT query used by query_select, iter_select and search.
+
+        LIMIT and OFFSET are passed as the last two parameters.
+
+        :return: The query and its parameters
+        """
+        where_clause, params = DomainTranslator.translate(domain)
+        where_clause = SQL(where_clause) if domain else SQL("")
+        order_by = SQL("")
+        if order:
+            parsed_order = parse_order(order)
+            order_by = order_clause(parsed_order)
+            if after is not None:
+                where_clause = SQL("{} AND {}" if domain else "WHERE {1}").format(
+                    where_clause, keyset_condition(parsed_order)
+                )
+                params = params + keyset_params(parsed_order, after)
+        elif after is not None:
+            raise ValueError("Keyset pagination requires an order.")
+
+        query = SQL(
+            "SELECT {fields} FROM {table} {where_clause} {order_by} "
+            "LIMIT {limit} OFFSET {offset}"
+        ).format(
+            fields=SQL(", ").join(map(Identifier, columns)) if columns else SQL("*"),
+            table=Identifier(self.__tablename__),
+            where_clause=where_clause,
+            order_by=order_by,
+            limit=Placeholder(),
+            offset=Placeholder(),
+        )
+        # Parameters, not literals, so one prepared statement serves every page;
+        # LIMIT NULL is LIMIT ALL
+        return query, params + [limit or None, offset]
+
+    def _insert_query(
+        self, rows: List[Dict], returning: List[str] | str = "id"
+    ) -> Tuple[Composed, List[Any]]:
+        """Build the INSERT query of query_insert, one VALUES tuple per row.
 
-db_connection = False
+        :return: The query and its parameters
+        """
+        if returning == "*":
+            returning_cols = SQL("*")
+        else:
+            if isinstance(returning, str):
+                returning = [returning]
+            returning_cols = SQL(", ").join(map(Identifier, returning))
+
+        cols = list(rows[0].keys())
+        row_values = SQL("({})").format(SQL(", ").join(Placeholder() for _ in cols))
+        query = SQL(
+            "INSERT INTO {table} ({cols}) VALUES {values} RETURNING {returning}"
+        ).format(
+            table=Identifier(self.__tablename__),
+            cols=SQL(", ").join(map(Identifier, cols)),
+            values=SQL(", ").join([row_values] * len(rows)),
+            returning=returning_cols,
+        )
+        return query, [row[col] for row in rows for col in cols]
 
+    def _update_query(
+        self, rows: List[Dict], domain: List[Any] = []
+    ) -> Tuple[Composed, List[Any]]:
+        """Build the UPDATE query of query_update.
 
-class PostgresModel(BaseDBModel):
+        :return: The query and its parameters
+        """
+        where_clause, params = DomainTranslator.translate(domain)
+        setters = list(rows[0].keys())
+        query = SQL(
+            "UPDATE {table} SET {assignment} {where_clause} RETURNING id"
+        ).format(
+            table=Identifier(self.__tablename__),
+            assignment=SQL(", ").join(
+                SQL("{} = {}").format(Identifier(s), Placeholder()) for s in setters
+            ),
+            where_clause=SQL(where_clause) if domain else SQL(""),
+        )
+        return query, [rows[0][col] for col in setters] + params
+
+    def _delete_query(self, domain: List[Any]) -> Tuple[Composed, List[Any]]:
+        """Build the DELETE query of query_delete.
+
+        :return: The query and its parameters
+        """
+        where_clause, params = DomainTranslator.translate(domain)
+        query = SQL("DELETE FROM {table} {where_clause}").format(
+            table=Identifier(self.__tablename__),
+            where_clause=SQL(where_clause),
+        )
+        return query, params
+
+    def _hydrate(
+        self,
+        rows: Iterable[Dict],
+        model_class: BaseDBModel = None,
+        trusted: bool = None,
+    ) -> Iterator[BaseDBModel]:
+        """Build models from rows read from the database.
+
+        :param rows: An iterable of dictionaries
+        :param model_class: The class of the models, the class of the model by default
+        :param trusted: Skip the validation of the rows. Defaults to the ``__trusted__``
+            attribute of the model class
+        :return: An iterator of models
+        """
+        model_class = model_class or self.__class__
+        if trusted is None:
+            trusted = model_class.__trusted__
+        if not trusted:
+            for row in rows:
+                yield model_class(**row)
+            return
+
+        factory, columns = None, None
+        for row in rows:
+            if factory is None or row.keys() != columns:
+                columns = row.keys()
+                factory = _row_factory(model_class, tuple(columns))
+            yield factory(row)
+
+
+class PostgresModel(PostgresQueryBuilder, BaseDBModel):
     """PostgreSQL Base model."""
 
     def get_connection(self):
-        """Get database connexion."""
-        global db_connection
+        """Get a database connection from the pool of the model's module.
 
-        if db_connection and not db_connection.closed:
-            return db_connection
+        Use it as a context manager: the connection is checked out from the pool,
+        the block runs in a transaction and the connection goes back to the pool on exit.
+        """
         # Get the package name where the model is defined
         package_name = self.__class__.__module__.split(".")
 
@@ -33,18 +280,14 @@ class PostgresModel(BaseDBModel):
         # Load the configuration for the package
         config = BaseConfig.get_config(base_path=basepath, module=package_name[1])
 
-        # Establish the database connection using the configuration
-        connection = psycopg2.connect(
-            dbname=config["dbname"],
-            user=config["user"],
-            password=config["password"],
-            host=config["host"],
-            port=config["port"],
-        )
-        return connection
+        # Check out a connection from the pool of the package
+        return get_pool(package_name[1], config).connection()
 
     def load_model(
-        self, model_class: BaseDBModel = None, domain: List[Any] = []
+        self,
+        model_class: BaseDBModel = None,
+        domain: List[Any] = [],
+        trusted: bool = None,
     ) -> List[BaseDBModel]:
         """Load a model from the database.
 
@@ -54,13 +297,28 @@ class PostgresModel(BaseDBModel):
 
         :param model_class: The class of the model to load
         :param domain: A list of tuples, each containing a field name, an operator and a value
+        :param trusted: Build the models without validating the rows (see ``__trusted__``)
         :return: A list of models loaded from the database
         """
         if not model_class:
             model_class = self.__class__
 
-        query_results = self.query_select(domain)
-        return [model_class(**query_result) for query_result in query_results]
+        query_results = self.query_select(domain=domain)
+        return list(self._hydrate(query_results, model_class, trusted))
+
+    @staticmethod
+    def _execute(cur, query: Composed, params: List[Any]):
+        """Execute a query, through a prepared statement when the pool enables them.
+
+        :param cur: The cursor executing the query
+        :param query: The query
+        :param params: The parameters of the query
+        """
+        prepared = getattr(cur.connection, "prepared_statements", None)
+        if isinstance(prepared, PreparedStatements):
+            prepared.execute(cur, query, params)
+        else:
+            cur.execute(query, params)
 
     def query_select(
         self,
@@ -68,6 +326,8 @@ class PostgresModel(BaseDBModel):
         domain: List[Any] = [],
         limit: int = 0,
         offset: int = 0,
+        order: str = None,
+        after: List[Any] = None,
     ) -> List[Dict]:
         """Select the given columns from the table. Filter by domain. If no domain is given, return all rows.
 
@@ -76,48 +336,142 @@ class PostgresModel(BaseDBModel):
             [('name', '=', 'John'), ('age', '>', 30)]
         :param limit: The maximum number of rows to return
         :param offset: The number of rows to skip before returning rows
+        :param order: The ORDER BY specification, e.g. ``"name ASC, id DESC"``
+        :param after: The values of the order columns of a row; only the rows after it are returned
         :return: A list of dictionaries, each representing a row in the table
         """
-        where_clause, params = DomainTranslator.translate(domain)
-        query = SQL(
-            "SELECT {fields} FROM {table} {where_clause} LIMIT {limit} OFFSET {offset}"
-        ).format(
-            fields=SQL(", ").join(map(Identifier, columns)) if columns else SQL("*"),
-            table=Identifier(self.__tablename__),
-            where_clause=SQL(where_clause) if where_clause else SQL(" 1=1 "),
-            limit=SQL(limit) if limit != 0 else SQL("ALL"),
-            offset=SQL(offset) if offset != 0 else SQL("0"),
-        )
+        query, params = self._select_query(columns, domain, limit, offset, order, after)
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, params)
+                self._execute(cur, query, params)
                 return cur.fetchall()
 
-    def query_insert(self, rows: List[Dict] = []) -> List[Dict]:
+    def iter_select(
+        self,
+        columns: List[str] = False,
+        domain: List[Any] = [],
+        limit: int = 0,
+        offset: int = 0,
+        order: str = None,
+        after: List[Any] = None,
+        itersize: int = 2000,
+    ) -> Iterator[Dict]:
+        """Select the given columns from the table, yielding the rows lazily.
+
+        The rows are read through a server-side cursor, ``itersize`` rows per
+        round-trip, so large tables are scanned without loading them in memory.
+        The pooled connection stays checked out until the generator is exhausted
+        or closed; closing it early rolls back the transaction and releases the
+        cursor and the connection.
+
+        :param columns: A list of column names to select
+        :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
+            [('name', '=', 'John'), ('age', '>', 30)]
+        :param limit: The maximum number of rows to return
+        :param offset: The number of rows to skip before returning rows
+        :param order: The ORDER BY specification, e.g. ``"name ASC, id DESC"``
+        :param after: The values of the order columns of a row; only the rows after it are returned
+        :param itersize: The number of rows fetched from the server at once
+        :return: An iterator of dictionaries, each representing a row in the table
+        """
+        query, params = self._select_query(columns, domain, limit, offset, order, after)
+        cursor_name = f"{self.__tablename__}_stream_{next(_cursor_ids)}"
+        with self.get_connection() as conn:
+            with conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cur:
+                cur.itersize = itersize
+                cur.execute(query, params)
+                yield from cur
+
+    def query_insert(
+        self, rows: List[Dict] = [], returning: List[str] | str = "id"
+    ) -> List[Dict]:
         """Insert the given rows into the table.
 
         :param rows: A list of dictionaries
-        :return: A list of ids of the rows inserted
+        :param returning: The columns returned for every row inserted, ``"*"`` for all of them
+        :return: A list of dictionaries with the returned columns of the rows inserted, in the order of the rows
         """
         if not rows:
             rows = [self.model_dump()]
 
-        cols = list(rows[0].keys())
-        query = SQL("INSERT INTO {table} ({cols}) VALUES %s RETURNING id").format(
-            table=Identifier(self.__tablename__),
-            cols=SQL(", ").join(map(Identifier, cols)),
-        )
-
-        values = [[row[col] for col in cols] for row in rows]
+        query, values = self._insert_query(rows, returning)
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, values)
+                self._execute(cur, query, values)
                 return cur.fetchall()
 
+    def bulk_insert(
+        self,
+        rows: Iterable[Dict | BaseDBModel],
+        columns: List[str] = None,
+        chunk_size: int = 10000,
+        returning: bool = False,
+    ) -> int | List[int]:
+        """Load the given rows into the table with ``COPY ... FROM STDIN``.
+
+        The rows are consumed lazily and sent in CSV chunks of ``chunk_size`` rows,
+        all of them in a single transaction. When ``returning`` is set, every chunk
+        is copied into a temporary staging table and moved to the table with
+        ``INSERT ... SELECT ... RETURNING id``, so the generated ids come back in
+        the order of the rows.
+
+        :param rows: An iterable of dictionaries or models
+        :param columns: The columns to load. By default the keys of the first row,
+            without ``id`` when the first row has no id so the sequence fills it
+        :param chunk_size: The number of rows sent per COPY
+        :param returning: Return the ids of the rows inserted
+        :return: The ids of the rows inserted if ``returning`` is set, the number of rows inserted otherwise
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return [] if returning else 0
+        first = first.model_dump() if isinstance(first, BaseDBModel) else first
+        if not columns:
+            columns = [col for col in first if col != "id" or first["id"] is not None]
+
+        table = Identifier(self.__tablename__)
+        cols = SQL(", ").join(map(Identifier, columns))
+        staging = Identifier(f"_bulk_{self.__tablename__}")
+        copy_query = SQL("COPY {table} ({cols}) FROM STDIN WITH (FORMAT csv)").format(
+            table=staging if returning else table, cols=cols
+        )
+
+        inserted_ids, count = [], 0
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                if returning:
+                    cur.execute(
+                        SQL(
+                            "CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                            "SELECT {cols} FROM {table} WITH NO DATA"
+                        ).format(staging=staging, cols=cols, table=table)
+                    )
+                for chunk in _chunks(itertools.chain([first], rows), chunk_size):
+                    buffer = io.StringIO()
+                    for row in chunk:
+                        if isinstance(row, BaseDBModel):
+                            row = row.model_dump()
+                        buffer.write(",".join(_copy_value(row[col]) for col in columns))
+                        buffer.write("\n")
+                    buffer.seek(0)
+                    cur.copy_expert(copy_query, buffer)
+                    count += len(chunk)
+                    if returning:
+                        cur.execute(
+                            SQL(
+                                "INSERT INTO {table} ({cols}) SELECT {cols} FROM {staging} "
+                                "ORDER BY ctid RETURNING id"
+                            ).format(table=table, cols=cols, staging=staging)
+                        )
+                        inserted_ids.extend(row[0] for row in cur.fetchall())
+                        cur.execute(SQL("TRUNCATE {staging}").format(staging=staging))
+        return inserted_ids if returning else count
+
     def query_update(self, rows: List[Dict] = [], domain: List[Any] = []) -> List[Dict]:
         """Update the given rows in the table. Filter by domain. If no domain is given, update all rows.
 
-        :param rows: A list of dictionaries
+        :param rows: A list of dictionaries. The values of the first one are set on the rows matching the domain
         :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
             [('name', '=', 'John'), ('age', '>', 30)]
         :return: A list of ids of the rows updated
@@ -125,27 +479,104 @@ class PostgresModel(BaseDBModel):
         if not rows:
             rows = [self.model_dump()]
 
-        params = []
-        where_clause = ""
+        query, params = self._update_query(rows, domain)
+        with self.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                self._execute(cur, query, params)
+                return cur.fetchall()
 
-        if domain:
-            where_clause, params = DomainTranslator.translate(domain)
+    def bulk_update(
+        self,
+        rows: Iterable[Dict | BaseDBModel],
+        key: str = "id",
+        chunk_size: int = 1000,
+    ) -> List[int]:
+        """Update many rows with different values in one statement per chunk.
+
+        Every chunk is sent as
+        ``UPDATE t SET ... FROM (VALUES ...) v WHERE t.<key> = v.<key>``. The values
+        are cast to the types of the table columns, read once per table from
+        ``pg_attribute``, so the VALUES list does not fall back to text. The casts
+        omit the type modifiers: an explicit cast to ``varchar(n)`` would silently
+        truncate a longer string, while the assignment rejects it.
+
+        :param rows: An iterable of dictionaries or models. The columns of the first
+            row are updated on every row and must include ``key``
+        :param key: The column matching the rows with the table
+        :param chunk_size: The maximum number of rows sent per statement
+        :return: A list of ids of the rows updated
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return []
+        first = first.model_dump() if isinstance(first, BaseDBModel) else first
+        columns = list(first)
+        if key not in columns:
+            raise ValueError(f"Every row must contain the key column '{key}'.")
+        setters = [col for col in columns if col != key]
+        if not setters:
+            raise ValueError("There are no columns to update.")
 
-        setters = set(rows[0].keys())
         query = SQL(
-            "UPDATE {table} SET {assignment} {where_clause} RETURNING id"
-        ).format(
-            table=Identifier(self.__tablename__),
-            assignment=SQL(", ").join(
-                SQL("{} = {}").format(Identifier(s), Placeholder(s)) for s in setters
-            ),
-            where_clause=SQL(where_clause) if domain else SQL(" 1=1 "),
+            "UPDATE {table} AS t SET {assignment} FROM (VALUES {values}) "
+            "AS v ({cols}) WHERE t.{key} = v.{key} RETURNING t.id"
         )
-        values = [[row[col] for col in setters] for row in rows]
+        updated_ids = []
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, values + params)
-                return cur.fetchall()
+            with conn.cursor() as cur:
+                types = self._column_types(cur)
+                missing = [col for col in columns if col not in types]
+                if missing:
+                    raise ValueError(
+                        f"Unknown columns for table {self.__tablename__}: {missing}"
+                    )
+                row_template = SQL("({})").format(
+                    SQL(", ").join(
+                        SQL("{}::{}").format(Placeholder(), SQL(types[col]))
+                        for col in columns
+                    )
+                )
+                for chunk in _chunks(itertools.chain([first], rows), chunk_size):
+                    params = []
+                    for row in chunk:
+                        if isinstance(row, BaseDBModel):
+                            row = row.model_dump()
+                        params.extend(row[col] for col in columns)
+                    cur.execute(
+                        query.format(
+                            table=Identifier(self.__tablename__),
+                            assignment=SQL(", ").join(
+                                SQL("{} = v.{}").format(Identifier(s), Identifier(s))
+                                for s in setters
+                            ),
+                            values=SQL(", ").join([row_template] * len(chunk)),
+                            cols=SQL(", ").join(map(Identifier, columns)),
+                            key=Identifier(key),
+                        ),
+                        params,
+                    )
+                    updated_ids.extend(row[0] for row in cur.fetchall())
+        return updated_ids
+
+    def _column_types(self, cur) -> Dict[str, str]:
+        """Return the SQL base type of every column of the table, cached per table.
+
+        The types are without modifier, e.g. ``character varying`` for a
+        ``varchar(255)`` column.
+
+        :param cur: A cursor of the connection used to read the catalog
+        :return: A dictionary of column names and types
+        """
+        types = _column_types.get(self.__tablename__)
+        if types is None:
+            cur.execute(
+                "SELECT attname, format_type(atttypid, NULL) FROM pg_attribute "
+                "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+                [self.__tablename__],
+            )
+            types = _column_types[self.__tablename__] = dict(cur.fetchall())
+        return types
 
     def query_delete(self, domain: List[Any]) -> bool:
         """Delete the given rows from the table.
@@ -159,14 +590,10 @@ class PostgresModel(BaseDBModel):
         if not domain:
             raise ValueError("Domain is required to delete rows.")
 
-        where_clause, params = DomainTranslator.translate(domain)
-        query = SQL("DELETE FROM {table} {where_clause}").format(
-            table=Identifier(self.__tablename__),
-            where_clause=SQL(where_clause),
-        )
+        query, params = self._delete_query(domain)
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, params)
+                self._execute(cur, query, params)
                 return True
 
     def write(self, rows: List[Dict] = [], domain: List[Any] = []) -> List[int]:
@@ -187,45 +614,128 @@ class PostgresModel(BaseDBModel):
 
         return self.query_update(rows, domain)
 
-    def create(self, rows: List[Dict] = []) -> BaseDBModel:
+    def create(self, rows: List[Dict] = []) -> List[BaseDBModel]:
         """
         Create the given rows to the table. Return a list of models created.
 
-        :param rows: A list of dictionaries
-        :return: A list of models created
+        The rows are inserted in a single ``INSERT ... RETURNING *`` statement and
+        the models are built from the returned rows, with the values filled in by
+        the database (ids, defaults, triggers), without reading them again.
+
+        :param rows: A list of dictionaries. A null ``id`` is left to the sequence
+        :return: A list of models created, in the order of the rows
         """
         if not rows:
             rows = [self.model_dump()]
 
-        ids = self.query_insert(rows)
-        domain = [("id", "=", id_["id"]) for id_ in ids]
-        return self.load_model(self.__class__, domain)[0]
+        if all(row.get("id", 0) is None for row in rows):
+            rows = [{k: v for k, v in row.items() if k != "id"} for row in rows]
+
+        created = self.query_insert(rows, returning="*")
+        return [self.__class__(**row) for row in created]
 
     def search(
-        self, domain: List[Any] = [], limit: int = 0, offset: int = 0
-    ) -> List[Dict[str, Any]]:
+        self,
+        domain: List[Any] = [],
+        limit: int = 0,
+        offset: int = 0,
+        stream: bool = False,
+        itersize: int = 2000,
+        paginate: bool = False,
+        token: str = None,
+    ) -> List[Dict[str, Any]] | Iterator[Dict[str, Any]] | Page:
         """
         Read the given rows from the table. Filter by domain. If no domain is given, return all rows.
 
+        The rows are sorted by ``__order__``. With ``paginate``, the rows are paged
+        by keyset instead of offset: a page of ``limit`` rows is returned with the
+        token continuing after its last row, and passing that token back reads the
+        next page with an index seek, whatever its depth.
+
         :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
             [('name', '=', 'John'), ('age', '>', 30)]
         :param limit: The maximum number of rows to return
         :param offset: The number of rows to skip
-        :return: A list of dictionaries
+        :param stream: Yield the rows lazily through a server-side cursor (see ``iter_select``)
+        :param itersize: The number of rows fetched from the server at once when streaming
+        :param paginate: Return a ``Page`` of rows and the token of the next page
+        :param token: The continuation token of the previous page, implies ``paginate``
+        :return: A list of dictionaries, an iterator of dictionaries when streaming,
+            or a Page of dictionaries when paginating
         """
-        query_results = self.query_select(domain, limit=limit, offset=offset)
+        if paginate or token:
+            return self._search_page(domain, limit, token)
+        if stream:
+            return self.iter_select(
+                domain=domain,
+                limit=limit,
+                offset=offset,
+                order=self.__order__,
+                itersize=itersize,
+            )
+        query_results = self.query_select(
+            domain=domain, limit=limit, offset=offset, order=self.__order__
+        )
         return query_results
 
-    def search_load(self, domain: List[Any] = []) -> List[BaseDBModel]:
+    def search_load(
+        self,
+        domain: List[Any] = [],
+        stream: bool = False,
+        itersize: int = 2000,
+        limit: int = 0,
+        paginate: bool = False,
+        token: str = None,
+        trusted: bool = None,
+    ) -> List[BaseDBModel] | Iterator[BaseDBModel] | Page:
         """
         Read the given rows from the table. Filter by domain. If no domain is given, return all rows.
 
+        The models are sorted by ``__order__`` and can be paged by keyset, see ``search``.
+
         :param domain: A list of tuples, each containing a field name, an operator and a value. For example::
             [('name', '=', 'John'), ('age', '>', 30)]
-        :return: A list of models
+        :param stream: Yield the models lazily through a server-side cursor (see ``iter_select``)
+        :param itersize: The number of rows fetched from the server at once when streaming
+        :param limit: The maximum number of models to return
+        :param paginate: Return a ``Page`` of models and the token of the next page
+        :param token: The continuation token of the previous page, implies ``paginate``
+        :param trusted: Build the models without validating the rows (see ``__trusted__``)
+        :return: A list of models, an iterator of models when streaming, or a Page of
+            models when paginating
         """
-        query_results = self.query_select(domain)
-        return [self.__class__(**query_result) for query_result in query_results]
+        if paginate or token:
+            page = self._search_page(domain, limit, token)
+            return Page(
+                list(self._hydrate(page.records, trusted=trusted)), page.next_token
+            )
+        if stream:
+            query_results = self.iter_select(
+                domain=domain, limit=limit, order=self.__order__, itersize=itersize
+            )
+            return self._hydrate(query_results, trusted=trusted)
+        query_results = self.query_select(
+            domain=domain, limit=limit, order=self.__order__
+        )
+        return list(self._hydrate(query_results, trusted=trusted))
+
+    def _search_page(self, domain: List[Any], limit: int, token: str = None) -> Page:
+        """Read a page of rows after the position of a continuation token.
+
+        :param domain: A list of tuples, each containing a field name, an operator and a value
+        :param limit: The size of the page
+        :param token: The continuation token of the previous page, None for the first page
+        :return: The rows and the token of the next page, None after the last page
+        """
+        if limit <= 0:
+            raise ValueError("Keyset pagination requires a positive limit.")
+        order = parse_order(self.__order__)
+        after = decode_token(order, token) if token else None
+        rows = self.query_select(
+            domain=domain, limit=limit, order=self.__order__, after=after
+        )
+        next_token = encode_token(order, rows[-1]) if len(rows) == limit else None
+        return Page(rows, next_token)
 
     def delete(self, domain: List[Any]) -> bool:
         """Delete the given rows from the table. Filter by domain. If no domain is given, raise a ValueError.
@@ -0,0 +1,142 @@
+"""Server-side prepared statements for the pooled PostgreSQL connections."""
+
+import re
+import time
+import threading
+from collections import OrderedDict
+from psycopg2.sql import Composable
+from typing import Any, Dict, List, Optional, Tuple
+
+_PLACEHOLDER = re.compile(r"%%|%s|%\(")
+
+_stats_lock = threading.Lock()
+_stats = {
+    "prepares": 0,
+    "executions": 0,
+    "hits": 0,
+    "deallocations": 0,
+    "fallbacks": 0,
+    "prepare_time": 0.0,
+}
+
+
+def to_dollar_params(query: str) -> Optional[Tuple[str, int]]:
+    """Rewrite the ``%s`` placeholders of a query as ``$1, $2, ...``.
+
+    :param query: A query using psycopg2 positional placeholders
+    :return: The rewritten query and its number of parameters, None if the query
+        uses named placeholders
+    """
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        if match.group() == "%%":
+            return "%"
+        if match.group() == "%(":
+            raise ValueError("Named placeholders are not supported.")
+        count += 1
+        return f"${count}"
+
+    try:
+        return _PLACEHOLDER.sub(replace, query), count
+    except ValueError:
+        return None
+
+
+class PreparedStatements:
+    """LRU cache of the statements prepared on one connection.
+
+    Statements are keyed by their SQL text. Once ``max_size`` statements are
+    prepared, the least recently used one is deallocated.
+    """
+
+    def __init__(self, max_size: int = 100):
+        """Initialize a PreparedStatements instance.
+
+        :param max_size: The maximum number of statements prepared on the connection
+        """
+        self.max_size = max_size
+        self.statements: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._names = 0
+
+    def execute(self, cur, query: str | Composable, params: List[Any] = None):
+        """Execute a query through a prepared statement, preparing it on first use.
+
+        Queries with named placeholders or tuple parameters (rendered by psycopg2
+        as row literals) are executed directly.
+
+        :param cur: A cursor of the connection owning the statements
+        :param query: The query, with ``%s`` placeholders
+        :param params: The parameters of the query
+        """
+        params = list(params or [])
+        if any(isinstance(param, tuple) for param in params):
+            _count("fallbacks")
+            return cur.execute(query, params)
+        sql_text = query.as_string(cur) if isinstance(query, Composable) else query
+        statement = self.statements.get(sql_text)
+        if statement is None:
+            rewritten = to_dollar_params(sql_text)
+            if rewritten is None:
+                _count("fallbacks")
+                return cur.execute(query, params)
+            statement = self._prepare(cur, sql_text, *rewritten)
+        else:
+            self.statements.move_to_end(sql_text)
+            _count("hits")
+
+        name, count = statement
+        if count != len(params):
+            raise ValueError(
+                f"The query expects {count} parameters, {len(params)} given."
+            )
+        _count("executions")
+        if count:
+            placeholders = ", ".join(["%s"] * count)
+            return cur.execute(f"EXECUTE {name} ({placeholders})", params)
+        return cur.execute(f"EXECUTE {name}")
+
+    def _prepare(self, cur, sql_text: str, query: str, count: int) -> Tuple[str, int]:
+        """Prepare a statement and deallocate the least recently used ones."""
+        self._names += 1
+        name = f"viixoo_stmt_{self._names}"
+        start = time.perf_counter()
+        cur.execute(f"PREPARE {name} AS {query}")
+        _count("prepares", prepare_time=time.perf_counter() - start)
+
+        self.statements[sql_text] = (name, count)
+        while len(self.statements) > self.max_size:
+            _, (old_name, _) = self.statements.popitem(last=False)
+            cur.execute(f"DEALLOCATE {old_name}")
+            _count("deallocations")
+        return name, count
+
+
+def _count(metric: str, prepare_time: float = 0.0):
+    """Increment a prepared-statement metric."""
+    with _stats_lock:
+        _stats[metric] += 1
+        _stats["prepare_time"] += prepare_time
+
+
+def prepared_stats() -> Dict[str, Any]:
+    """Return the prepared-statement metrics of the process.
+
+    ``saved_prepare_time`` estimates the parse and analysis time avoided by the
+    hits, using the average time taken by a PREPARE. It does not include planning:
+    a prepared statement is still planned on EXECUTE, with a custom or generic plan.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    average = stats["prepare_time"] / stats["prepares"] if stats["prepares"] else 0.0
+    stats["saved_prepare_time"] = stats["hits"] * average
+    return stats
+
+
+def reset_prepared_stats():
+    """Reset the prepared-statement metrics."""
+    with _stats_lock:
+        for metric in _stats:
+            _stats[metric] = 0
+        _stats["prepare_time"] = 0.0
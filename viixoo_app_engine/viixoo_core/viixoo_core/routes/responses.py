@@ -0,0 +1,79 @@
+"""Fast JSON parsing and responses, using orjson when it is installed."""
+
+import json
+from typing import Any
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(content: bytes | str) -> Any:
+    """Parse a JSON document, decoding it directly from bytes.
+
+    :param content: The JSON document, e.g. the body of a response
+    :return: The parsed document
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize a document to JSON bytes.
+
+    Pydantic models are serialized by pydantic-core, other documents with orjson
+    when it is installed.
+
+    :param content: The document
+    :return: The JSON bytes
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized without ``jsonable_encoder``.
+
+    Return it from a route with a pydantic model as content: the model is written
+    straight to JSON bytes instead of being converted to a dictionary first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render the content as JSON bytes."""
+        return dumps(content)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header matches an ETag.
+
+    :param if_none_match: The value of the header, a list of ETags or ``*``
+    :param etag: The quoted ETag of the current representation
+    :return: True if the client already has it
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def etag_response(etag: str, body: bytes, if_none_match: str | None = None) -> Response:
+    """Return a JSON response with its ETag, or a 304 if the client already has it.
+
+    :param etag: The quoted ETag of the body
+    :param body: The JSON body
+    :param if_none_match: The value of the ``If-None-Match`` header of the request
+    :return: The response
+    """
+    headers = {"ETag": etag}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,25 @@
+import { useEffect } from "react";
+import { useQueryClient } from "@tanstack/react-query";
+
+import { OpenAPI } from "@/client";
+
+// Refresh the work orders when another operator changes one of them
+export function useWorkOrderEvents() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const token = localStorage.getItem("access_token");
+    if (!token) return;
+
+    // EventSource can not send headers, the token goes in the query string
+    const source = new EventSource(
+      `${OpenAPI.BASE}/work-orders/events?access_token=${encodeURIComponent(token)}`
+    );
+    source.addEventListener("workorder", () => {
+      queryClient.invalidateQueries({ queryKey: ["workorders"] });
+      queryClient.invalidateQueries({ queryKey: ["productionorders"] });
+    });
+
+    return () => source.close();
+  }, [queryClient]);
+}
@@ -37,6 +37,7 @@ import {
   PaginationRoot,
 } from "@/components/ui/pagination.tsx";
 import { useElapsedTime } from "../../hooks/elapsedTime";
+import { useWorkOrderEvents } from "../../hooks/workOrderEvents";
 import type { WorkOrderPublic } from "../../client/types.gen";
 import { useState } from "react";
 
@@ -432,6 +433,7 @@ function WorkOrdensTable({
 }
 
 function WorkOrders() {
+  useWorkOrderEvents();
   const [searchQuery, setSearchQuery] = useState("");
   const [triggerSearch, setTriggerSearch] = useState("");
   const [showAllStates, setShowAllStates] = useState(false);